@@ -10,3 +10,12 @@ class ApiConfig(AppConfig):
     """
 
     name = "integreat_cms.api"
+
+    def ready(self):
+        """
+        Register the signal handlers which invalidate the API response cache (see :mod:`~integreat_cms.api.signals`).
+
+        See :meth:`django.apps.AppConfig.ready` for more information.
+        """
+        # pylint: disable=import-outside-toplevel,unused-import
+        from . import signals
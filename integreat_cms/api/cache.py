@@ -0,0 +1,182 @@
+"""
+This module contains helpers for caching the responses of the content API endpoints.
+
+Each cached response is stored in the default cache (see :attr:`~integreat_cms.core.settings.CACHES`) under a key which
+contains the region, the language, the endpoint and the current content version of the region. Whenever content of a
+region is changed, the content version is increased (see :mod:`~integreat_cms.api.signals`), which implicitly
+invalidates all cached responses of this region.
+The time of the last increase is stored next to the version, so it can be used as last modification date of the
+responses even if the change (e.g. archiving, moving or deleting content) is not reflected in any modification date
+of the database (see :func:`~integreat_cms.api.decorators.get_freshness`).
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+#: The cache key of the hit counter
+HITS_KEY = "api-cache-hits"
+#: The cache key of the miss counter
+MISSES_KEY = "api-cache-misses"
+#: The pseudo region slug which is used for the responses of endpoints which contain all regions
+#: (``*`` is not allowed in slugs, so it cannot collide with an actual region)
+REGION_LIST = "*"
+
+
+def get_version_key(region_slug):
+    """
+    Get the cache key of the content version of a region
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"api-content-version-{region_slug}"
+
+
+def get_modified_key(region_slug):
+    """
+    Get the cache key of the time when the content version of a region was last increased
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"api-content-modified-{region_slug}"
+
+
+def get_content_version(region_slug):
+    """
+    Get the current content version of a region.
+    If the region has no version yet (e.g. because the cache was cleared), it is initialized with the current timestamp
+    to make sure the new version does not collide with any version which was used before.
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+
+    :return: The current content version of the region
+    :rtype: int
+    """
+    version_key = get_version_key(region_slug)
+    version = cache.get(version_key)
+    if version is None:
+        version = time.time_ns()
+        cache.set(version_key, version, None)
+        # The time of the last change is unknown, so it has to be assumed that the content changed just now
+        cache.set(get_modified_key(region_slug), timezone.now(), None)
+    return version
+
+
+def get_content_modified(region_slug):
+    """
+    Get the time when the content version of a region was last increased
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+
+    :return: The time of the last change of the content version
+    :rtype: ~datetime.datetime
+    """
+    modified = cache.get(get_modified_key(region_slug))
+    if modified is None:
+        # The time was evicted from the cache, so it has to be assumed that the content changed just now
+        modified = timezone.now()
+        cache.set(get_modified_key(region_slug), modified, None)
+    return modified
+
+
+def bump_content_version(region_slug):
+    """
+    Increase the content version of a region and thereby invalidate all cached API responses of this region.
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+    """
+    version_key = get_version_key(region_slug)
+    cache.set(get_modified_key(region_slug), timezone.now(), None)
+    try:
+        version = cache.incr(version_key)
+    except ValueError:
+        # The version does not exist yet, so the next lookup initializes a new one
+        version = get_content_version(region_slug)
+    logger.debug("Bumped API content version of region %r to %r", region_slug, version)
+
+
+def get_response_key(endpoint, region_slug, language_slug):
+    """
+    Get the cache key of an API response.
+    The key also contains the current date, because responses like the events endpoint depend on it.
+
+    :param endpoint: The name of the endpoint
+    :type endpoint: str
+
+    :param region_slug: The slug of the region
+    :type region_slug: str
+
+    :param language_slug: The slug of the language (:obj:`None` for endpoints which do not depend on a language)
+    :type language_slug: str
+
+    :return: The cache key
+    :rtype: str
+    """
+    version = get_content_version(region_slug)
+    return f"api-response-{region_slug}-{language_slug}-{endpoint}-{version}-{timezone.now().date()}"
+
+
+def get_cached_response(key):
+    """
+    Get a cached response and update the hit and miss counters
+
+    :param key: The cache key of the response
+    :type key: str
+
+    :return: A tuple of the content type and the content of the response or :obj:`None` if the response is not cached
+    :rtype: tuple
+    """
+    cached_response = cache.get(key)
+    counter_key = MISSES_KEY if cached_response is None else HITS_KEY
+    # Make sure the counter exists before incrementing it
+    cache.add(counter_key, 0, None)
+    try:
+        cache.incr(counter_key)
+    except ValueError:
+        # The counter was evicted in the meantime
+        pass
+    return cached_response
+
+
+def set_cached_response(key, content_type, content):
+    """
+    Store the content of a response in the cache
+
+    :param key: The cache key of the response
+    :type key: str
+
+    :param content_type: The content type of the response
+    :type content_type: str
+
+    :param content: The serialized content of the response
+    :type content: bytes
+    """
+    cache.set(key, (content_type, content), settings.API_CACHE_TIMEOUT)
+
+
+def get_cache_statistics():
+    """
+    Get the hit and miss counters of the API response cache
+
+    :return: A dict with the number of ``hits`` and ``misses``
+    :rtype: dict
+    """
+    return {
+        "hits": cache.get(HITS_KEY, 0),
+        "misses": cache.get(MISSES_KEY, 0),
+    }
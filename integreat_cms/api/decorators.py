@@ -1,12 +1,28 @@
+import hashlib
 import json
 
+from datetime import datetime, time
 from functools import wraps
 
-from django.http import JsonResponse, Http404
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse, JsonResponse, Http404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.views.decorators.csrf import csrf_exempt
 
 from ..cms.models import Region, Language
 from ..cms.constants import feedback_ratings
+from .cache import (
+    REGION_LIST,
+    get_cached_response,
+    get_content_modified,
+    get_content_version,
+    get_response_key,
+    set_cached_response,
+)
 
 
 def feedback_handler(func):
@@ -77,17 +93,121 @@ def feedback_handler(func):
     return handle_feedback
 
 
-def json_response(function):
+def get_freshness(request, endpoint, freshness, daily):
+    """
+    Compute the ETag and the last modification date of an API response without rendering it.
+    The values are derived from the newest modification date and the number of the objects returned by ``freshness``
+    and from the content version of the region (see :func:`~integreat_cms.api.cache.get_content_version`), which also
+    changes when e.g. pages are archived, moved or deleted. The last modification date additionally takes the time of the
+    last change of the content version into account (see :func:`~integreat_cms.api.cache.get_content_modified`), so
+    it never stays the same or moves backwards when the content changes.
+    The result is cached until the content version of the region changes, so repeated conditional requests do not
+    require any database queries.
+
+    :param request: Django request
+    :type request: ~django.http.HttpRequest
+
+    :param endpoint: The name of the endpoint which is used in the cache key
+    :type endpoint: str
+
+    :param freshness: A function which returns the queryset of objects (e.g. translations) the response is derived
+                      from. For endpoints which are not specific to a region, it is called with :obj:`None` as region.
+    :type freshness: ~collections.abc.Callable
+
+    :param daily: Whether the response changes every day (e.g. because it contains recurring events)
+    :type daily: bool
+
+    :raises ~django.http.Http404: When no region with the given slug exists
+
+    :return: A tuple of the ETag and the last modification date
+    :rtype: tuple
+    """
+    region_slug = request.resolver_match.kwargs.get("region_slug", REGION_LIST)
+    language_slug = request.resolver_match.kwargs.get("language_slug")
+    key = get_response_key(f"{endpoint}-freshness", region_slug, language_slug)
+    cached_freshness = cache.get(key)
+    if cached_freshness is not None:
+        return cached_freshness
+    region = None
+    if region_slug != REGION_LIST:
+        region = Region.get_current_region(request)
+        if not region:
+            raise Http404("No region found.")
+    aggregation = freshness(region, language_slug).aggregate(
+        last_updated=Max("last_updated"), count=Count("id", distinct=True)
+    )
+    last_modified = max(
+        filter(
+            None,
+            [
+                aggregation["last_updated"],
+                region.last_updated if region else None,
+                get_content_modified(region_slug),
+            ],
+        ),
+        # Fallback for empty lists
+        default=datetime.fromtimestamp(0, timezone.utc),
+    )
+    today = timezone.now().date()
+    if daily:
+        last_modified = max(
+            last_modified,
+            timezone.make_aware(datetime.combine(today, time.min)),
+        )
+    etag_source = "-".join(
+        map(
+            str,
+            [
+                region_slug,
+                language_slug,
+                aggregation["count"],
+                last_modified.isoformat(),
+                get_content_version(region_slug),
+                today if daily else "",
+            ],
+        )
+    )
+    etag = hashlib.sha256(etag_source.encode("utf-8")).hexdigest()
+    cached_freshness = (etag, int(last_modified.timestamp()))
+    cache.set(key, cached_freshness, settings.API_CACHE_TIMEOUT)
+    return cached_freshness
+
+
+def json_response(function=None, freshness=None, daily=False):
     """
     This decorator can be used to catch :class:`~django.http.Http404` exceptions and convert them to a :class:`~django.http.JsonResponse`.
     Without this decorator, the exceptions would be converted to :class:`~django.http.HttpResponse`.
 
+    If ``freshness`` is given, the decorator additionally supports conditional ``GET`` requests: The ``ETag`` and
+    ``Last-Modified`` headers are computed with a single aggregate query (see
+    :func:`~integreat_cms.api.decorators.get_freshness`) and requests with matching ``If-None-Match`` or
+    ``If-Modified-Since`` headers are answered with ``304 Not Modified`` before the view function is executed.
+
+    Usage::
+
+        @json_response
+        def view(request, region_slug):
+            ...
+
+        @json_response(freshness=get_translations)
+        def view(request, region_slug, language_slug):
+            ...
+
     :param function: The view function which should always return JSON
     :type function: ~collections.abc.Callable
 
+    :param freshness: A function which takes the region and the language slug and returns the queryset of objects
+                      (e.g. translations) the response is derived from
+    :type freshness: ~collections.abc.Callable
+
+    :param daily: Whether the response additionally changes every day (defaults to ``False``)
+    :type daily: bool
+
     :return: The decorated function
     :rtype: ~collections.abc.Callable
     """
+    if function is None:
+        return lambda func: json_response(func, freshness=freshness, daily=daily)
 
     @wraps(function)
     def wrap(request, *args, **kwargs):
@@ -105,12 +225,92 @@ def json_response(function):
         :param kwargs: The supplied kwargs
         :type kwargs: dict
 
-        :return: The response of the given function or an 404 :class:`~django.http.JsonResponse`
+        :return: The response of the given function, a 304 :class:`~django.http.HttpResponseNotModified` or an 404
+                 :class:`~django.http.JsonResponse`
         :rtype: ~django.http.JsonResponse
         """
         try:
+            if freshness and request.method in ["GET", "HEAD"]:
+                etag, last_modified = get_freshness(
+                    request, function.__name__, freshness, daily
+                )
+                not_modified_response = get_conditional_response(
+                    request, etag=quote_etag(etag), last_modified=last_modified
+                )
+                if not_modified_response:
+                    return not_modified_response
+                response = function(request, *args, **kwargs)
+                if response.status_code == 200:
+                    response["ETag"] = quote_etag(etag)
+                    response["Last-Modified"] = http_date(last_modified)
+                return response
             return function(request, *args, **kwargs)
         except Http404 as e:
             return JsonResponse({"error": str(e) or "Not found."}, status=404)
 
     return wrap
+
+
+def cached_response(endpoint):
+    """
+    This decorator can be used to cache the serialized responses of content API endpoints.
+    The responses are stored per region, language and content version of the region (see :mod:`~integreat_cms.api.cache`),
+    so cache hits are served without any database queries.
+
+    :param endpoint: The name of the endpoint which is used in the cache key
+    :type endpoint: str
+
+    :return: The decorator
+    :rtype: ~collections.abc.Callable
+    """
+
+    def decorator(function):
+        """
+        The actual decorator
+
+        :param function: The view function whose responses should be cached
+        :type function: ~collections.abc.Callable
+
+        :return: The decorated function
+        :rtype: ~collections.abc.Callable
+        """
+
+        @wraps(function)
+        def wrap(request, *args, **kwargs):
+            """
+            The inner function for this decorator.
+            It returns the cached response if available and caches successful responses otherwise.
+            Responses of endpoints without ``region_slug`` (e.g. the list of regions) are cached under the pseudo
+            region :attr:`~integreat_cms.api.cache.REGION_LIST`.
+
+            :param request: Django request
+            :type request: ~django.http.HttpRequest
+
+            :param args: The supplied arguments
+            :type args: list
+
+            :param kwargs: The supplied kwargs (usually the slugs of the region and the language)
+            :type kwargs: dict
+
+            :return: The cached response or the response of the given function
+            :rtype: ~django.http.HttpResponse
+            """
+            if request.method != "GET":
+                return function(request, *args, **kwargs)
+            key = get_response_key(
+                endpoint,
+                kwargs.get("region_slug", REGION_LIST),
+                kwargs.get("language_slug"),
+            )
+            cached = get_cached_response(key)
+            if cached is not None:
+                content_type, content = cached
+                return HttpResponse(content, content_type=content_type)
+            response = function(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                set_cached_response(key, response["Content-Type"], response.content)
+            return response
+
+        return wrap
+
+    return decorator
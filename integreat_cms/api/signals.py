@@ -0,0 +1,400 @@
+"""
+This module contains signal handlers which invalidate the cached API responses of a region whenever its content changes
+(see :mod:`~integreat_cms.api.cache`) and which record the content that is removed from the API in the tombstone log
+(see :class:`~integreat_cms.cms.models.tombstones.tombstone.Tombstone`).
+"""
+import logging
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from mptt.signals import node_moved
+
+from ..cms.constants import status, tombstone_reasons
+from ..cms.models import (
+    Event,
+    EventTranslation,
+    Language,
+    LanguageTreeNode,
+    OfferTemplate,
+    Page,
+    PageTranslation,
+    POI,
+    POITranslation,
+    Region,
+    Tombstone,
+)
+from .cache import REGION_LIST, bump_content_version
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+@receiver(post_save, sender=EventTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_save, sender=POITranslation)
+@receiver(post_delete, sender=POITranslation)
+def translation_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of the translation's region
+
+    :param sender: The class of the translation
+    :type sender: type
+
+    :param instance: The translation which was saved or deleted
+    :type instance: ~integreat_cms.cms.models.pages.page_translation.PageTranslation,
+                    ~integreat_cms.cms.models.events.event_translation.EventTranslation or
+                    ~integreat_cms.cms.models.pois.poi_translation.POITranslation
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    try:
+        bump_content_version(instance.foreign_object.region.slug)
+        if isinstance(instance, PageTranslation):
+            # The content of this page is also embedded into the pages which mirror it
+            for region_slug in set(
+                instance.page.mirroring_pages.values_list("region__slug", flat=True)
+            ):
+                bump_content_version(region_slug)
+    except ObjectDoesNotExist:
+        # When the content object is deleted, the cache is invalidated by the content object's signal handler
+        logger.debug("Could not determine region of deleted translation %r", sender)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+@receiver(node_moved, sender=Page)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=POI)
+@receiver(post_delete, sender=POI)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+def region_content_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of the region of a content object (e.g. because it was archived or moved)
+
+    :param sender: The class of the content object
+    :type sender: type
+
+    :param instance: The content object which was saved, moved or deleted
+    :type instance: ~integreat_cms.cms.models.pages.page.Page, ~integreat_cms.cms.models.events.event.Event,
+                    ~integreat_cms.cms.models.pois.poi.POI or
+                    ~integreat_cms.cms.models.languages.language_tree_node.LanguageTreeNode
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    try:
+        bump_content_version(instance.region.slug)
+    except ObjectDoesNotExist:
+        # When the region is deleted, the cache is invalidated by the region's signal handler
+        logger.debug("Could not determine region of deleted object %r", sender)
+
+
+# pylint: disable=unused-argument
+@receiver(pre_save, sender=Region)
+def region_slug_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of a region's old slug when the slug is changed
+
+    :param sender: The class of the region
+    :type sender: type
+
+    :param instance: The region which is about to be saved
+    :type instance: ~integreat_cms.cms.models.regions.region.Region
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    if instance.id:
+        old_slug = (
+            Region.objects.filter(id=instance.id).values_list("slug", flat=True).first()
+        )
+        if old_slug and old_slug != instance.slug:
+            bump_content_version(old_slug)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+def region_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of a region
+
+    :param sender: The class of the region
+    :type sender: type
+
+    :param instance: The region which was saved or deleted
+    :type instance: ~integreat_cms.cms.models.regions.region.Region
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    bump_content_version(instance.slug)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=Language)
+def language_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of all regions which use a language, because their responses contain e.g. the name and
+    the text direction of the language.
+    Languages which are used by regions cannot be deleted, so only saved languages have to be handled.
+
+    :param sender: The class of the language
+    :type sender: type
+
+    :param instance: The language which was saved
+    :type instance: ~integreat_cms.cms.models.languages.language.Language
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    for region_slug in set(
+        instance.language_tree_nodes.values_list("region__slug", flat=True)
+    ):
+        bump_content_version(region_slug)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=Region)
+@receiver(post_delete, sender=Region)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+@receiver(post_save, sender=Language)
+@receiver(pre_delete, sender=OfferTemplate)
+def region_list_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached responses of the endpoints which contain all regions.
+    Apart from the regions themselves, these responses depend on the default languages of the regions (which are
+    used for the names of the regions) and on whether the regions have any offers.
+
+    :param sender: The class of the changed object
+    :type sender: type
+
+    :param instance: The object which was saved or deleted
+    :type instance: ~integreat_cms.cms.models.regions.region.Region,
+                    ~integreat_cms.cms.models.languages.language_tree_node.LanguageTreeNode,
+                    ~integreat_cms.cms.models.languages.language.Language or
+                    ~integreat_cms.cms.models.offers.offer_template.OfferTemplate
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    bump_content_version(REGION_LIST)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=OfferTemplate)
+@receiver(pre_delete, sender=OfferTemplate)
+def offer_template_changed(sender, instance, **kwargs):
+    """
+    Invalidate the API cache of all regions which use an offer template
+
+    :param sender: The class of the offer template
+    :type sender: type
+
+    :param instance: The offer template which was saved or is about to be deleted
+    :type instance: ~integreat_cms.cms.models.offers.offer_template.OfferTemplate
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    for region_slug in instance.regions.values_list("slug", flat=True):
+        bump_content_version(region_slug)
+
+
+# pylint: disable=unused-argument
+@receiver(m2m_changed, sender=Region.offers.through)
+def region_offers_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Invalidate the API cache of all regions whose offers changed
+
+    :param sender: The intermediate model of the many-to-many relation
+    :type sender: type
+
+    :param instance: The region or offer template whose relation was changed
+    :type instance: ~integreat_cms.cms.models.regions.region.Region or
+                    ~integreat_cms.cms.models.offers.offer_template.OfferTemplate
+
+    :param action: The type of the update
+    :type action: str
+
+    :param reverse: Whether the relation was changed from the offer template's side
+    :type reverse: bool
+
+    :param pk_set: The primary keys of the added or removed objects
+    :type pk_set: set
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    if action not in ["post_add", "post_remove", "pre_clear"]:
+        return
+    bump_content_version(REGION_LIST)
+    if not reverse:
+        bump_content_version(instance.slug)
+    else:
+        regions = Region.objects.filter(id__in=pk_set) if pk_set else instance.regions
+        for region_slug in regions.values_list("slug", flat=True):
+            bump_content_version(region_slug)
+
+
+def get_visible_pages(page):
+    """
+    Get the given page and all its descendants which are delivered by the API if the given page is not archived.
+    Descendants of other explicitly archived pages are excluded.
+
+    :param page: The root page of the subtree
+    :type page: ~integreat_cms.cms.models.pages.page.Page
+
+    :return: The visible pages of the subtree
+    :rtype: list [ ~integreat_cms.cms.models.pages.page.Page ]
+    """
+    if page.implicitly_archived:
+        return []
+    visible_pages = []
+    hidden_page_ids = set()
+    # Descendants are returned in tree order, so the parent of each page is always processed before the page itself
+    for descendant in page.get_descendants(include_self=True):
+        if descendant.parent_id in hidden_page_ids or (
+            descendant.explicitly_archived and descendant.id != page.id
+        ):
+            hidden_page_ids.add(descendant.id)
+        else:
+            visible_pages.append(descendant)
+    return visible_pages
+
+
+def create_tombstones(content_objects, reason):
+    """
+    Create a tombstone for each public translation of the given content objects
+
+    :param content_objects: The pages, events or locations which are removed from the API
+    :type content_objects: list [ ~integreat_cms.cms.models.pages.page.Page ] or
+                           list [ ~integreat_cms.cms.models.events.event.Event ] or
+                           list [ ~integreat_cms.cms.models.pois.poi.POI ]
+
+    :param reason: The reason why the content is removed (see :mod:`~integreat_cms.cms.constants.tombstone_reasons`)
+    :type reason: str
+    """
+    tombstones = []
+    for content_object in content_objects:
+        content_type = ContentType.objects.get_for_model(content_object)
+        public_translations = (
+            content_object.translations.filter(status=status.PUBLIC)
+            .select_related("language")
+            .order_by("language_id", "-version")
+            .distinct("language_id")
+        )
+        for translation in public_translations:
+            path = translation.get_absolute_url()
+            if isinstance(content_object, Page):
+                # The pages API delivers the path with a trailing slash
+                path += "/"
+            tombstones.append(
+                Tombstone(
+                    region=content_object.region,
+                    language=translation.language,
+                    content_type=content_type,
+                    object_id=content_object.id,
+                    path=path,
+                    reason=reason,
+                )
+            )
+    Tombstone.objects.bulk_create(tombstones)
+    logger.debug("Created tombstones %r", tombstones)
+
+
+def restore_tombstones(content_objects):
+    """
+    Mark the archive tombstones of the given content objects as restored
+
+    :param content_objects: The pages, events or locations which are delivered by the API again
+    :type content_objects: list [ ~integreat_cms.cms.models.pages.page.Page ] or
+                           list [ ~integreat_cms.cms.models.events.event.Event ] or
+                           list [ ~integreat_cms.cms.models.pois.poi.POI ]
+    """
+    if not content_objects:
+        return
+    Tombstone.objects.filter(
+        content_type=ContentType.objects.get_for_model(content_objects[0]),
+        object_id__in=[content_object.id for content_object in content_objects],
+        reason=tombstone_reasons.ARCHIVED,
+        restored_date__isnull=True,
+    ).update(restored_date=timezone.now())
+
+
+# pylint: disable=unused-argument
+@receiver(pre_save, sender=Page)
+@receiver(pre_save, sender=Event)
+@receiver(pre_save, sender=POI)
+def archived_state_changed(sender, instance, **kwargs):
+    """
+    Record archived content in the tombstone log and mark restored content as restored
+
+    :param sender: The class of the content object
+    :type sender: type
+
+    :param instance: The content object which is about to be saved
+    :type instance: ~integreat_cms.cms.models.pages.page.Page, ~integreat_cms.cms.models.events.event.Event or
+                    ~integreat_cms.cms.models.pois.poi.POI
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    if not instance.id:
+        return
+    field_name = "explicitly_archived" if sender is Page else "archived"
+    was_archived = (
+        sender.objects.filter(id=instance.id).values_list(field_name, flat=True).first()
+    )
+    is_archived = getattr(instance, field_name)
+    if was_archived is None or was_archived == is_archived:
+        return
+    if sender is Page:
+        # Archiving a page also removes all its visible descendants from the API
+        content_objects = get_visible_pages(instance)
+    else:
+        content_objects = [instance]
+    if is_archived:
+        create_tombstones(content_objects, tombstone_reasons.ARCHIVED)
+    else:
+        restore_tombstones(content_objects)
+
+
+# pylint: disable=unused-argument
+@receiver(pre_delete, sender=Page)
+@receiver(pre_delete, sender=Event)
+@receiver(pre_delete, sender=POI)
+def content_deleted(sender, instance, **kwargs):
+    """
+    Record deleted content in the tombstone log
+
+    :param sender: The class of the content object
+    :type sender: type
+
+    :param instance: The content object which is about to be deleted
+    :type instance: ~integreat_cms.cms.models.pages.page.Page, ~integreat_cms.cms.models.events.event.Event or
+                    ~integreat_cms.cms.models.pois.poi.POI
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    # Archived content is already recorded in the tombstone log
+    if not instance.archived:
+        create_tombstones([instance], tombstone_reasons.DELETED)
@@ -1,3 +1,406 @@
-# from django.test import TestCase
+"""
+This module contains tests for the API app
+"""
+from datetime import timedelta
+from unittest.mock import patch
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from linkcheck.listeners import disable_listeners
+
+from ..cms.constants import status
+from ..cms.forms import PageForm
+from ..cms.models import Event, Language, PageTranslation, Region
+from .cache import get_cache_statistics
+
+
+class APICacheTest(TestCase):
+    """
+    This test checks whether the API responses are cached and invalidated correctly.
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Start every test with an empty cache
+        """
+        cache.clear()
+        self.url = reverse(
+            "api_pages", kwargs={"region_slug": "augsburg", "language_slug": "de"}
+        )
+
+    def test_cache_hit_without_queries(self):
+        """
+        The second request to an endpoint is served from the cache without touching the database
+        """
+        response = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.url)
+        self.assertEqual(response.content, cached_response.content)
+        self.assertEqual(get_cache_statistics(), {"hits": 1, "misses": 1})
+
+    def test_cache_invalidation_on_save(self):
+        """
+        Saving a translation of the region invalidates the cached responses
+        """
+        self.client.get(self.url)
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg", language__slug="de"
+        ).first()
+        translation.title = "Updated title"
+        with disable_listeners():
+            translation.save()
+        response = self.client.get(self.url)
+        self.assertIn(b"Updated title", response.content)
+        self.assertEqual(get_cache_statistics(), {"hits": 0, "misses": 2})
+
+    def test_conditional_request(self):
+        """
+        A request with a matching ETag is answered with an empty 304 response
+        """
+        response = self.client.get(self.url)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        conditional_response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(conditional_response.status_code, 304)
+        self.assertEqual(conditional_response.content, b"")
+
+    def test_last_modified_on_archive(self):
+        """
+        Archiving a page changes the last modification date, so requests with only ``If-Modified-Since`` are not
+        answered with ``304 Not Modified``
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(
+            self.client.get(
+                self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            ).status_code,
+            304,
+        )
+        page = Region.objects.get(slug="augsburg").get_pages().first()
+        page.explicitly_archived = True
+        # Make sure the change does not happen in the same second as the first request
+        with patch(
+            "django.utils.timezone.now",
+            return_value=timezone.now() + timedelta(seconds=10),
+        ):
+            page.save()
+        modified_response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(modified_response.status_code, 200)
+        self.assertNotEqual(
+            modified_response["Last-Modified"], response["Last-Modified"]
+        )
+
+    def test_region_list(self):
+        """
+        The list of regions is cached, supports conditional requests and is invalidated when a region is saved
+        """
+        url = reverse("api_regions")
+        response = self.client.get(url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).content, response.content)
+            conditional_response = self.client.get(
+                url, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(conditional_response.status_code, 304)
+        region = Region.objects.get(slug="augsburg")
+        region.name = "Updated name"
+        region.save()
+        self.assertIn(b"Updated name", self.client.get(url).content)
+
+    def test_language_invalidation(self):
+        """
+        Saving a language invalidates the cached languages of all regions which use it
+        """
+        url = reverse("api_languages", kwargs={"region_slug": "augsburg"})
+        self.client.get(url)
+        language = Language.objects.get(slug="de")
+        language.native_name = "Updated native name"
+        language.save()
+        self.assertIn(b"Updated native name", self.client.get(url).content)
+
+
+class APIStreamingTest(TestCase):
+    """
+    This test checks whether the streaming responses of the list endpoints are identical to the regular responses.
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Make sure the responses are not served from the cache
+        """
+        cache.clear()
+
+    def test_streaming_response_is_identical(self):
+        """
+        The streamed JSON arrays are byte-identical to the serialized lists
+        """
+        for endpoint in ["api_pages", "api_locations", "api_events"]:
+            url = reverse(
+                endpoint, kwargs={"region_slug": "augsburg", "language_slug": "de"}
+            )
+            response = self.client.get(url)
+            cache.clear()
+            with override_settings(API_STREAMING_RESPONSES=True):
+                streaming_response = self.client.get(url)
+            self.assertTrue(streaming_response.streaming)
+            self.assertEqual(
+                response.content, b"".join(streaming_response.streaming_content)
+            )
+
+
+class APIChangesTest(TestCase):
+    """
+    This test checks whether the changes endpoint only delivers the content which changed since the last request.
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Get the initial sync token
+        """
+        self.url = reverse(
+            "api_changes", kwargs={"region_slug": "augsburg", "language_slug": "de"}
+        )
+        response = self.client.get(self.url).json()
+        self.assertTrue(response["pages"])
+        self.sync_token = response["sync_token"]
+
+    def get_changes(self):
+        """
+        Get the changes since the last request
+
+        :return: The decoded response
+        :rtype: dict
+        """
+        return self.client.get(self.url, {"since": self.sync_token}).json()
+
+    def test_no_changes(self):
+        """
+        Without changes, the response does not contain any content
+        """
+        response = self.get_changes()
+        self.assertEqual(response["pages"], [])
+        self.assertEqual(response["events"], [])
+        self.assertEqual(response["locations"], [])
+        self.assertEqual(
+            response["removed"], {"pages": [], "events": [], "locations": []}
+        )
+
+    def test_updated_and_archived_pages(self):
+        """
+        Updated pages are delivered and archived pages are reported as removed
+        """
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg", language__slug="de", status=status.PUBLIC
+        ).first()
+        translation.title = "Updated title"
+        with disable_listeners():
+            translation.save()
+        response = self.get_changes()
+        self.assertEqual(
+            [page["title"] for page in response["pages"]], ["Updated title"]
+        )
+        page = translation.page
+        page.explicitly_archived = True
+        page.save()
+        response = self.get_changes()
+        self.assertEqual(response["pages"], [])
+        self.assertIn(
+            {"path": translation.get_absolute_url() + "/", "reason": "archived"},
+            response["removed"]["pages"],
+        )
+        page.explicitly_archived = False
+        page.save()
+        response = self.get_changes()
+        self.assertIn(
+            translation.get_absolute_url() + "/",
+            [page["path"] for page in response["pages"]],
+        )
+
+    def test_archived_and_restored_page(self):
+        """
+        Pages which are archived and restored between two synchronizations are not reported as removed
+        """
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg", language__slug="de", status=status.PUBLIC
+        ).first()
+        page = translation.page
+        page.explicitly_archived = True
+        page.save()
+        page.explicitly_archived = False
+        page.save()
+        response = self.get_changes()
+        self.assertIn(
+            translation.get_absolute_url() + "/",
+            [page["path"] for page in response["pages"]],
+        )
+        self.assertEqual(response["removed"]["pages"], [])
+
+    def test_deleted_event(self):
+        """
+        Deleted events are reported as removed
+        """
+        event = Event.objects.filter(
+            region__slug="augsburg",
+            archived=False,
+            translations__language__slug="de",
+            translations__status=status.PUBLIC,
+        ).first()
+        path = event.get_public_translation("de").get_absolute_url()
+        event.delete()
+        response = self.get_changes()
+        self.assertEqual(
+            response["removed"]["events"], [{"path": path, "reason": "deleted"}]
+        )
+
+    def test_moved_page(self):
+        """
+        Moved pages are delivered again under their new path and their old path is reported as removed
+        """
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg",
+            page__level=1,
+            language__slug="de",
+            status=status.PUBLIC,
+        ).first()
+        page = translation.page
+        # The old paths are only known if they are materialized
+        PageTranslation.update_ancestor_paths(page.get_root())
+        translation.refresh_from_db()
+        old_path = translation.get_absolute_url() + "/"
+        target = (
+            Region.objects.get(slug="augsburg")
+            .get_pages()
+            .filter(level=0)
+            .exclude(tree_id=page.tree_id)
+            .first()
+        )
+        with disable_listeners():
+            page.move_to(target, "last-child")
+        translation.refresh_from_db()
+        new_path = translation.get_absolute_url() + "/"
+        self.assertNotEqual(new_path, old_path)
+        response = self.get_changes()
+        self.assertIn(new_path, [page["path"] for page in response["pages"]])
+        self.assertIn(
+            {"path": old_path, "reason": "moved"}, response["removed"]["pages"]
+        )
+
+    def test_unchanged_page_position(self):
+        """
+        Saving a page via the page form without changing its position does not deliver the pages again
+        """
+        page = (
+            Region.objects.get(slug="augsburg")
+            .get_pages()
+            .filter(level=1, translations__status=status.PUBLIC)
+            .first()
+        )
+        initial_form = PageForm(instance=page)
+        form = PageForm(
+            data={
+                "parent": page.parent_id,
+                "related_page": initial_form.fields["related_page"].initial.id,
+                "position": initial_form.fields["position"].initial,
+                "mirrored_page_region": "",
+                "mirrored_page_first": True,
+            },
+            instance=page,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        with disable_listeners():
+            form.save()
+        response = self.get_changes()
+        self.assertEqual(response["pages"], [])
+        self.assertEqual(response["removed"]["pages"], [])
+
+    def test_renamed_page(self):
+        """
+        Pages whose slug changed are delivered under their new path and their old path is reported as removed
+        """
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg",
+            page__level=1,
+            language__slug="de",
+            status=status.PUBLIC,
+        ).first()
+        PageTranslation.update_ancestor_paths(translation.page.get_root())
+        translation.refresh_from_db()
+        old_path = translation.get_absolute_url() + "/"
+        translation.pk = None
+        translation.version += 1
+        translation.slug += "-renamed"
+        with disable_listeners():
+            translation.save()
+        new_path = translation.get_absolute_url() + "/"
+        response = self.get_changes()
+        self.assertIn(new_path, [page["path"] for page in response["pages"]])
+        self.assertIn(
+            {"path": old_path, "reason": "moved"}, response["removed"]["pages"]
+        )
+
+    def test_moved_back_page(self):
+        """
+        Pages which are moved back to their old position are not reported as removed
+        """
+        translation = PageTranslation.objects.filter(
+            page__region__slug="augsburg",
+            page__level=1,
+            language__slug="de",
+            status=status.PUBLIC,
+        ).first()
+        page = translation.page
+        PageTranslation.update_ancestor_paths(page.get_root())
+        translation.refresh_from_db()
+        path = translation.get_absolute_url() + "/"
+        parent = page.parent
+        target = (
+            Region.objects.get(slug="augsburg")
+            .get_pages()
+            .filter(level=0)
+            .exclude(tree_id=page.tree_id)
+            .first()
+        )
+        with disable_listeners():
+            page.move_to(target, "last-child")
+            parent.refresh_from_db()
+            page.move_to(parent, "last-child")
+        response = self.get_changes()
+        self.assertIn(path, [page["path"] for page in response["pages"]])
+        self.assertNotIn(path, [page["path"] for page in response["removed"]["pages"]])
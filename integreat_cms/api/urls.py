@@ -3,6 +3,7 @@ Expansion of API-Endpoints for the CMS
 """
 from django.conf.urls import include, url
 
+from .v3.changes import changes
 from .v3.events import events
 from .v3.feedback import (
     page_feedback,
@@ -21,7 +22,7 @@ from .v3.imprint import imprint
 from .v3.languages import languages
 from .v3.locations import locations
 from .v3.pages import pages, children, single_page
-from .v3.pdf_export import pdf_export
+from .v3.pdf_export import pdf_export, pdf_job_status, pdf_job_download
 from .v3.push_notifications import sent_push_notifications
 from .v3.regions import regions, liveregions, hiddenregions, pushnew
 from .v3.offers import offers
@@ -36,11 +37,22 @@ content_api_urlpatterns = [
         name="api_single_page",
     ),
     url(r"^children/?$", children, name="api_children"),
+    url(r"^changes/?$", changes, name="api_changes"),
     url(
         r"^pdf/?$",
         pdf_export,
         name="api_pdf_export",
     ),
+    url(
+        r"^pdf/(?P<job_id>[0-9a-f]{64})/?$",
+        pdf_job_status,
+        name="api_pdf_job_status",
+    ),
+    url(
+        r"^pdf/(?P<job_id>[0-9a-f]{64})/download/?$",
+        pdf_job_download,
+        name="api_pdf_job_download",
+    ),
     url(
         r"^sent_push_notifications/?$",
         sent_push_notifications,
@@ -0,0 +1,71 @@
+"""
+This module contains helpers for serializing the responses of the API endpoints.
+"""
+import json
+
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+
+
+def iter_json_array(items):
+    """
+    Serialize the given items into a JSON array element by element.
+    The concatenated chunks are byte-identical to the content of a :class:`~django.http.JsonResponse` of the list of all
+    items, but only one item has to be kept in memory at a time.
+
+    :param items: The objects which should be serialized
+    :type items: ~collections.abc.Iterable [ dict ]
+
+    :return: An iterator over the chunks of the serialized JSON array
+    :rtype: ~collections.abc.Iterator [ str ]
+    """
+    yield "["
+    separator = ""
+    for item in items:
+        yield separator + json.dumps(item, cls=DjangoJSONEncoder)
+        separator = ", "
+    yield "]"
+
+
+def iter_chunks(iterable, chunk_size):
+    """
+    Split the given iterable into lists of the given size
+
+    :param iterable: The iterable which should be split
+    :type iterable: ~collections.abc.Iterable
+
+    :param chunk_size: The maximum size of each chunk
+    :type chunk_size: int
+
+    :return: An iterator over the chunks
+    :rtype: ~collections.abc.Iterator [ list ]
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def json_list_response(items):
+    """
+    Create a response which contains the given items as JSON array.
+    If :attr:`~integreat_cms.core.settings.API_STREAMING_RESPONSES` is enabled, the items are serialized lazily into a
+    :class:`~django.http.StreamingHttpResponse`, which keeps the peak memory usage independent of the number of items.
+    Note that streaming responses are not stored in the API response cache (see :mod:`~integreat_cms.api.cache`).
+
+    :param items: The objects which should be serialized
+    :type items: ~collections.abc.Iterable [ dict ]
+
+    :return: The JSON response
+    :rtype: ~django.http.JsonResponse or ~django.http.StreamingHttpResponse
+    """
+    if settings.API_STREAMING_RESPONSES:
+        return StreamingHttpResponse(
+            iter_json_array(items), content_type="application/json"
+        )
+    # Turn off Safe-Mode to allow serializing arrays
+    return JsonResponse(list(items), safe=False)
@@ -0,0 +1,259 @@
+"""
+API-endpoint to deliver only the content of a region which changed since the last synchronization of the apps.
+"""
+from datetime import datetime, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from django.http import JsonResponse
+from django.utils import timezone
+
+from ...cms.models import Event, Page, POI, Region, Tombstone
+from ...cms.utils.page_tree_snapshot import PageTreeSnapshot
+from ..decorators import json_response
+from .events import iter_events
+from .locations import iter_poi_translations
+from .pages import transform_page
+
+#: The reference date of the sync tokens
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def get_sync_token(date):
+    """
+    Convert a date into an opaque sync token
+
+    :param date: The date of the synchronization
+    :type date: ~datetime.datetime
+
+    :return: The number of microseconds since the epoch
+    :rtype: str
+    """
+    return str((date - EPOCH) // timedelta(microseconds=1))
+
+
+def parse_sync_token(sync_token):
+    """
+    Convert a sync token back into the date of the synchronization
+
+    :param sync_token: The sync token of a previous response
+    :type sync_token: str
+
+    :raises ValueError: If the sync token is invalid
+
+    :return: The date of the synchronization
+    :rtype: ~datetime.datetime
+    """
+    return EPOCH + timedelta(microseconds=int(sync_token))
+
+
+def get_restored_ids(region, model, since):
+    """
+    Get the ids of all content objects which were restored after the given date
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param model: The model of the content objects
+    :type model: type
+
+    :param since: The date of the last synchronization
+    :type since: ~datetime.datetime
+
+    :return: The ids of the restored content objects
+    :rtype: set
+    """
+    return set(
+        Tombstone.objects.filter(
+            region=region,
+            content_type=ContentType.objects.get_for_model(model),
+            restored_date__gt=since,
+        ).values_list("object_id", flat=True)
+    )
+
+
+def get_changed_pages(region, language_slug, since):
+    """
+    Get the transformed public translations of all pages which were changed, moved or restored after the given date
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :param since: The date of the last synchronization or :obj:`None` for the initial synchronization
+    :type since: ~datetime.datetime
+
+    :return: The data of all changed pages according to APIv3 pages endpoint definition
+    :rtype: list [ dict ]
+    """
+    snapshot = PageTreeSnapshot(region, language_slug)
+    restored_ids = get_restored_ids(region, Page, since) if since else set()
+    result = []
+    for page in snapshot.non_archived_pages:
+        page_translation = snapshot.get_public_translation(page)
+        if not page_translation:
+            continue
+        mirrored_page_translation = snapshot.get_mirrored_page_translation(page)
+        last_updated = page_translation.last_updated
+        if mirrored_page_translation:
+            last_updated = max(last_updated, mirrored_page_translation.last_updated)
+        # Moved pages and the descendants of renamed pages are delivered again under their new path
+        if page.path_changed_date:
+            last_updated = max(last_updated, page.path_changed_date)
+        if not since or last_updated > since or page.id in restored_ids:
+            result.append(transform_page(page_translation, snapshot))
+    return result
+
+
+def get_changed_events(region, language_slug, since):
+    """
+    Get the transformed upcoming events of all events which were changed or restored after the given date
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :param since: The date of the last synchronization or :obj:`None` for the initial synchronization
+    :type since: ~datetime.datetime
+
+    :return: The data of all changed events according to APIv3 events endpoint definition
+    :rtype: list [ dict ]
+    """
+    events = region.events.filter(archived=False)
+    if since:
+        events = events.filter(
+            Q(
+                translations__language__slug=language_slug,
+                translations__last_updated__gt=since,
+            )
+            | Q(id__in=get_restored_ids(region, Event, since))
+        ).distinct()
+    return list(iter_events(events, language_slug))
+
+
+def get_changed_locations(region, language_slug, since):
+    """
+    Get the transformed public translations of all locations which were changed or restored after the given date
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :param since: The date of the last synchronization or :obj:`None` for the initial synchronization
+    :type since: ~datetime.datetime
+
+    :return: The data of all changed locations according to APIv3 locations endpoint definition
+    :rtype: list [ dict ]
+    """
+    pois = region.pois.filter(archived=False)
+    if since:
+        pois = pois.filter(
+            Q(
+                translations__language__slug=language_slug,
+                translations__last_updated__gt=since,
+            )
+            | Q(id__in=get_restored_ids(region, POI, since))
+        ).distinct()
+    return list(iter_poi_translations(pois, language_slug))
+
+
+def get_removed_content(region, language_slug, since, delivered_content):
+    """
+    Get the paths of all translations which were removed from the API after the given date.
+    Content which was restored in the meantime and paths which are delivered again (e.g. when a page is moved back to
+    its old position) are not reported as removed.
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :param since: The date of the last synchronization or :obj:`None` for the initial synchronization
+    :type since: ~datetime.datetime
+
+    :param delivered_content: The data of the delivered pages, events and locations
+    :type delivered_content: dict
+
+    :return: The paths and the reasons of the removed pages, events and locations
+    :rtype: dict
+    """
+    result = {"pages": [], "events": [], "locations": []}
+    if not since:
+        return result
+    keys = {
+        ContentType.objects.get_for_model(Page).id: "pages",
+        ContentType.objects.get_for_model(Event).id: "events",
+        ContentType.objects.get_for_model(POI).id: "locations",
+    }
+    delivered_paths = {
+        key: {content["path"] for content in contents}
+        for key, contents in delivered_content.items()
+    }
+    for tombstone in Tombstone.objects.filter(
+        region=region,
+        language__slug=language_slug,
+        created_date__gt=since,
+        restored_date__isnull=True,
+    ):
+        key = keys[tombstone.content_type_id]
+        if tombstone.path in delivered_paths[key]:
+            continue
+        result[key].append(
+            {
+                "path": tombstone.path,
+                "reason": tombstone.reason.lower(),
+            }
+        )
+    return result
+
+
+@json_response
+# pylint: disable=unused-argument
+def changes(request, region_slug, language_slug):
+    """
+    Deliver all pages, events and locations which were created, updated or restored since the last synchronization
+    together with the paths of the content which was archived or deleted in the meantime.
+
+    The last synchronization is given by the ``since`` parameter, which has to contain the ``sync_token`` of the
+    previous response. Without this parameter, all content of the region is delivered.
+
+    :param request: The current request
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: The slug of the requested region
+    :type region_slug: str
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: JSON object with the changed content and the sync token for the next request
+    :rtype: ~django.http.JsonResponse
+    """
+    region = Region.get_current_region(request)
+    # Determine the sync token before the content is queried to make sure no changes are missed
+    sync_token = get_sync_token(timezone.now())
+    since = None
+    if request.GET.get("since"):
+        try:
+            since = parse_sync_token(request.GET.get("since"))
+        except (ValueError, OverflowError):
+            return JsonResponse({"error": "Invalid sync token."}, status=400)
+    content = {
+        "pages": get_changed_pages(region, language_slug, since),
+        "events": get_changed_events(region, language_slug, since),
+        "locations": get_changed_locations(region, language_slug, since),
+    }
+    return JsonResponse(
+        {
+            "sync_token": sync_token,
+            **content,
+            "removed": get_removed_content(region, language_slug, since, content),
+        }
+    )
@@ -1,12 +1,12 @@
 from datetime import timedelta
 from django.conf import settings
-from django.http import JsonResponse
 from django.utils import timezone
 
-from ...cms.models import Region
+from ...cms.models import EventOccurrence, Region
 from ...cms.models.events.event_translation import EventTranslation
-from ...cms.utils.slug_utils import generate_unique_slug
-from ..decorators import json_response
+from ...cms.utils.alternate_translations import prefetch_alternate_translations
+from ..decorators import cached_response, json_response
+from ..utils import iter_chunks, json_list_response
 from .locations import transform_poi
 
 
@@ -69,69 +69,96 @@ def transform_event_translation(event_translation):
     }
 
 
-def transform_event_recurrences(event_translation, today):
+def transform_event_recurrences(event_translation, occurrences, today):
     """
     Yield all future recurrences of the event.
 
     :param event_translation: The event translation object which should be converted
     :type event_translation: ~integreat_cms.cms.models.events.event_translation.EventTranslation
 
+    :param occurrences: The precomputed upcoming occurrences of the event in the translation's language
+    :type occurrences: list [ ~integreat_cms.cms.models.events.event_occurrence.EventOccurrence ]
+
     :param today: The first date at which event may be yielded
     :type today: ~datetime.date
 
     :return: An iterator over all future recurrences up to ``settings.API_EVENTS_MAX_TIME_SPAN_DAYS``
     :rtype: Iterator[:class:`~datetime.date`]
     """
-    recurrence_rule = event_translation.event.recurrence_rule
-    if not recurrence_rule:
-        return
-
-    # In order to avoid unnecessary computations, check if any future event
-    # may be valid and return early if that is not the case
-    if (
-        recurrence_rule.recurrence_end_date
-        and recurrence_rule.recurrence_end_date < today
-    ):
+    if not occurrences:
         return
 
     event_data = transform_event_translation(event_translation)
-    event_length = event_translation.event.end_date - event_translation.event.start_date
 
     url_base = event_data["url"][: event_data["url"].rfind("/")] + "/"
     path_base = event_data["path"][: event_data["path"].rfind("/")] + "/"
 
-    start_date = event_translation.event.start_date
-    for recurrence_date in recurrence_rule.iter_after(start_date):
-        if recurrence_date - max(start_date, today) > timedelta(
-            days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
-        ):
+    last_date = max(event_translation.event.start_date, today) + timedelta(
+        days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+    )
+    for occurrence in occurrences:
+        if occurrence.start_date > last_date:
             break
-        if recurrence_date < today or recurrence_date == start_date:
-            continue
-
-        unique_path = generate_unique_slug(
-            **{
-                "slug": f"{event_translation.slug}-{recurrence_date}",
-                "manager": EventTranslation.objects,
-                "object_instance": event_translation,
-                "foreign_model": "event",
-                "region": event_translation.event.region,
-                "language": event_translation.language,
-            }
-        )
 
         event_data_copy = {**event_data}
         event_data_copy["event"] = {**event_data_copy["event"]}
         event_data_copy["id"] = None
-        event_data_copy["url"] = url_base + unique_path
-        event_data_copy["path"] = path_base + unique_path
+        event_data_copy["url"] = url_base + occurrence.slug
+        event_data_copy["path"] = path_base + occurrence.slug
         event_data_copy["event"]["id"] = None
-        event_data_copy["event"]["start_date"] = recurrence_date
-        event_data_copy["event"]["end_date"] = recurrence_date + event_length
+        event_data_copy["event"]["start_date"] = occurrence.start_date
+        event_data_copy["event"]["end_date"] = occurrence.end_date
         yield event_data_copy
 
 
-@json_response
+def get_occurrences(event_translations, today):
+    """
+    Get the precomputed upcoming occurrences of the given event translations with one single range query
+
+    :param event_translations: The event translations in the requested language
+    :type event_translations: list [ ~integreat_cms.cms.models.events.event_translation.EventTranslation ]
+
+    :param today: The first date at which occurrences may be yielded
+    :type today: ~datetime.date
+
+    :return: The occurrences ordered by their start date, indexed by the id of their event
+    :rtype: dict
+    """
+    if not event_translations:
+        return {}
+    occurrences = {}
+    for occurrence in EventOccurrence.objects.filter(
+        event__in=[
+            event_translation.event_id for event_translation in event_translations
+        ],
+        language_id=event_translations[0].language_id,
+        start_date__gte=today,
+    ):
+        occurrences.setdefault(occurrence.event_id, []).append(occurrence)
+    return occurrences
+
+
+def get_event_translations(region, language_slug):
+    """
+    Get all event translations the events endpoint is derived from.
+    This is used to check whether the events endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: The event translations of the region in the given language
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.events.event_translation.EventTranslation ]
+    """
+    return EventTranslation.objects.filter(
+        event__region=region, language__slug=language_slug
+    )
+
+
+@json_response(freshness=get_event_translations, daily=True)
+@cached_response("events")
 # pylint: disable=unused-argument
 def events(request, region_slug, language_slug):
     """
@@ -150,17 +177,41 @@ def events(request, region_slug, language_slug):
     :rtype: ~django.http.JsonResponse
     """
     region = Region.get_current_region(request)
-    result = []
+    return json_list_response(
+        iter_events(region.events.filter(archived=False), language_slug)
+    )
+
+
+def iter_events(queryset, language_slug):
+    """
+    Yield the transformed upcoming events and future recurrences of the given events
+
+    :param queryset: The requested events
+    :type queryset: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.events.event.Event ]
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: An iterator over the data of all events according to APIv3 events endpoint definition
+    :rtype: ~collections.abc.Iterator [ dict ]
+    """
     now = timezone.now().date()
-    for event in region.events.filter(archived=False):
-        event_translation = event.get_public_translation(language_slug)
-        if event_translation:
-            if event.end_date >= now:
-                result.append(transform_event_translation(event_translation))
-
-            for future_event in transform_event_recurrences(event_translation, now):
-                result.append(future_event)
-
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+    for chunk in iter_chunks(
+        queryset.iterator(chunk_size=settings.API_STREAMING_CHUNK_SIZE),
+        settings.API_STREAMING_CHUNK_SIZE,
+    ):
+        event_translations = list(
+            filter(
+                None, (event.get_public_translation(language_slug) for event in chunk)
+            )
+        )
+        # Resolve the available languages of the whole chunk at once
+        prefetch_alternate_translations(event_translations)
+        occurrences = get_occurrences(event_translations, now)
+        for event_translation in event_translations:
+            if event_translation.event.end_date >= now:
+                yield transform_event_translation(event_translation)
+
+            yield from transform_event_recurrences(
+                event_translation, occurrences.get(event_translation.event_id), now
+            )
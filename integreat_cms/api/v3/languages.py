@@ -4,10 +4,11 @@ API-endpoint to deliver a JSON with all active languages of an region.
 from django.http import JsonResponse
 
 from ...cms.models import Region
-from ..decorators import json_response
+from ..decorators import cached_response, json_response
 
 
 @json_response
+@cached_response("languages")
 # pylint: disable=unused-argument
 def languages(request, region_slug):
     """
@@ -1,8 +1,9 @@
 from django.conf import settings
-from django.http import JsonResponse
 
-from ...cms.models import Region
-from ..decorators import json_response
+from ...cms.models import Region, POITranslation
+from ...cms.utils.alternate_translations import prefetch_alternate_translations
+from ..decorators import cached_response, json_response
+from ..utils import iter_chunks, json_list_response
 
 
 def transform_poi(poi, poi_translation):
@@ -61,7 +62,27 @@ def transform_poi_translation(poi_translation):
     }
 
 
-@json_response
+def get_poi_translations(region, language_slug):
+    """
+    Get all POI translations the locations endpoint is derived from.
+    This is used to check whether the locations endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: The POI translations of the region in the given language
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pois.poi_translation.POITranslation ]
+    """
+    return POITranslation.objects.filter(
+        poi__region=region, language__slug=language_slug
+    )
+
+
+@json_response(freshness=get_poi_translations)
+@cached_response("locations")
 # pylint: disable=unused-argument
 def locations(request, region_slug, language_slug):
     """
@@ -80,12 +101,32 @@ def locations(request, region_slug, language_slug):
     :rtype: ~django.http.JsonResponse
     """
     region = Region.get_current_region(request)
-    result = []
-    for poi in region.pois.filter(archived=False):
-        translation = poi.get_public_translation(language_slug)
-        if translation:
-            result.append(transform_poi_translation(translation))
-
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+    return json_list_response(
+        iter_poi_translations(region.pois.filter(archived=False), language_slug)
+    )
+
+
+def iter_poi_translations(pois, language_slug):
+    """
+    Yield the transformed public translations of the given POIs.
+    The alternative languages of the translations are resolved in chunks (see
+    :func:`~integreat_cms.cms.utils.alternate_translations.prefetch_alternate_translations`).
+
+    :param pois: The requested POIs
+    :type pois: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pois.poi.POI ]
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: An iterator over the data of all POIs according to APIv3 locations endpoint definition
+    :rtype: ~collections.abc.Iterator [ dict ]
+    """
+    for chunk in iter_chunks(
+        pois.iterator(chunk_size=settings.API_STREAMING_CHUNK_SIZE),
+        settings.API_STREAMING_CHUNK_SIZE,
+    ):
+        translations = list(
+            filter(None, (poi.get_public_translation(language_slug) for poi in chunk))
+        )
+        prefetch_alternate_translations(translations)
+        yield from map(transform_poi_translation, translations)
@@ -5,7 +5,7 @@ from django.http import JsonResponse
 
 from ...cms.constants import postal_code
 from ...cms.models import Region
-from ..decorators import json_response
+from ..decorators import cached_response, json_response
 
 
 def get_url(offer, region):
@@ -77,6 +77,7 @@ def transform_offer(offer, region):
 
 
 @json_response
+@cached_response("offers")
 # pylint: disable=unused-argument
 def offers(request, region_slug, language_slug=None):
     """
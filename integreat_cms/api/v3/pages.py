@@ -2,37 +2,45 @@
 pages API endpoint
 """
 from django.conf import settings
+from django.db.models import Q
 from django.http import JsonResponse, Http404
 from django.shortcuts import get_object_or_404
 
-from ...cms.models import Region, Page
-from ..decorators import json_response
+from ...cms.models import Region, PageTranslation
+from ...cms.utils.page_tree_snapshot import PageTreeSnapshot
+from ..decorators import cached_response, json_response
+from ..utils import json_list_response
 
 
-def transform_page(page_translation):
+def transform_page(page_translation, snapshot):
     """
     Function to create a dict from a single page_translation Object.
 
     :param page_translation: single page translation object
     :type page_translation: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
 
+    :param snapshot: The snapshot of the page tree which contains the given translation
+    :type snapshot: ~integreat_cms.cms.utils.page_tree_snapshot.PageTreeSnapshot
+
     :return: data necessary for API
     :rtype: dict
     """
-    if page_translation.page.icon:
-        thumbnail = settings.BASE_URL + page_translation.page.icon.url
+    page = page_translation.page
+    language_slug = page_translation.language.slug
+    if page.icon:
+        thumbnail = settings.BASE_URL + page.icon.url
     else:
         thumbnail = None
-    if page_translation.page.parent:
+    parent_page = snapshot.get_page(page.parent_id)
+    if parent_page:
+        parent_slug = snapshot.get_slug(parent_page, language_slug)
         parent = {
-            "id": page_translation.page.parent.id,
-            "url": page_translation.page.parent.get_translation(
-                page_translation.language.slug
-            ).backend_base_link,
+            "id": parent_page.id,
+            "url": snapshot.get_backend_base_link(
+                parent_page, language_slug, parent_slug
+            ),
             "path": "/"
-            + page_translation.page.parent.get_translation(
-                page_translation.language.slug
-            ).permalink
+            + snapshot.get_permalink(parent_page, language_slug, parent_slug)
             + "/",
         }
     else:
@@ -43,21 +51,46 @@ def transform_page(page_translation):
         }
     return {
         "id": page_translation.id,
-        "url": page_translation.backend_base_link,
-        "path": "/" + page_translation.permalink + "/",
+        "url": snapshot.get_backend_base_link(
+            page, language_slug, page_translation.slug
+        ),
+        "path": "/"
+        + snapshot.get_permalink(page, language_slug, page_translation.slug)
+        + "/",
         "title": page_translation.title,
-        "modified_gmt": page_translation.combined_last_updated,
+        "modified_gmt": snapshot.get_combined_last_updated(page_translation),
         "excerpt": page_translation.text,
-        "content": page_translation.combined_text,
+        "content": snapshot.get_combined_text(page_translation),
         "parent": parent,
-        "order": page_translation.page.lft,  # use left edge indicator of mptt model for order
-        "available_languages": page_translation.available_languages,
+        "order": page.lft,  # use left edge indicator of mptt model for order
+        "available_languages": snapshot.get_available_languages(page_translation),
         "thumbnail": thumbnail,
         "hash": None,
     }
 
 
-@json_response
+def get_page_translations(region, language_slug):
+    """
+    Get all page translations the pages endpoint is derived from (including the translations of mirrored pages).
+    This is used to check whether the pages endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: The requested region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the requested language
+    :type language_slug: str
+
+    :return: The page translations of the region in the given language
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+    """
+    return PageTranslation.objects.filter(
+        Q(page__region=region) | Q(page__mirroring_pages__region=region),
+        language__slug=language_slug,
+    )
+
+
+@json_response(freshness=get_page_translations)
+@cached_response("pages")
 # pylint: disable=unused-argument
 def pages(request, region_slug, language_slug):
     """
@@ -74,14 +107,14 @@ def pages(request, region_slug, language_slug):
     :rtype: ~django.http.JsonResponse
     """
     region = Region.get_current_region(request)
-    result = []
-    for page in region.get_pages():
-        page_translation = page.get_public_translation(language_slug)
-        if page_translation:
-            result.append(transform_page(page_translation))
-    return JsonResponse(
-        result, safe=False
-    )  # Turn off Safe-Mode to allow serializing arrays
+    snapshot = PageTreeSnapshot(region, language_slug)
+    return json_list_response(
+        transform_page(page_translation, snapshot)
+        for page_translation in map(
+            snapshot.get_public_translation, snapshot.non_archived_pages
+        )
+        if page_translation
+    )
 
 
 def get_single_page(request, language_slug):
@@ -150,10 +183,11 @@ def single_page(request, region_slug, language_slug):
         page = get_single_page(request, language_slug)
     except RuntimeError as e:
         return JsonResponse({"error": str(e)}, status=400)
+    snapshot = PageTreeSnapshot(page.region, language_slug)
     # Get most recent public revision of the page
-    page_translation = page.get_public_translation(language_slug)
+    page_translation = snapshot.get_public_translation(page)
     if page_translation:
-        return JsonResponse(transform_page(page_translation), safe=False)
+        return JsonResponse(transform_page(page_translation, snapshot), safe=False)
 
     raise Http404("No Page matches the given url or id.")
 
@@ -179,21 +213,23 @@ def children(request, region_slug, language_slug):
     :rtype: ~django.http.JsonResponse
     """
     depth = int(request.GET.get("depth", 1))
+    region = Region.get_current_region(request)
+    snapshot = PageTreeSnapshot(region, language_slug)
     try:
         # try to get a single ancestor page based on the requests query string
-        root_pages = [get_single_page(request, language_slug)]
+        root_pages = [snapshot.get_page(get_single_page(request, language_slug).id)]
     except RuntimeError:
         # if neither id nor url is set then get all root pages
-        root_pages = Page.get_root_pages(region_slug)
+        root_pages = snapshot.root_pages
         # simulate a virtual root node for WP compatibility
         # so that depth = 1 returns only those pages without parents (immediate children of this virtual root page)
         # like in wordpress depth = 0 will return no results in this case
         depth = depth - 1
     result = []
     for root in root_pages:
-        descendants = root.get_descendants_max_depth(True, depth)
+        descendants = snapshot.get_descendants_max_depth(root, True, depth)
         for descendant in descendants:
-            public_translation = descendant.get_public_translation(language_slug)
+            public_translation = snapshot.get_public_translation(descendant)
             if public_translation:
-                result.append(transform_page(public_translation))
+                result.append(transform_page(public_translation, snapshot))
     return JsonResponse(result, safe=False)
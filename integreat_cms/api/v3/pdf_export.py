@@ -2,25 +2,39 @@
 View to return PDF document containing the requested pages.
 Single pages may be requested by url parameter, if no parameter is included all pages
 related to the current region and language will be returned.
+If the document is not rendered yet, a PDF export job is submitted (see
+:mod:`~integreat_cms.cms.utils.pdf_export_queue`) and its status is returned instead.
+The status can be polled until the document is ready for download.
 """
 import logging
 
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.translation import ugettext as _
+from django.views.decorators.cache import never_cache
 
+from ...cms.constants import pdf_export_status
 from ...cms.models import Region
-from ...cms.utils.pdf_utils import generate_pdf
+from ...cms.utils.pdf_export_queue import (
+    get_pdf_job_response,
+    get_pdf_job_status,
+    submit_pdf_job,
+)
 from ..decorators import json_response
 
 logger = logging.getLogger(__name__)
 
 
 @json_response
+@never_cache
 # pylint: disable=unused-argument
 def pdf_export(request, region_slug, language_slug):
     """
     View function that either returns the requested page specified by the
     url parameter or returns all pages of current region and language as PDF document
-    by forwarding the request to :func:`~integreat_cms.cms.utils.pdf_utils.generate_pdf`
+    by submitting a job to :func:`~integreat_cms.cms.utils.pdf_export_queue.submit_pdf_job`.
+    If the document is not finished yet, the status of the job is returned instead (see :func:`pdf_job_status`).
 
     :param request: request that was sent to the server
     :type request: ~django.http.HttpRequest
@@ -31,12 +45,11 @@ def pdf_export(request, region_slug, language_slug):
     :param language_slug: current language slug
     :type language_slug: str
 
-    :return: The requested pages as PDF document (inline)
+    :return: The requested pages as PDF document (inline) or the status of the PDF export job
     :rtype: ~django.http.HttpResponse
     """
     region = Region.get_current_region(request)
-    # Request unrestricted queryset because pdf generator performs further operations (e.g. aggregation) on the queryset
-    pages = region.get_pages(return_unrestricted_queryset=True)
+    pages = region.get_pages()
     if request.GET.get("url"):
         # remove leading and trailing slashed to avoid ambiguous urls
         url = request.GET.get("url").strip("/")
@@ -49,4 +62,109 @@ def pdf_export(request, region_slug, language_slug):
             translations__language__slug=language_slug,
         )
         pages = page.get_descendants(include_self=True)
-    return generate_pdf(region, language_slug, pages)
+    job_id = submit_pdf_job(region, language_slug, pages)
+    if not job_id:
+        return HttpResponse(
+            _("No valid pages selected for PDF generation."), status=400
+        )
+    return get_pdf_job_response(job_id) or pdf_job_status_response(
+        region_slug, language_slug, job_id
+    )
+
+
+def pdf_job_status_response(region_slug, language_slug, job_id):
+    """
+    Function to create the status response of a PDF export job.
+    Pending jobs are answered with the status code ``202``, failed jobs with ``500``.
+
+    :param region_slug: Slug defining the region
+    :type region_slug: str
+
+    :param language_slug: current language slug
+    :type language_slug: str
+
+    :param job_id: The id of the PDF export job
+    :type job_id: str
+
+    :raises ~django.http.Http404: HTTP status 404 if the job does not exist
+
+    :return: The status of the job and the download url of the document if it is finished
+    :rtype: ~django.http.JsonResponse
+    """
+    job_status = get_pdf_job_status(job_id)
+    if not job_status:
+        raise Http404("No PDF export job matches the given query.")
+    kwargs = {
+        "region_slug": region_slug,
+        "language_slug": language_slug,
+        "job_id": job_id,
+    }
+    result = {
+        "id": job_id,
+        "status": job_status.lower(),
+        "status_url": reverse("api_pdf_job_status", kwargs=kwargs),
+        "download_url": reverse("api_pdf_job_download", kwargs=kwargs)
+        if job_status == pdf_export_status.FINISHED
+        else None,
+    }
+    return JsonResponse(
+        result,
+        status={pdf_export_status.PENDING: 202, pdf_export_status.FAILED: 500}.get(
+            job_status, 200
+        ),
+    )
+
+
+@json_response
+@never_cache
+# pylint: disable=unused-argument
+def pdf_job_status(request, region_slug, language_slug, job_id):
+    """
+    View function that returns the status of a PDF export job
+
+    :param request: request that was sent to the server
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: Slug defining the region
+    :type region_slug: str
+
+    :param language_slug: current language slug
+    :type language_slug: str
+
+    :param job_id: The id of the PDF export job
+    :type job_id: str
+
+    :return: The status of the job
+    :rtype: ~django.http.JsonResponse
+    """
+    return pdf_job_status_response(region_slug, language_slug, job_id)
+
+
+@json_response
+@never_cache
+# pylint: disable=unused-argument
+def pdf_job_download(request, region_slug, language_slug, job_id):
+    """
+    View function that returns the document of a finished PDF export job
+
+    :param request: request that was sent to the server
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: Slug defining the region
+    :type region_slug: str
+
+    :param language_slug: current language slug
+    :type language_slug: str
+
+    :param job_id: The id of the PDF export job
+    :type job_id: str
+
+    :raises ~django.http.Http404: HTTP status 404 if the job does not exist or is not finished
+
+    :return: The requested pages as PDF document (inline)
+    :rtype: ~django.http.FileResponse
+    """
+    response = get_pdf_job_response(job_id)
+    if not response:
+        raise Http404("No finished PDF export job matches the given query.")
+    return response
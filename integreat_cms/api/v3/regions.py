@@ -1,18 +1,34 @@
 """
 Views to return JSON representations of regions
 """
+from django.db.models import Exists, OuterRef
 from django.http import JsonResponse
 
 from ...cms.models import Region, Language
 from ...cms.constants import region_status
-from ..decorators import json_response
+from ..decorators import cached_response, json_response
+
+
+def get_annotated_regions():
+    """
+    Get the queryset of regions which is used for the regions endpoints.
+    The regions are annotated with ``has_offers``, so checking whether a region has any offers does not require an
+    additional query per region. The default languages, which are required for the names of the regions, are
+    prefetched by the :class:`~integreat_cms.cms.models.regions.region.RegionManager`.
+
+    :return: The annotated regions
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.regions.region.Region ]
+    """
+    return Region.objects.annotate(
+        has_offers=Exists(Region.offers.through.objects.filter(region=OuterRef("pk")))
+    )
 
 
 def transform_region(region):
     """
     Function to create a JSON from a single region object, including information if region is live/active.
 
-    :param region: The region object which should be converted
+    :param region: The region object which should be converted (annotated by :func:`get_annotated_regions`)
     :type region: ~integreat_cms.cms.models.regions.region.Region
 
     :return: data necessary for API
@@ -26,7 +42,7 @@ def transform_region(region):
         "prefix": region.prefix,
         "name_without_prefix": region.name,
         "plz": region.postal_code,
-        "extras": region.offers.exists(),
+        "extras": region.has_offers,
         "events": region.events_enabled,
         "push-notifications": region.push_notifications_enabled,
         "longitude": region.longitude,
@@ -39,7 +55,7 @@ def transform_region_by_status(region):
     """
     Function to create a JSON from a single "active" region object.
 
-    :param region: The region object which should be converted
+    :param region: The region object which should be converted (annotated by :func:`get_annotated_regions`)
     :type region: ~integreat_cms.cms.models.regions.region.Region
 
     :return: data necessary for API
@@ -51,7 +67,62 @@ def transform_region_by_status(region):
     return result
 
 
-@json_response
+# pylint: disable=unused-argument
+def get_regions(region, language_slug):
+    """
+    Get all regions that are not archived.
+    This is used to check whether the regions endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: This endpoint does not depend on a specific region (always :obj:`None`)
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: This endpoint does not depend on a specific language (always :obj:`None`)
+    :type language_slug: str
+
+    :return: The regions that are not archived
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.regions.region.Region ]
+    """
+    return Region.objects.exclude(status=region_status.ARCHIVED)
+
+
+# pylint: disable=unused-argument
+def get_live_regions(region, language_slug):
+    """
+    Get all regions that are live.
+    This is used to check whether the live regions endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: This endpoint does not depend on a specific region (always :obj:`None`)
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: This endpoint does not depend on a specific language (always :obj:`None`)
+    :type language_slug: str
+
+    :return: The regions that are live
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.regions.region.Region ]
+    """
+    return Region.objects.filter(status=region_status.ACTIVE)
+
+
+# pylint: disable=unused-argument
+def get_hidden_regions(region, language_slug):
+    """
+    Get all regions that are hidden.
+    This is used to check whether the hidden regions endpoint was modified (see :func:`~integreat_cms.api.decorators.json_response`).
+
+    :param region: This endpoint does not depend on a specific region (always :obj:`None`)
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: This endpoint does not depend on a specific language (always :obj:`None`)
+    :type language_slug: str
+
+    :return: The regions that are hidden
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.regions.region.Region ]
+    """
+    return Region.objects.filter(status=region_status.HIDDEN)
+
+
+@json_response(freshness=get_regions)
+@cached_response("regions")
 def regions(_):
     """
     List all regions that are not archived and transform result into JSON
@@ -60,14 +131,18 @@ def regions(_):
     :rtype: ~django.http.JsonResponse
     """
     result = list(
-        map(transform_region, Region.objects.exclude(status=region_status.ARCHIVED))
+        map(
+            transform_region,
+            get_annotated_regions().exclude(status=region_status.ARCHIVED),
+        )
     )
     return JsonResponse(
         result, safe=False
     )  # Turn off Safe-Mode to allow serializing arrays
 
 
-@json_response
+@json_response(freshness=get_live_regions)
+@cached_response("liveregions")
 def liveregions(_):
     """
     List all regions that are not archived and transform result into JSON
@@ -78,7 +153,7 @@ def liveregions(_):
     result = list(
         map(
             transform_region_by_status,
-            Region.objects.filter(status=region_status.ACTIVE),
+            get_annotated_regions().filter(status=region_status.ACTIVE),
         )
     )
     return JsonResponse(
@@ -86,7 +161,8 @@ def liveregions(_):
     )  # Turn off Safe-Mode to allow serializing arrays
 
 
-@json_response
+@json_response(freshness=get_hidden_regions)
+@cached_response("hiddenregions")
 def hiddenregions(_):
     """
     List all regions that are hidden and transform result into JSON
@@ -97,7 +173,7 @@ def hiddenregions(_):
     result = list(
         map(
             transform_region_by_status,
-            Region.objects.filter(status=region_status.HIDDEN),
+            get_annotated_regions().filter(status=region_status.HIDDEN),
         )
     )
     return JsonResponse(
@@ -28,7 +28,8 @@ class CmsConfig(AppConfig):
     def ready(self):
         """
         This function gets executed exactly once each time the cms starts. We use it to check wether the secret key was
-        not changed in production mode and show an error message if this is the case.
+        not changed in production mode and show an error message if this is the case. Additionally, the signal handlers
+        of the cms are registered (see :mod:`~integreat_cms.cms.signals`).
 
         See :meth:`django.apps.AppConfig.ready` for more information.
         """
@@ -40,6 +41,9 @@ class CmsConfig(AppConfig):
                 "You are running the Integreat CMS in production mode. Change the SECRET_KEY in the settings.py!"
             )
             sys.exit(1)
+        # Register the signal handlers which invalidate the cached translation coverage
+        # pylint: disable=import-outside-toplevel,unused-import
+        from . import signals
 
 
 authlog = logging.getLogger("auth")
@@ -0,0 +1,19 @@
+"""
+This module contains the possible status of PDF export jobs (see :mod:`~integreat_cms.cms.utils.pdf_export_queue`).
+"""
+from django.utils.translation import ugettext_lazy as _
+
+
+#: The document is being rendered
+PENDING = "PENDING"
+#: The document is ready for download
+FINISHED = "FINISHED"
+#: The document could not be rendered
+FAILED = "FAILED"
+
+#: Choices to use these constants in a database field
+CHOICES = (
+    (PENDING, _("Pending")),
+    (FINISHED, _("Finished")),
+    (FAILED, _("Failed")),
+)
@@ -0,0 +1,20 @@
+"""
+This module contains the possible reasons why content is no longer delivered by the API
+(see :class:`~integreat_cms.cms.models.tombstones.tombstone.Tombstone`).
+"""
+from django.utils.translation import ugettext_lazy as _
+
+
+#: Archived
+ARCHIVED = "ARCHIVED"
+#: Deleted
+DELETED = "DELETED"
+#: Moved (the content is still delivered, but under a different path)
+MOVED = "MOVED"
+
+#: Choices to use these constants in a database field
+CHOICES = (
+    (ARCHIVED, _("Archived")),
+    (DELETED, _("Deleted")),
+    (MOVED, _("Moved")),
+)
@@ -0,0 +1,3 @@
+"""
+This package contains the custom management commands of the CMS
+"""
@@ -0,0 +1,4 @@
+"""
+This package contains the custom management commands of the CMS (see :doc:`django:howto/custom-management-commands`).
+They can be executed via ``integreat-cms-cli <command>``.
+"""
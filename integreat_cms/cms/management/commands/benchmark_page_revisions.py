@@ -0,0 +1,139 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models.functions import Length
+
+from ...models import PageTranslation, Region
+
+
+class Command(BaseCommand):
+    """
+    Management command to compare the storage size of the page revisions and the time needed to load all revisions of
+    a page translation like the revision view (see :class:`~integreat_cms.cms.views.pages.page_revision_view.PageRevisionView`)
+    with full texts and with compressed deltas (see
+    :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.compress_revisions`).
+    The revisions are compressed in a transaction which is rolled back, so this command does not modify the database.
+    """
+
+    help = (
+        "Benchmark the storage size and the loading time of compressed page revisions"
+    )
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only benchmark the revisions of this region"
+        )
+
+    @staticmethod
+    def get_storage_size(translations):
+        """
+        Calculate the number of bytes which are used to store the texts and deltas of the given translations
+
+        :param translations: The page translations
+        :type translations: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+
+        :return: The size of the texts and the deltas in bytes
+        :rtype: int
+        """
+        return sum(
+            len(text.encode()) + len(text_delta or b"")
+            for text, text_delta in translations.values_list("text", "text_delta")
+        )
+
+    @staticmethod
+    def load_revisions(keys):
+        """
+        Load and rebuild all revisions of the given page translations and measure the time per page translation
+
+        :param keys: The ids of the pages and the languages
+        :type keys: list [ tuple ]
+
+        :return: The durations in seconds
+        :rtype: list [ float ]
+        """
+        durations = []
+        for page_id, language_id in keys:
+            start_time = time.perf_counter()
+            PageTranslation.decompress_revisions(
+                PageTranslation.objects.filter(page_id=page_id, language_id=language_id)
+            )
+            durations.append(time.perf_counter() - start_time)
+        return durations
+
+    # pylint: disable=arguments-differ,too-many-locals
+    def handle(self, *args, region_slug=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose revisions should be benchmarked
+        :type region_slug: str
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist or the rebuilt texts
+                                                           differ from the original texts
+        """
+        translations = PageTranslation.objects.order_by()
+        if region_slug:
+            if not Region.objects.filter(slug=region_slug).exists():
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+            translations = translations.filter(page__region__slug=region_slug)
+        keys = list(translations.values_list("page_id", "language_id").distinct())
+        if not keys:
+            raise CommandError("There are no page translations to benchmark.")
+        # Use the revisions with the most text as fingerprint of the original texts
+        longest_revisions = dict(
+            translations.annotate(text_length=Length("text"))
+            .order_by("-text_length")
+            .values_list("id", "text")[:100]
+        )
+
+        full_size = self.get_storage_size(translations)
+        full_durations = self.load_revisions(keys)
+        with transaction.atomic():
+            compressed = sum(
+                PageTranslation.compress_revisions(page_id, language_id)
+                for page_id, language_id in keys
+            )
+            compressed_size = self.get_storage_size(translations)
+            compressed_durations = self.load_revisions(keys)
+            rebuilt_texts = {
+                revision.id: revision.text
+                for page_id, language_id in keys
+                for revision in PageTranslation.decompress_revisions(
+                    PageTranslation.objects.filter(
+                        page_id=page_id, language_id=language_id
+                    )
+                )
+                if revision.id in longest_revisions
+            }
+            transaction.set_rollback(True)
+
+        if rebuilt_texts != longest_revisions:
+            raise CommandError("The rebuilt texts differ from the original texts.")
+        for label, size, durations in [
+            ("full texts", full_size, full_durations),
+            ("deltas", compressed_size, compressed_durations),
+        ]:
+            self.stdout.write(
+                f"{label + ':':12} {size / 1024:.1f} KiB, "
+                f"{sum(durations) / len(durations) * 1000:.2f}ms mean and "
+                f"{max(durations) * 1000:.2f}ms max loading time per page translation"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compressed {compressed} revisions of {len(keys)} page translations to "
+                f"{compressed_size / max(full_size, 1):.1%} of their size."
+            )
+        )
@@ -0,0 +1,133 @@
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from ...models import PageTranslation, Region
+from ...utils.pdf_utils import (
+    get_fragment_key,
+    get_pdf_hash,
+    get_public_translations,
+    render_pdf_document,
+    render_pdf_html,
+)
+
+
+class Command(BaseCommand):
+    """
+    Management command to measure the time needed to export all pages of a region as PDF document without cached page
+    fragments, with cached page fragments and after a single page was edited (see
+    :func:`~integreat_cms.cms.utils.pdf_utils.get_pdf_fragments`).
+    The page is edited in a transaction which is rolled back, so this command does not modify the database.
+    """
+
+    help = "Benchmark the PDF export of a region with and without cached page fragments"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument("region_slug", help="The slug of the region")
+        parser.add_argument(
+            "--language-slug",
+            help="The slug of the language (defaults to the region's default language)",
+        )
+
+    def export(self, label, region, language_slug):
+        """
+        Export all pages of the region and print the time needed for the HTML source and the PDF conversion
+
+        :param label: The label of this export
+        :type label: str
+
+        :param region: The region
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param language_slug: The slug of the language
+        :type language_slug: str
+
+        :raises ~django.core.management.base.CommandError: When the document could not be rendered
+        """
+        start_time = time.perf_counter()
+        _, pages = get_pdf_hash(region, language_slug, region.get_pages())
+        _, html = render_pdf_html(region, language_slug, pages)
+        html_time = time.perf_counter()
+        if render_pdf_document(html) is None:
+            raise CommandError("The PDF document could not be rendered.")
+        pdf_time = time.perf_counter()
+        self.stdout.write(
+            f"{label + ':':26} {(html_time - start_time) * 1000:.0f}ms HTML + "
+            f"{(pdf_time - html_time) * 1000:.0f}ms PDF = "
+            f"{(pdf_time - start_time) * 1000:.0f}ms"
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, region_slug=None, language_slug=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose pages should be exported
+        :type region_slug: str
+
+        :param language_slug: The slug of the language
+        :type language_slug: str
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist or has no public pages
+        """
+        try:
+            region = Region.objects.get(slug=region_slug)
+        except Region.DoesNotExist as e:
+            raise CommandError(
+                f'Region with slug "{region_slug}" does not exist.'
+            ) from e
+        language_slug = language_slug or region.default_language.slug
+        translations = list(
+            get_public_translations(region.get_pages(), language_slug).select_related(
+                "page"
+            )
+        )
+        if not translations:
+            raise CommandError("There are no public pages to export.")
+        # Remove the cached fragments of the region
+        caches["pdf"].delete_many(
+            [
+                get_fragment_key(
+                    translation.id, translation.last_updated, translation.page.level
+                )
+                for translation in translations
+            ]
+        )
+        self.export("without cached fragments", region, language_slug)
+        self.export("with cached fragments", region, language_slug)
+        edited_translation = max(translations, key=lambda t: t.last_updated)
+        with transaction.atomic():
+            PageTranslation.objects.filter(id=edited_translation.id).update(
+                last_updated=timezone.now()
+            )
+            edited_translation.refresh_from_db()
+            self.export("after a single page edit", region, language_slug)
+            transaction.set_rollback(True)
+        # Remove the fragment of the edit which was rolled back
+        caches["pdf"].delete(
+            get_fragment_key(
+                edited_translation.id,
+                edited_translation.last_updated,
+                edited_translation.page.level,
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(translations)} pages of {region} in {language_slug}."
+            )
+        )
@@ -0,0 +1,137 @@
+import random
+import time
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...constants import frequency
+from ...models import Event, RecurrenceRule
+
+
+class Command(BaseCommand):
+    """
+    Management command to compare the performance of
+    :meth:`~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule.iter_after` and
+    :meth:`~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule.iter_between` for recurring events with a
+    long history. The rules are only created in memory, so this command does not modify the database.
+    """
+
+    help = "Benchmark the calculation of upcoming recurrences of long-running recurring events"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--rules", type=int, default=1000, help="The number of recurrence rules"
+        )
+        parser.add_argument(
+            "--years",
+            type=int,
+            default=10,
+            help="The maximum number of years the events are recurring already",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=31,
+            help="The length of the time window which is calculated",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="The seed of the random rules"
+        )
+
+    @staticmethod
+    def get_random_rule(today, years):
+        """
+        Create a random recurrence rule together with its event
+
+        :param today: The current date
+        :type today: ~datetime.date
+
+        :param years: The maximum number of years the event is recurring already
+        :type years: int
+
+        :return: The recurrence rule
+        :rtype: ~integreat_cms.cms.models.events.recurrence_rule.RecurrenceRule
+        """
+        start_date = today - timedelta(days=random.randint(0, years * 365))
+        recurrence_rule = RecurrenceRule(
+            frequency=random.choice(
+                [frequency.DAILY, frequency.WEEKLY, frequency.MONTHLY, frequency.YEARLY]
+            ),
+            interval=random.randint(1, 4),
+            weekdays_for_weekly=random.sample(range(7), random.randint(1, 7)),
+            weekday_for_monthly=random.randint(0, 6),
+            week_for_monthly=random.randint(1, 4),
+        )
+        Event(
+            start_date=start_date, end_date=start_date, recurrence_rule=recurrence_rule
+        )
+        return recurrence_rule
+
+    # pylint: disable=arguments-differ,too-many-locals
+    def handle(self, *args, rules, years, days, seed, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param rules: The number of recurrence rules
+        :type rules: int
+
+        :param years: The maximum number of years the events are recurring already
+        :type years: int
+
+        :param days: The length of the time window which is calculated
+        :type days: int
+
+        :param seed: The seed of the random rules
+        :type seed: int
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When both methods return different recurrences
+        """
+        random.seed(seed)
+        today = date.today()
+        last_date = today + timedelta(days=days)
+        recurrence_rules = [self.get_random_rule(today, years) for _ in range(rules)]
+
+        start_time = time.perf_counter()
+        expected = []
+        for recurrence_rule in recurrence_rules:
+            recurrences = []
+            for recurrence_date in recurrence_rule.iter_after(
+                recurrence_rule.event.start_date
+            ):
+                if recurrence_date > last_date:
+                    break
+                if recurrence_date >= today:
+                    recurrences.append(recurrence_date)
+            expected.append(recurrences)
+        iter_after_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        actual = [
+            list(recurrence_rule.iter_between(today, last_date))
+            for recurrence_rule in recurrence_rules
+        ]
+        iter_between_duration = time.perf_counter() - start_time
+
+        if actual != expected:
+            raise CommandError("The results of iter_after and iter_between differ.")
+        self.stdout.write(f"iter_after:   {iter_after_duration:.3f}s")
+        self.stdout.write(f"iter_between: {iter_between_duration:.3f}s")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Calculated {sum(map(len, actual))} recurrences of {rules} rules "
+                f"{iter_after_duration / max(iter_between_duration, 1e-9):.1f} times faster."
+            )
+        )
@@ -0,0 +1,121 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Min
+
+from ...models import PageTranslation, Region
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to convert the old revisions of existing page translations to compressed deltas
+    (see :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.compress_revisions`) or to restore
+    their full texts, e.g. before disabling :attr:`~integreat_cms.core.settings.PAGE_REVISION_COMPRESSION`.
+    """
+
+    help = "Compress or decompress the old revisions of all page translations"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only convert the revisions of this region"
+        )
+        parser.add_argument(
+            "--decompress",
+            action="store_true",
+            help="Restore the full texts of all compressed revisions",
+        )
+
+    @staticmethod
+    def decompress_revisions(page_id, language_id, oldest_version):
+        """
+        Store the full texts of all compressed revisions of a page in one language
+
+        :param page_id: The id of the page
+        :type page_id: int
+
+        :param language_id: The id of the language
+        :type language_id: int
+
+        :param oldest_version: The version of the oldest compressed revision
+        :type oldest_version: int
+
+        :return: The number of decompressed revisions
+        :rtype: int
+        """
+        revisions = list(
+            PageTranslation.objects.filter(
+                page_id=page_id, language_id=language_id, version__gte=oldest_version
+            ).only("id", "text", "text_delta")
+        )
+        compressed = {
+            revision.id for revision in revisions if revision.text_delta is not None
+        }
+        decompressed = [
+            revision
+            for revision in PageTranslation.decompress_revisions(revisions)
+            if revision.id in compressed
+        ]
+        PageTranslation.objects.bulk_update(decompressed, ["text", "text_delta"])
+        return len(decompressed)
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, region_slug=None, decompress=False, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose revisions should be converted
+        :type region_slug: str
+
+        :param decompress: Whether the compressed revisions should be restored instead
+        :type decompress: bool
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist
+        """
+        regions = Region.objects.all()
+        if region_slug:
+            regions = regions.filter(slug=region_slug)
+            if not regions.exists():
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+        converted = 0
+        for region in regions:
+            translations = PageTranslation.objects.filter(
+                page__region=region
+            ).order_by()
+            with transaction.atomic():
+                if decompress:
+                    for page_id, language_id, oldest_version in (
+                        translations.filter(text_delta__isnull=False)
+                        .values_list("page_id", "language_id")
+                        .annotate(Min("version"))
+                    ):
+                        converted += self.decompress_revisions(
+                            page_id, language_id, oldest_version
+                        )
+                else:
+                    for page_id, language_id in translations.values_list(
+                        "page_id", "language_id"
+                    ).distinct():
+                        converted += PageTranslation.compress_revisions(
+                            page_id, language_id
+                        )
+            logger.info("Converted the page revisions of %r", region)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Decompressed' if decompress else 'Compressed'} {converted} page revisions."
+            )
+        )
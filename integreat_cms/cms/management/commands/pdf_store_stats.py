@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...utils.pdf_store import (
+    EVICTIONS,
+    HITS,
+    MISSES,
+    get_statistics,
+    reset_statistics,
+)
+
+
+class Command(BaseCommand):
+    """
+    Management command to show the statistics of the store of rendered PDF documents (see
+    :mod:`~integreat_cms.cms.utils.pdf_store`)
+    """
+
+    help = "Show the hits, misses, evictions and the size of the PDF store"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the hits, misses and evictions after showing them",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, reset=False, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param reset: Whether the statistics should be reset
+        :type reset: bool
+
+        :param options: The supplied keyword options
+        :type options: dict
+        """
+        statistics = get_statistics()
+        requests = statistics[HITS] + statistics[MISSES]
+        self.stdout.write(
+            f"Hits:      {statistics[HITS]} ({statistics[HITS] / max(requests, 1):.1%})"
+        )
+        self.stdout.write(f"Misses:    {statistics[MISSES]}")
+        self.stdout.write(f"Evictions: {statistics[EVICTIONS]}")
+        self.stdout.write(
+            f"Size:      {statistics['bytes'] / 1024 ** 2:.1f} of "
+            f"{settings.PDF_STORE_MAX_SIZE / 1024 ** 2:.1f} MiB "
+            f"({statistics['documents']} documents)"
+        )
+        if reset:
+            reset_statistics()
+            self.stdout.write(self.style.SUCCESS("Reset the statistics."))
@@ -0,0 +1,73 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Region
+from ...utils.revision_retention import REVISION_MODELS, prune_revisions
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to delete old revisions of pages, imprints, events and locations according to the retention
+    policy (see :mod:`~integreat_cms.cms.utils.revision_retention`)
+    """
+
+    help = "Prune old revisions of pages, imprints, events and locations"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only prune the revisions of this region"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report which revisions would be pruned",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, region_slug=None, dry_run=False, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose revisions should be pruned
+        :type region_slug: str
+
+        :param dry_run: Whether the revisions should only be counted instead of deleted
+        :type dry_run: bool
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist
+        """
+        region = None
+        if region_slug:
+            region = Region.objects.filter(slug=region_slug).first()
+            if not region:
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+        total_count = 0
+        total_size = 0
+        for model, foreign_key in REVISION_MODELS:
+            count, size = prune_revisions(model, foreign_key, region, dry_run)
+            self.stdout.write(
+                f"{model.__name__}: {count} revisions ({size / 1024:.1f} KiB)"
+            )
+            total_count += count
+            total_size += size
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Would prune' if dry_run else 'Pruned'} {total_count} revisions "
+                f"with {total_size / 1024:.1f} KiB of content."
+            )
+        )
@@ -0,0 +1,58 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...models import PageTranslation, Region
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to rebuild the materialized ancestor paths of all page translations
+    (see :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.update_ancestor_paths`)
+    """
+
+    help = "Rebuild the materialized ancestor paths of all page translations"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only rebuild the paths of this region"
+        )
+
+    def handle(self, *args, region_slug=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose paths should be rebuilt
+        :type region_slug: str
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist
+        """
+        regions = Region.objects.all()
+        if region_slug:
+            regions = regions.filter(slug=region_slug)
+            if not regions.exists():
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+        updated = 0
+        for region in regions:
+            with transaction.atomic():
+                for root_page in region.pages.filter(parent=None):
+                    updated += PageTranslation.update_ancestor_paths(root_page)
+            logger.info("Rebuilt the page paths of %r", region)
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated the paths of {updated} page translations.")
+        )
@@ -0,0 +1,68 @@
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from ...models import EventOccurrence, Region
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to recalculate the precomputed occurrences of all recurring events
+    (see :meth:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence.update_occurrences`).
+    This command should be run once a day to move the time window of the occurrences forward.
+    """
+
+    help = "Recalculate the upcoming occurrences of all recurring events"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only update the occurrences of this region"
+        )
+
+    def handle(self, *args, region_slug=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose occurrences should be updated
+        :type region_slug: str
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist
+        """
+        regions = Region.objects.all()
+        if region_slug:
+            regions = regions.filter(slug=region_slug)
+            if not regions.exists():
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+        created = 0
+        chunk_size = settings.API_STREAMING_CHUNK_SIZE
+        for region in regions:
+            # Events without recurrence rule only need to be updated if they have outdated occurrences
+            events = list(
+                region.events.filter(
+                    Q(recurrence_rule__isnull=False) | Q(occurrences__isnull=False)
+                )
+                .distinct()
+                .select_related("recurrence_rule", "region")
+            )
+            for i in range(0, len(events), chunk_size):
+                created += EventOccurrence.update_occurrences(
+                    events[i : i + chunk_size]
+                )
+            logger.info("Updated the event occurrences of %r", region)
+        self.stdout.write(self.style.SUCCESS(f"Created {created} event occurrences."))
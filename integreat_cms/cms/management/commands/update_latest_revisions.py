@@ -0,0 +1,91 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+
+from ...models import Region
+from ...utils.latest_revisions import (
+    LATEST,
+    LATEST_MAJOR_PUBLIC,
+    LATEST_PUBLIC,
+    update_latest_revision_flags,
+)
+from ...utils.revision_retention import REVISION_MODELS
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Management command to materialize the flags of the latest revisions of all translations which were created before
+    the flags existed (see :mod:`~integreat_cms.cms.utils.latest_revisions`)
+    """
+
+    help = "Materialize the flags of the latest revisions of all translations"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region-slug", help="Only update the flags of this region"
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, region_slug=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slug: The slug of the region whose flags should be updated
+        :type region_slug: str
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When the given region does not exist
+        """
+        regions = Region.objects.all()
+        if region_slug:
+            regions = regions.filter(slug=region_slug)
+            if not regions.exists():
+                raise CommandError(f'Region with slug "{region_slug}" does not exist.')
+        unmaterialized = (
+            Q(**{f"{LATEST}__isnull": True})
+            | Q(**{f"{LATEST_PUBLIC}__isnull": True})
+            | Q(**{f"{LATEST_MAJOR_PUBLIC}__isnull": True})
+        )
+        updated = 0
+        for region in regions:
+            for model, foreign_key in REVISION_MODELS:
+                keys = (
+                    model.objects.filter(
+                        unmaterialized, **{f"{foreign_key}__region": region}
+                    )
+                    .order_by()
+                    .values_list(f"{foreign_key}_id", "language_id")
+                    .distinct()
+                )
+                with transaction.atomic():
+                    for foreign_id, language_id in keys:
+                        update_latest_revision_flags(
+                            model.objects.filter(
+                                **{
+                                    f"{foreign_key}_id": foreign_id,
+                                    "language_id": language_id,
+                                }
+                            )
+                        )
+                        updated += 1
+            logger.info("Updated the latest revisions of %r", region)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated the latest revisions of {updated} translations."
+            )
+        )
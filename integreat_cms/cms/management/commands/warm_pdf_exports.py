@@ -0,0 +1,70 @@
+from concurrent.futures import as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...constants import region_status
+from ...models import Region
+from ...utils.pdf_prewarm import get_prewarm_executor, prewarm_region
+
+
+class Command(BaseCommand):
+    """
+    Management command to pre-warm the PDF documents of all pages of every active region in all active languages (see
+    :mod:`~integreat_cms.cms.utils.pdf_prewarm`), e.g. at deploy time.
+    """
+
+    help = "Render the PDF documents of all active regions in advance"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "region_slugs",
+            nargs="*",
+            help="The slugs of the regions (defaults to all active regions)",
+        )
+
+    # pylint: disable=arguments-differ
+    def handle(self, *args, region_slugs=None, **options):
+        """
+        Try to run the command
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param region_slugs: The slugs of the regions whose PDF documents should be pre-warmed
+        :type region_slugs: list
+
+        :param options: The supplied keyword options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: When one of the given regions does not exist
+        """
+        regions = Region.objects.filter(status=region_status.ACTIVE)
+        if region_slugs:
+            regions = Region.objects.filter(slug__in=region_slugs)
+            missing_slugs = set(region_slugs) - set(
+                regions.values_list("slug", flat=True)
+            )
+            if missing_slugs:
+                raise CommandError(
+                    f"Regions with slugs {', '.join(sorted(missing_slugs))} do not exist."
+                )
+        executor = get_prewarm_executor()
+        futures = {
+            executor.submit(prewarm_region, region.id): region for region in regions
+        }
+        total = 0
+        for future in as_completed(futures):
+            count = future.result()
+            total += count
+            self.stdout.write(f"Pre-warmed {count} PDF documents of {futures[future]}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pre-warmed {total} PDF documents of {len(futures)} regions."
+            )
+        )
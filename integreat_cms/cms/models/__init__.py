@@ -6,6 +6,7 @@ from .chat.chat_message import ChatMessage
 
 from .events.event import Event
 from .events.event_translation import EventTranslation
+from .events.event_occurrence import EventOccurrence
 from .events.recurrence_rule import RecurrenceRule
 
 from .offers.offer_template import OfferTemplate
@@ -43,6 +44,8 @@ from .push_notifications.push_notification_translation import (
 
 from .regions.region import Region
 
+from .tombstones.tombstone import Tombstone
+
 from .users.user import User
 from .users.organization import Organization
 from .users.role import Role
@@ -6,6 +6,7 @@ from django.db.models import Q
 from django.utils.translation import get_language, ugettext_lazy as _
 
 from ...constants import frequency, status
+from ...utils.latest_revisions import LATEST, LATEST_PUBLIC, latest_revision_filter
 from ...utils.slug_utils import generate_unique_slug
 from ..media.media_file import MediaFile
 from ..pois.poi import POI
@@ -169,7 +170,9 @@ class Event(models.Model):
                  if no translation exists
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
-        return self.translations.filter(language__slug=language_slug).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=language_slug
+        ).first()
 
     def get_occurrences(self, start, end):
         """
@@ -250,6 +253,7 @@ class Event(models.Model):
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
         return self.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
             language__slug=language_slug,
             status=status.PUBLIC,
         ).first()
@@ -262,7 +266,9 @@ class Event(models.Model):
         :return: The backend translation of a event
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
-        return self.translations.filter(language__slug=get_language()).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=get_language()
+        ).first()
 
     @property
     def default_translation(self):
@@ -274,7 +280,9 @@ class Event(models.Model):
         :return: The default translation of an event
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
-        return self.translations.filter(language=self.region.default_language).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language=self.region.default_language
+        ).first()
 
     @property
     def best_translation(self):
@@ -341,6 +349,21 @@ class Event(models.Model):
 
         return self
 
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to keep the precomputed
+        occurrences of the event up to date (see
+        :meth:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence.update_occurrences`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        super().save(*args, **kwargs)
+        self.occurrences.model.update_occurrences([self])
+
     def __str__(self):
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``Event object (id)``.
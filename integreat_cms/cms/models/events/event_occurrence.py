@@ -0,0 +1,205 @@
+import logging
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from ...constants import status
+from ...utils.slug_utils import generate_unique_slug
+from ..languages.language import Language
+from .event import Event
+from .event_translation import EventTranslation
+
+logger = logging.getLogger(__name__)
+
+
+class EventOccurrence(models.Model):
+    """
+    Data model representing a single upcoming occurrence of a recurring event in a specific language.
+    The occurrences are precomputed for a rolling time window of
+    :attr:`~integreat_cms.core.settings.API_EVENTS_MAX_TIME_SPAN_DAYS` (plus
+    :attr:`~integreat_cms.core.settings.EVENT_OCCURRENCES_BUFFER_DAYS`), so the events API does not have to iterate
+    the recurrence rules and to generate unique slugs on every request.
+    They are updated whenever an event, its recurrence rule or one of its translations is saved and by the management
+    command ``update_event_occurrences``, which should be run once a day.
+    """
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+        verbose_name=_("event"),
+    )
+    language = models.ForeignKey(
+        Language,
+        on_delete=models.CASCADE,
+        related_name="event_occurrences",
+        verbose_name=_("language"),
+    )
+    start_date = models.DateField(verbose_name=_("start date"))
+    end_date = models.DateField(verbose_name=_("end date"))
+    slug = models.SlugField(
+        max_length=1024,
+        allow_unicode=True,
+        verbose_name=_("URL parameter"),
+    )
+
+    @staticmethod
+    def calculate_dates(event, today):
+        """
+        Calculate the start dates of all occurrences of the given event which have to be precomputed.
+        The original start date of the event is not included, because it is delivered by the event itself.
+
+        :param event: The recurring event
+        :type event: ~integreat_cms.cms.models.events.event.Event
+
+        :param today: The first date which should be included
+        :type today: ~datetime.date
+
+        :return: An iterator over the start dates of the occurrences
+        :rtype: ~collections.abc.Iterator [ ~datetime.date ]
+        """
+        last_date = max(event.start_date, today) + timedelta(
+            days=settings.API_EVENTS_MAX_TIME_SPAN_DAYS
+            + settings.EVENT_OCCURRENCES_BUFFER_DAYS
+        )
+        for recurrence_date in event.recurrence_rule.iter_between(today, last_date):
+            if recurrence_date != event.start_date:
+                yield recurrence_date
+
+    @classmethod
+    # pylint: disable=too-many-locals
+    def update_occurrences(cls, events, language=None):
+        """
+        Replace the precomputed occurrences of the given events.
+        Occurrences are only created for the latest public translations of upcoming, non-archived recurring events.
+        The slugs of the occurrences are derived from the translation's slug and made unique with
+        :func:`~integreat_cms.cms.utils.slug_utils.generate_unique_slug` if they collide with other events.
+
+        :param events: The events whose occurrences should be updated
+        :type events: list [ ~integreat_cms.cms.models.events.event.Event ]
+
+        :param language: If given, only the occurrences in this language are updated
+        :type language: ~integreat_cms.cms.models.languages.language.Language
+
+        :return: The number of created occurrences
+        :rtype: int
+        """
+        today = timezone.now().date()
+        events = list(events)
+        recurring_events = {
+            event.id: event
+            for event in events
+            if not event.archived
+            and event.recurrence_rule
+            and (
+                not event.recurrence_rule.recurrence_end_date
+                or event.recurrence_rule.recurrence_end_date >= today
+            )
+        }
+        dates = {
+            event_id: list(cls.calculate_dates(event, today))
+            for event_id, event in recurring_events.items()
+        }
+        translations = EventTranslation.objects.filter(
+            event__in=[
+                event_id
+                for event_id, recurrence_dates in dates.items()
+                if recurrence_dates
+            ],
+            status=status.PUBLIC,
+        )
+        if language:
+            translations = translations.filter(language=language)
+        translations = list(
+            translations.select_related("language")
+            .order_by("event_id", "language_id", "-version")
+            .distinct("event_id", "language_id")
+        )
+        # Check all slugs with one query instead of one query per occurrence
+        existing_slugs = {}
+        for region_id, language_id, slug, event_id in EventTranslation.objects.filter(
+            event__region__in={event.region_id for event in recurring_events.values()},
+            slug__in={
+                f"{translation.slug}-{recurrence_date}"
+                for translation in translations
+                for recurrence_date in dates[translation.event_id]
+            },
+        ).values_list("event__region_id", "language_id", "slug", "event_id"):
+            existing_slugs.setdefault((region_id, language_id, slug), set()).add(
+                event_id
+            )
+        occurrences = []
+        for translation in translations:
+            event = recurring_events[translation.event_id]
+            translation.event = event
+            event_length = event.end_date - event.start_date
+            for recurrence_date in dates[event.id]:
+                slug = f"{translation.slug}-{recurrence_date}"
+                if existing_slugs.get(
+                    (event.region_id, translation.language_id, slug), set()
+                ) - {event.id}:
+                    slug = generate_unique_slug(
+                        **{
+                            "slug": slug,
+                            "manager": EventTranslation.objects,
+                            "object_instance": translation,
+                            "foreign_model": "event",
+                            "region": event.region,
+                            "language": translation.language,
+                        }
+                    )
+                occurrences.append(
+                    cls(
+                        event=event,
+                        language=translation.language,
+                        start_date=recurrence_date,
+                        end_date=recurrence_date + event_length,
+                        slug=slug,
+                    )
+                )
+        outdated_occurrences = cls.objects.filter(event__in=events)
+        if language:
+            outdated_occurrences = outdated_occurrences.filter(language=language)
+        with transaction.atomic():
+            outdated_occurrences.delete()
+            cls.objects.bulk_create(occurrences)
+        logger.debug(
+            "Updated the occurrences of %r events: %r", len(events), len(occurrences)
+        )
+        return len(occurrences)
+
+    def __str__(self):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``EventOccurrence object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the event occurrence
+        :rtype: str
+        """
+        return self.slug
+
+    def __repr__(self):
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<EventOccurrence: EventOccurrence object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the event occurrence
+        :rtype: str
+        """
+        return f"<EventOccurrence (id: {self.id}, event_id: {self.event_id}, language: {self.language.slug}, start_date: {self.start_date})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("event occurrence")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("event occurrences")
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["start_date"]
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The indexes of this model
+        indexes = [models.Index(fields=["event", "language", "start_date"])]
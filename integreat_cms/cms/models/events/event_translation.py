@@ -1,6 +1,6 @@
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import ugettext_lazy as _
@@ -10,6 +10,15 @@ from linkcheck.models import Link
 from .event import Event
 from ..languages.language import Language
 from ...constants import status
+from ...utils.alternate_translations import prefetch_alternate_translations
+from ...utils.latest_revisions import (
+    LATEST,
+    LATEST_MAJOR_PUBLIC,
+    LATEST_PUBLIC,
+    get_latest_revision_indexes,
+    latest_revision_filter,
+    update_latest_revision_flags,
+)
 from ...utils.translation_utils import ugettext_many_lazy as __
 
 
@@ -76,6 +85,30 @@ class EventTranslation(models.Model):
         auto_now=True,
         verbose_name=_("modification date"),
     )
+    is_latest_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest revision"),
+        help_text=_(
+            "Whether this is the latest revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
+    is_latest_public_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest public revision"),
+        help_text=_(
+            "Whether this is the latest public revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
+    is_latest_major_public_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest major public revision"),
+        help_text=_(
+            "Whether this is the latest major public revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
     links = GenericRelation(Link, related_query_name="event_translations")
 
     @property
@@ -127,6 +160,21 @@ class EventTranslation(models.Model):
             },
         )
 
+    @property
+    def alternate_translations(self):
+        """
+        This property returns the latest public translations of the event in all other languages.
+        The translations can be resolved for multiple event translations at once with
+        :func:`~integreat_cms.cms.utils.alternate_translations.prefetch_alternate_translations`.
+
+        :return: The public translations in other languages, ordered by their language
+        :rtype: list [ ~integreat_cms.cms.models.events.event_translation.EventTranslation ]
+        """
+        if not hasattr(self, "_alternate_translations"):
+            prefetch_alternate_translations([self])
+        # pylint: disable=no-member
+        return self._alternate_translations
+
     @property
     def available_languages(self):
         """
@@ -146,15 +194,12 @@ class EventTranslation(models.Model):
         :return: A dictionary containing the available languages of an event translation
         :rtype: dict
         """
-        languages = self.event.languages.exclude(id=self.language.id)
         available_languages = {}
-        for language in languages:
-            other_translation = self.event.get_public_translation(language.slug)
-            if other_translation:
-                available_languages[language.slug] = {
-                    "id": other_translation.id,
-                    "url": other_translation.permalink,
-                }
+        for other_translation in self.alternate_translations:
+            available_languages[other_translation.language.slug] = {
+                "id": other_translation.id,
+                "url": other_translation.permalink,
+            }
         return available_languages
 
     @property
@@ -167,18 +212,13 @@ class EventTranslation(models.Model):
         :return: A list of dictionaries containing the alternative translations of a event translation
         :rtype: list [ dict ]
         """
-        languages = self.event.languages.exclude(id=self.language.id)
-        available_languages = []
-        for language in languages:
-            other_translation = self.event.get_public_translation(language.slug)
-            if other_translation:
-                available_languages.append(
-                    {
-                        "location": f"{settings.WEBAPP_URL}{other_translation.get_absolute_url()}",
-                        "lang_slug": other_translation.language.slug,
-                    }
-                )
-        return available_languages
+        return [
+            {
+                "location": f"{settings.WEBAPP_URL}{other_translation.get_absolute_url()}",
+                "lang_slug": other_translation.language.slug,
+            }
+            for other_translation in self.alternate_translations
+        ]
 
     @property
     def source_translation(self):
@@ -208,6 +248,7 @@ class EventTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
         return self.event.translations.filter(
+            latest_revision_filter(LATEST),
             language=self.language,
         ).first()
 
@@ -221,6 +262,7 @@ class EventTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
         return self.event.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
             language=self.language,
             status=status.PUBLIC,
         ).first()
@@ -248,6 +290,7 @@ class EventTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.events.event_translation.EventTranslation
         """
         return self.event.translations.filter(
+            latest_revision_filter(LATEST_MAJOR_PUBLIC),
             language=self.language,
             status=status.PUBLIC,
             minor_edit=False,
@@ -340,6 +383,37 @@ class EventTranslation(models.Model):
             .distinct("event")
         )
 
+    def update_revision_flags(self):
+        """
+        Update the flags of the latest revisions of this event in this language (see
+        :func:`~integreat_cms.cms.utils.latest_revisions.update_latest_revision_flags`)
+        """
+        revision_ids = update_latest_revision_flags(
+            self.event.translations.filter(language=self.language)
+        )
+        for flag, revision_id in revision_ids.items():
+            setattr(self, flag, self.id == revision_id)
+
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to update the flags of the latest
+        revisions in the same transaction (see :meth:`update_revision_flags`) and the precomputed occurrences of the
+        event in this language, because their slugs are derived from the slug of the translation (see
+        :meth:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence.update_occurrences`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_revision_flags()
+        self.event.occurrences.model.update_occurrences(
+            [self.event], language=self.language
+        )
+
     def __str__(self):
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``EventTranslation object (id)``.
@@ -369,3 +443,5 @@ class EventTranslation(models.Model):
         ordering = ["event__pk", "-version"]
         #: The default permissions for this model
         default_permissions = ()
+        #: The partial indexes of the latest revisions (see :mod:`~integreat_cms.cms.utils.latest_revisions`)
+        indexes = get_latest_revision_indexes("event", "event_transl")
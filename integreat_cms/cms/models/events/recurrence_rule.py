@@ -1,3 +1,5 @@
+import calendar
+
 from datetime import date, timedelta
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinValueValidator
@@ -8,6 +10,69 @@ from django.utils.translation import ugettext_lazy as _
 from ...constants import frequency, weekdays, weeks
 
 
+def get_nth_weekday(month_date, weekday, n):
+    """
+    Get the nth occurrence of a given weekday in a specific month
+
+    :param month_date: the current date of month
+    :type month_date: datetime.date
+
+    :param weekday: the requested weekday
+    :type weekday: int
+
+    :param n: the requested number
+    :type n: int
+
+    :return: The nth weekday
+    :rtype: datetime.date
+    """
+    month_date = month_date.replace(day=1)
+    month_date += timedelta((weekday - month_date.weekday()) % 7)
+    return month_date + timedelta(weeks=n - 1)
+
+
+def get_next_month(month_date):
+    """
+    Advance the given date by one month
+
+    :param month_date: the given date
+    :type month_date: datetime.date
+
+    :return: The same date one month later
+    :rtype: datetime.date
+    """
+    if month_date.month < 12:
+        return month_date.replace(month=month_date.month + 1)
+
+    return month_date.replace(month=1, year=month_date.year + 1)
+
+
+def get_month_index(month_date):
+    """
+    Get the number of months between the beginning of the calendar and the given date
+
+    :param month_date: the given date
+    :type month_date: datetime.date
+
+    :return: The index of the date's month
+    :rtype: int
+    """
+    return month_date.year * 12 + month_date.month - 1
+
+
+def get_leap_year_count(year):
+    """
+    Get the number of leap years up to (and including) the given year
+
+    :param year: the given year
+    :type year: int
+
+    :return: The number of leap years
+    :rtype: int
+    """
+    return year // 4 - year // 100 + year // 400
+
+
 class RecurrenceRule(models.Model):
     """
     Data model representing the recurrence frequency and interval of an event
@@ -79,41 +144,6 @@ class RecurrenceRule(models.Model):
         """
         next_recurrence = start_date
 
-        def get_nth_weekday(month_date, weekday, n):
-            """
-            Get the nth occurrence of a given weekday in a specific month
-
-            :param month_date: the current date of month
-            :type month_date: datetime.datetime
-
-            :param weekday: the requested weekday
-            :type weekday: str
-
-            :param n: the requested number
-            :type n: integer
-
-            :return: The nth weekday
-            :rtype: datetime.datetime
-            """
-            month_date = month_date.replace(day=1)
-            month_date += timedelta((weekday - month_date.weekday()) % 7)
-            return month_date + timedelta(weeks=n - 1)
-
-        def next_month(month_date):
-            """
-            Advance the given date by one month
-
-            :param month_date: the given date
-            :type month_date: datetime.datetime
-
-            :return: The same date one month later
-            :rtype: datetime.datetime
-            """
-            if month_date.month < 12:
-                return month_date.replace(month=month_date.month + 1)
-
-            return month_date.replace(month=1, year=month_date.year + 1)
-
         def advance():
             """
             Get the next occurrence by this rule
@@ -144,12 +174,12 @@ class RecurrenceRule(models.Model):
                 )
                 if next_recurrence < start_date:
                     next_recurrence = get_nth_weekday(
-                        next_month(next_recurrence),
+                        get_next_month(next_recurrence),
                         self.weekday_for_monthly,
                         self.week_for_monthly,
                     )
                 yield
-                next_recurrence = next_month(next_recurrence)
+                next_recurrence = get_next_month(next_recurrence)
             elif self.frequency == frequency.YEARLY:
                 yield
 
@@ -174,6 +204,132 @@ class RecurrenceRule(models.Model):
                     yield next_recurrence
             i += 1
 
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to update the precomputed
+        occurrences of the event (see
+        :meth:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence.update_occurrences`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        super().save(*args, **kwargs)
+        # When a new recurrence rule is created, it is not yet linked to its event
+        if hasattr(self, "event"):
+            self.event.occurrences.model.update_occurrences([self.event])
+
+    def iter_between(self, start, end):
+        """
+        Iterate all recurrences of the event which take place between two dates (both inclusive).
+        The recurrences are the same as the ones of :meth:`iter_after` with the start date of the event, but instead of
+        advancing period by period from the event's start date, the first period which can contain a recurrence on or
+        after ``start`` is calculated directly. This makes the costs independent of how long the event has been
+        recurring already.
+        The same assumptions as for :meth:`iter_after` apply.
+
+        :param start: The first date which should be included
+        :type start: ~datetime.date
+
+        :param end: The last date which should be included
+        :type end: ~datetime.date
+
+        :return: An iterator over all dates defined by this recurrence rule in the given interval
+        :rtype: Iterator[:class:`~datetime.date`]
+        """
+        end = min(end, self.recurrence_end_date or date.max)
+        for recurrence_date in self.iter_candidates(self.event.start_date, start):
+            if recurrence_date > end:
+                return
+            if recurrence_date >= start:
+                yield recurrence_date
+
+    # pylint: disable=too-many-branches
+    def iter_candidates(self, start_date, after):
+        """
+        Iterate the dates of all periods of this rule, starting with the first period which can contain dates on or
+        after the given date. The dates of this first period may also be before the given date.
+        Periods which are skipped because of the ``interval`` are not included.
+
+        :param start_date: The start date of the recurring event
+        :type start_date: ~datetime.date
+
+        :param after: The date up to which all periods can be skipped
+        :type after: ~datetime.date
+
+        :return: An iterator over the dates of all relevant periods in ascending order
+        :rtype: Iterator[:class:`~datetime.date`]
+        """
+
+        def get_first_period(elapsed_periods):
+            """
+            Get the index of the first period which is not skipped because of the interval
+
+            :param elapsed_periods: The number of periods which can be skipped
+            :type elapsed_periods: int
+
+            :return: The index of the first relevant period
+            :rtype: int
+            """
+            return -(-max(elapsed_periods, 0) // self.interval) * self.interval
+
+        if self.frequency == frequency.DAILY:
+            period = get_first_period((after - start_date).days)
+            next_recurrence = start_date + timedelta(days=period)
+            while True:
+                yield next_recurrence
+                next_recurrence += timedelta(days=self.interval)
+        elif self.frequency == frequency.WEEKLY:
+            first_monday = start_date - timedelta(days=start_date.weekday())
+            period = get_first_period((after - first_monday).days // 7)
+            while True:
+                monday = first_monday + timedelta(weeks=period)
+                for weekday in sorted(self.weekdays_for_weekly):
+                    # The weekdays before the start date are skipped in the first week
+                    if period == 0 and weekday < start_date.weekday():
+                        continue
+                    yield monday + timedelta(days=weekday)
+                period += self.interval
+        elif self.frequency == frequency.MONTHLY:
+            first_recurrence = get_nth_weekday(
+                start_date, self.weekday_for_monthly, self.week_for_monthly
+            )
+            if first_recurrence < start_date:
+                first_recurrence = get_nth_weekday(
+                    get_next_month(first_recurrence),
+                    self.weekday_for_monthly,
+                    self.week_for_monthly,
+                )
+            first_month = get_month_index(first_recurrence)
+            period = get_first_period(get_month_index(after) - first_month)
+            while True:
+                year, month = divmod(first_month + period, 12)
+                yield get_nth_weekday(
+                    date(year, month + 1, 1),
+                    self.weekday_for_monthly,
+                    self.week_for_monthly,
+                )
+                period += self.interval
+        elif self.frequency == frequency.YEARLY:
+            if start_date.month == 2 and start_date.day == 29:
+                # Events on february 29 only recur in leap years, so each leap year is one period
+                year = max(start_date.year, after.year)
+                while year <= date.max.year:
+                    if calendar.isleap(year):
+                        period = get_leap_year_count(year) - get_leap_year_count(
+                            start_date.year
+                        )
+                        if period % self.interval == 0:
+                            yield start_date.replace(year=year)
+                    year += 1
+            else:
+                period = get_first_period(after.year - start_date.year)
+                while True:
+                    yield start_date.replace(year=start_date.year + period)
+                    period += self.interval
+
     def __str__(self):
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``RecurrenceRule object (id)``.
@@ -1,6 +1,7 @@
 from mptt.fields import TreeForeignKey
 from mptt.models import MPTTModel
 
+from django.apps import apps
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
@@ -115,6 +116,23 @@ class LanguageTreeNode(MPTTModel):
         """
         return len(self.get_ancestors())
 
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to update the materialized
+        outdated states of the region's page translations when the language tree changes (see
+        :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.update_outdated_states`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        super().save(*args, **kwargs)
+        # Get model instead of importing it to avoid circular imports
+        PageTranslation = apps.get_model(app_label="cms", model_name="PageTranslation")
+        PageTranslation.update_outdated_states(self.region)
+
     def __str__(self):
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``LanguageTreeNode object (id)``.
@@ -3,6 +3,7 @@ from django.utils.translation import get_language, ugettext_lazy as _
 from django.utils import timezone
 
 from ...constants import status
+from ...utils.latest_revisions import LATEST, LATEST_PUBLIC, latest_revision_filter
 
 
 class AbstractBasePage(models.Model):
@@ -63,7 +64,9 @@ class AbstractBasePage(models.Model):
                  if no translation exists
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
-        return self.translations.filter(language__slug=language_slug).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=language_slug
+        ).first()
 
     def get_public_translation(self, language_slug):
         """
@@ -76,6 +79,7 @@ class AbstractBasePage(models.Model):
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
         return self.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
             language__slug=language_slug,
             status=status.PUBLIC,
         ).first()
@@ -88,7 +92,9 @@ class AbstractBasePage(models.Model):
         :return: The backend translation of a page
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
-        return self.translations.filter(language__slug=get_language()).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=get_language()
+        ).first()
 
     @property
     def default_translation(self):
@@ -100,7 +106,9 @@ class AbstractBasePage(models.Model):
         :return: The default translation of a page
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
-        return self.translations.filter(language=self.region.default_language).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language=self.region.default_language
+        ).first()
 
     @property
     def best_translation(self):
@@ -1,10 +1,19 @@
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import ugettext_lazy as _
 
 from ...constants import status
+from ...utils.alternate_translations import prefetch_alternate_translations
+from ...utils.latest_revisions import (
+    LATEST,
+    LATEST_MAJOR_PUBLIC,
+    LATEST_PUBLIC,
+    latest_revision_filter,
+    update_latest_revision_flags,
+)
 
 
+# pylint: disable=too-many-public-methods
 class AbstractBasePageTranslation(models.Model):
     """
     Data model representing a page or imprint page translation
@@ -36,6 +45,30 @@ class AbstractBasePageTranslation(models.Model):
         auto_now=True,
         verbose_name=_("modification date"),
     )
+    is_latest_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest revision"),
+        help_text=_(
+            "Whether this is the latest revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
+    is_latest_public_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest public revision"),
+        help_text=_(
+            "Whether this is the latest public revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
+    is_latest_major_public_revision = models.BooleanField(
+        null=True,
+        blank=True,
+        verbose_name=_("latest major public revision"),
+        help_text=_(
+            "Whether this is the latest major public revision, which is updated automatically whenever a revision is saved"
+        ),
+    )
 
     @property
     def page(self):
@@ -111,6 +144,21 @@ class AbstractBasePageTranslation(models.Model):
         """
         return "/" + self.permalink
 
+    @property
+    def alternate_translations(self):
+        """
+        This property returns the latest public translations of the page in all other languages.
+        The translations can be resolved for multiple page translations at once with
+        :func:`~integreat_cms.cms.utils.alternate_translations.prefetch_alternate_translations`.
+
+        :return: The public translations in other languages, ordered by their language
+        :rtype: list [ ~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation ]
+        """
+        if not hasattr(self, "_alternate_translations"):
+            prefetch_alternate_translations([self])
+        # pylint: disable=no-member
+        return self._alternate_translations
+
     @property
     def available_languages(self):
         """
@@ -130,16 +178,13 @@ class AbstractBasePageTranslation(models.Model):
         :return: A dictionary containing the available languages of a page translation
         :rtype: dict
         """
-        languages = self.page.languages.exclude(id=self.language.id)
         available_languages = {}
-        for language in languages:
-            other_translation = self.page.get_public_translation(language.slug)
-            if other_translation:
-                available_languages[language.slug] = {
-                    "id": other_translation.id,
-                    "url": other_translation.backend_base_link,
-                    "path": "/" + other_translation.permalink + "/",
-                }
+        for other_translation in self.alternate_translations:
+            available_languages[other_translation.language.slug] = {
+                "id": other_translation.id,
+                "url": other_translation.backend_base_link,
+                "path": "/" + other_translation.permalink + "/",
+            }
         return available_languages
 
     @property
@@ -152,18 +197,13 @@ class AbstractBasePageTranslation(models.Model):
         :return: A list of dictionaries containing the alternative translations of a page translation
         :rtype: list [ dict ]
         """
-        languages = self.page.languages.exclude(id=self.language.id)
-        available_languages = []
-        for language in languages:
-            other_translation = self.page.get_public_translation(language.slug)
-            if other_translation:
-                available_languages.append(
-                    {
-                        "location": f"{settings.WEBAPP_URL}{other_translation.get_absolute_url()}",
-                        "lang_slug": other_translation.language.slug,
-                    }
-                )
-        return available_languages
+        return [
+            {
+                "location": f"{settings.WEBAPP_URL}{other_translation.get_absolute_url()}",
+                "lang_slug": other_translation.language.slug,
+            }
+            for other_translation in self.alternate_translations
+        ]
 
     @property
     def source_translation(self):
@@ -191,6 +231,7 @@ class AbstractBasePageTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
         return self.page.translations.filter(
+            latest_revision_filter(LATEST),
             language=self.language,
         ).first()
 
@@ -204,6 +245,7 @@ class AbstractBasePageTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
         return self.page.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
             language=self.language,
             status=status.PUBLIC,
         ).first()
@@ -231,6 +273,7 @@ class AbstractBasePageTranslation(models.Model):
         :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
         """
         return self.page.translations.filter(
+            latest_revision_filter(LATEST_MAJOR_PUBLIC),
             language=self.language,
             status=status.PUBLIC,
             minor_edit=False,
@@ -250,6 +293,17 @@ class AbstractBasePageTranslation(models.Model):
             version=version,
         ).first()
 
+    def update_revision_flags(self):
+        """
+        Update the flags of the latest revisions of this page in this language (see
+        :func:`~integreat_cms.cms.utils.latest_revisions.update_latest_revision_flags`)
+        """
+        revision_ids = update_latest_revision_flags(
+            self.page.translations.filter(language=self.language)
+        )
+        for flag, revision_id in revision_ids.items():
+            setattr(self, flag, self.id == revision_id)
+
     @property
     def is_outdated(self):
         """
@@ -335,6 +389,21 @@ class AbstractBasePageTranslation(models.Model):
             readable_title = _("with the title in") + best_translation_title
         return readable_title
 
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to update the flags of the latest
+        revisions in the same transaction (see :meth:`update_revision_flags`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.update_revision_flags()
+
     def __str__(self):
         """
         This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``AbstractBasePageTranslation object (id)``.
@@ -8,6 +8,7 @@ from django.utils.translation import ugettext_lazy as _
 from .abstract_base_page_translation import AbstractBasePageTranslation
 from .imprint_page import ImprintPage
 from ..languages.language import Language
+from ...utils.latest_revisions import get_latest_revision_indexes
 
 
 logger = logging.getLogger(__name__)
@@ -113,3 +114,5 @@ class ImprintPageTranslation(AbstractBasePageTranslation):
         ordering = ["page", "-version"]
         #: The default permissions for this model
         default_permissions = ()
+        #: The partial indexes of the latest revisions (see :mod:`~integreat_cms.cms.utils.latest_revisions`)
+        indexes = get_latest_revision_indexes("page", "imprint_transl")
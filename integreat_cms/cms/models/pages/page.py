@@ -4,6 +4,7 @@ from html import escape
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
@@ -101,6 +102,14 @@ class Page(MPTTModel, AbstractBasePage):
             "This allows all members of the organization to edit and publish this page."
         ),
     )
+    path_changed_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("path change date"),
+        help_text=_(
+            "The date when the page was last moved or when its path changed because an ancestor was renamed"
+        ),
+    )
 
     @property
     def explicitly_archived_ancestors(self):
@@ -235,6 +244,32 @@ class Page(MPTTModel, AbstractBasePage):
             .filter(level__lte=self.get_level() + max_depth)
         )
 
+    def move_to(self, target, position="first-child"):
+        """
+        Move this page and its descendants to a new position in the tree and update the materialized ancestor paths of
+        their translations (see :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.update_ancestor_paths`).
+        The date of the change is recorded for all pages whose order might have changed, so the changes API delivers them
+        again (see :mod:`~integreat_cms.api.v3.changes`). If the page stays at its position (e.g. when it is saved via
+        the page form without changing its position), nothing is recorded.
+
+        :param target: The page which determines the new position
+        :type target: ~integreat_cms.cms.models.pages.page.Page
+
+        :param position: The new position of the page relative to the target (choices: :mod:`~integreat_cms.cms.constants.position`)
+        :type position: str
+        """
+        # pylint: disable=no-member
+        old_position = (self.parent_id, self.tree_id, self.lft)
+        super().move_to(target, position)
+        if (self.parent_id, self.tree_id, self.lft) == old_position:
+            return
+        old_tree_id = old_position[1]
+        # The order of all pages in the old and the new tree might have changed
+        Page.objects.filter(tree_id__in=[old_tree_id, self.tree_id]).update(
+            path_changed_date=timezone.now()
+        )
+        self.translations.model.update_ancestor_paths(self)
+
     def get_mirrored_page_translation(self, language_slug):
         """
         Mirrored content always includes the live content from another page. This content needs to be added when
@@ -4,9 +4,11 @@ from html import escape
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django.db.models import Q
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
@@ -15,12 +17,22 @@ from linkcheck.models import Link
 from .abstract_base_page_translation import AbstractBasePageTranslation
 from .page import Page
 from ..languages.language import Language
+from ..tombstones.tombstone import Tombstone
+from ...constants import status, tombstone_reasons
+from ...utils.latest_revisions import (
+    LATEST,
+    LATEST_PUBLIC,
+    get_latest_revision_indexes,
+    latest_revision_filter,
+)
+from ...utils.revision_delta import apply_delta, create_delta
 from ...utils.translation_utils import ugettext_many_lazy as __
 
 
 logger = logging.getLogger(__name__)
 
 
+# pylint: disable=too-many-public-methods
 class PageTranslation(AbstractBasePageTranslation):
     """
     Data model representing a page translation
@@ -65,11 +77,55 @@ class PageTranslation(AbstractBasePageTranslation):
         verbose_name=_("creator"),
     )
     links = GenericRelation(Link, related_query_name="page_translations")
+    materialized_ancestor_path = models.TextField(
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name=_("ancestor path"),
+        help_text=_(
+            "The slugs of all parents of the page, which are updated automatically whenever the page tree changes"
+        ),
+    )
+    word_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name=_("word count"),
+        help_text=_("The approximate number of words of the content"),
+    )
+    text_delta = models.BinaryField(
+        null=True,
+        blank=True,
+        verbose_name=_("content delta"),
+        help_text=_(
+            "The compressed difference to the content of the next newer revision, if the content of this revision is not stored in full"
+        ),
+    )
+    materialized_outdated = models.BooleanField(
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name=_("outdated"),
+        help_text=_(
+            "Whether the source translation changed since the last major update, which is updated automatically whenever the source translation or the language tree changes"
+        ),
+    )
 
     @property
     def ancestor_path(self):
         """
-        This property calculates the path of all parents of the page
+        This property returns the path of all parents of the page.
+        If the path is not materialized yet (see :meth:`update_ancestor_paths`), it is calculated dynamically.
+
+        :return: The relative path to the page
+        :rtype: str
+        """
+        if self.materialized_ancestor_path is not None:
+            return self.materialized_ancestor_path
+        return self.calculate_ancestor_path()
+
+    def calculate_ancestor_path(self):
+        """
+        This function calculates the path of all parents of the page with one query per ancestor
 
         :return: The relative path to the page
         :rtype: str
@@ -83,6 +139,20 @@ class PageTranslation(AbstractBasePageTranslation):
             ]
         )
 
+    @property
+    def is_outdated_helper(self):
+        """
+        This property returns the materialized outdated state of the translation.
+        If the state is not materialized yet (see :meth:`update_outdated_states`), it is calculated dynamically (see
+        :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.is_outdated_helper`).
+
+        :return: Flag to indicate whether the translation is outdated
+        :rtype: bool
+        """
+        if self.materialized_outdated is not None:
+            return self.materialized_outdated
+        return super().is_outdated_helper
+
     @property
     def permalink(self):
         """
@@ -241,6 +311,398 @@ class PageTranslation(AbstractBasePageTranslation):
 
         return tags
 
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to keep the materialized ancestor
+        paths, outdated states and word counts up to date.
+        If the slug of the page in this language changed or this is the first translation of the page in this language,
+        the ancestor paths of all descendants are updated as well.
+        If a new public revision changes the slug of the public translation, the old path of the page is recorded for
+        the changes API (see :meth:`record_moved_translations`).
+        If this is a major public revision, the outdated states of the translations in all languages which are derived
+        from this language are updated as well.
+        If :attr:`~integreat_cms.core.settings.PAGE_REVISION_COMPRESSION` is enabled, the older revisions are compressed
+        afterwards (see :meth:`compress_revisions`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        if self.text_delta is None:
+            self.word_count = len(self.text.split())
+        latest_translation = self.page.translations.filter(
+            latest_revision_filter(LATEST), language=self.language
+        ).first()
+        public_translation = self.page.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
+            language=self.language,
+            status=status.PUBLIC,
+        ).first()
+        if latest_translation and latest_translation.slug == self.slug:
+            if self.materialized_ancestor_path is None:
+                self.materialized_ancestor_path = (
+                    latest_translation.materialized_ancestor_path
+                )
+            super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+            self.update_ancestor_paths(self.page)
+        # The public translation is no longer delivered under its old slug (the old path is unknown if it is not
+        # materialized yet)
+        if (
+            self.status == status.PUBLIC
+            and public_translation
+            and public_translation.slug != self.slug
+            and public_translation.materialized_ancestor_path is not None
+        ):
+            self.record_moved_translations(self.page.region, [public_translation])
+        # The states of derived translations only change if this is a new major public revision or if the translation
+        # process of the source translation started or finished
+        languages = [self.language_id]
+        if (self.status == status.PUBLIC and not self.minor_edit) or (
+            latest_translation
+            and latest_translation.currently_in_translation
+            != self.currently_in_translation
+        ):
+            language_tree_node = self.language.language_tree_nodes.filter(
+                region=self.page.region
+            ).first()
+            if language_tree_node:
+                languages = language_tree_node.get_descendants(
+                    include_self=True
+                ).values_list("language_id", flat=True)
+        self.update_outdated_states(self.page.region, [self.page], languages)
+        self.refresh_from_db(
+            fields=["materialized_ancestor_path", "materialized_outdated"]
+        )
+        if settings.PAGE_REVISION_COMPRESSION:
+            self.compress_revisions(self.page_id, self.language_id)
+
+    @classmethod
+    def compress_revisions(cls, page_id, language_id):
+        """
+        This function replaces the texts of the old revisions of a page in one language by compressed deltas to the text
+        of the next newer revision (see :func:`~integreat_cms.cms.utils.revision_delta.create_delta`).
+        The latest revision and the latest public revision keep their full text, because they are used for editing and
+        for delivering the content. Only the revisions down to the oldest revision which is not compressed yet are loaded.
+
+        :param page_id: The id of the page whose revisions should be compressed
+        :type page_id: int
+
+        :param language_id: The id of the language whose revisions should be compressed
+        :type language_id: int
+
+        :return: The number of compressed revisions
+        :rtype: int
+        """
+        revisions = cls.objects.filter(page_id=page_id, language_id=language_id)
+        uncompressed = list(
+            revisions.filter(text_delta__isnull=True).values_list("version", "status")
+        )
+        if not uncompressed:
+            return 0
+        public_versions = [
+            version for version, state in uncompressed if state == status.PUBLIC
+        ]
+        full_text_versions = {uncompressed[0][0], *public_versions[:1]}
+        compressible_versions = {
+            version for version, _ in uncompressed if version not in full_text_versions
+        }
+        if not compressible_versions:
+            return 0
+        revisions = list(
+            revisions.filter(version__gte=min(compressible_versions)).only(
+                "id", "version", "text", "text_delta", "word_count"
+            )
+        )
+        texts = [revision.text for revision in cls.decompress_revisions(revisions)]
+        compressed = []
+        for newer_text, revision, text in zip(texts, revisions[1:], texts[1:]):
+            if revision.version in compressible_versions:
+                if revision.word_count is None:
+                    revision.word_count = len(text.split())
+                revision.text_delta = create_delta(newer_text, text)
+                revision.text = ""
+                compressed.append(revision)
+        cls.objects.bulk_update(compressed, ["text", "text_delta", "word_count"])
+        logger.debug(
+            "Compressed %r revisions of page %r in language %r",
+            len(compressed),
+            page_id,
+            language_id,
+        )
+        return len(compressed)
+
+    @staticmethod
+    def decompress_revisions(revisions):
+        """
+        This function rebuilds the full texts of compressed revisions (see :meth:`compress_revisions`) in memory.
+        Since each delta refers to the next newer revision, the revisions have to be ordered from the newest to the
+        oldest one and must not skip any version.
+
+        :param revisions: The revisions of a page in one language, starting with the latest revision
+        :type revisions: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+
+        :return: The revisions with their full texts
+        :rtype: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+        """
+        revisions = list(revisions)
+        for newer_revision, revision in zip([None] + revisions, revisions):
+            if revision.text_delta is not None:
+                revision.text = apply_delta(newer_revision.text, revision.text_delta)
+                revision.text_delta = None
+        return revisions
+
+    @classmethod
+    # pylint: disable=too-many-locals
+    def update_ancestor_paths(cls, page):
+        """
+        This function updates the materialized ancestor paths of all translations of the given page and its
+        descendants with a constant number of queries for reading the page tree and one update query for each
+        translation whose path changed.
+        If the path of a public translation changes, the change is recorded for the changes API (see
+        :meth:`record_moved_translations`).
+
+        :param page: The root page of the subtree whose paths should be updated
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :return: The number of updated translations
+        :rtype: int
+        """
+        ancestors = list(page.get_ancestors())
+        subtree = list(page.get_descendants(include_self=True))
+        default_language_id = page.region.default_language.id
+        # The slugs of the latest revision of each page in each language
+        slugs = {
+            (translation["page_id"], translation["language_id"]): translation["slug"]
+            for translation in cls.objects.filter(page__in=ancestors + subtree)
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .values("page_id", "language_id", "slug")
+        }
+        # The currently stored paths of all revisions of the subtree
+        stored_paths = {}
+        for page_id, language_id, path in (
+            cls.objects.filter(page__in=subtree)
+            .order_by()
+            .values_list("page_id", "language_id", "materialized_ancestor_path")
+            .distinct()
+        ):
+            stored_paths.setdefault((page_id, language_id), set()).add(path)
+        language_ids = {language_id for _, language_id in stored_paths}
+        # Pages are sorted in tree order, so the path of the parent is always calculated before the path of the page
+        ancestor_paths = {}
+        for node in ancestors + subtree:
+            for language_id in language_ids:
+                parent_slug = slugs.get((node.parent_id, language_id)) or slugs.get(
+                    (node.parent_id, default_language_id)
+                )
+                ancestor_paths[node.id, language_id] = "/".join(
+                    filter(
+                        None,
+                        [
+                            ancestor_paths.get((node.parent_id, language_id)),
+                            parent_slug,
+                        ],
+                    )
+                )
+        # The public translations whose path changes are no longer delivered under their old path (the old path of
+        # translations whose path is not materialized yet is unknown, see the repair_page_paths management command)
+        moved_translations = [
+            translation
+            for translation in cls.objects.filter(
+                latest_revision_filter(LATEST_PUBLIC),
+                page__in=subtree,
+                status=status.PUBLIC,
+            )
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .select_related("language")
+            if translation.materialized_ancestor_path is not None
+            and translation.materialized_ancestor_path
+            != ancestor_paths[translation.page_id, translation.language_id]
+        ]
+        if moved_translations:
+            cls.record_moved_translations(page.region, moved_translations)
+        updated = 0
+        for (page_id, language_id), paths in stored_paths.items():
+            ancestor_path = ancestor_paths[page_id, language_id]
+            if paths != {ancestor_path}:
+                updated += cls.objects.filter(
+                    page_id=page_id, language_id=language_id
+                ).update(materialized_ancestor_path=ancestor_path)
+        logger.debug(
+            "Updated the ancestor paths of %r translations in the subtree of %r",
+            updated,
+            page,
+        )
+        return updated
+
+    @staticmethod
+    def record_moved_translations(region, translations):
+        """
+        This function records that the paths of the given public translations changed: Their pages are marked as changed
+        and their old paths are recorded as tombstones, so the changes API delivers the pages under their new path and
+        reports the old path as removed (see :mod:`~integreat_cms.api.v3.changes`).
+
+        :param region: The region of the translations
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param translations: The public translations with their old materialized ancestor paths
+        :type translations: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+        """
+        Page.objects.filter(
+            id__in={translation.page_id for translation in translations}
+        ).update(path_changed_date=timezone.now())
+        content_type = ContentType.objects.get_for_model(Page)
+        Tombstone.objects.bulk_create(
+            [
+                Tombstone(
+                    region=region,
+                    language=translation.language,
+                    content_type=content_type,
+                    object_id=translation.page_id,
+                    # The pages API delivers the path with a trailing slash
+                    path="/"
+                    + "/".join(
+                        filter(
+                            None,
+                            [
+                                region.slug,
+                                translation.language.slug,
+                                translation.materialized_ancestor_path,
+                                translation.slug,
+                            ],
+                        )
+                    )
+                    + "/",
+                    reason=tombstone_reasons.MOVED,
+                )
+                for translation in translations
+            ]
+        )
+
+    @classmethod
+    def calculate_outdated_states(cls, region, pages=None):
+        """
+        This function calculates the outdated state (see
+        :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.is_outdated_helper`)
+        of the latest translation of each page in each language with a constant number of queries.
+
+        :param region: The region whose translations should be calculated
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param pages: If given, only the translations of these pages are calculated
+        :type pages: list [ ~integreat_cms.cms.models.pages.page.Page ]
+
+        :return: The outdated states indexed by the ids of the page and the language
+        :rtype: dict
+        """
+        # The source language of each language (the nodes are sorted in tree order)
+        source_languages = dict(
+            region.language_tree_nodes.values_list("language_id", "parent__language_id")
+        )
+        translations = cls.objects.filter(page__region=region)
+        if pages is not None:
+            translations = translations.filter(page__in=pages)
+        # Whether the latest revision of each page in each language is currently in translation
+        in_translation = {
+            (page_id, language_id): currently_in_translation
+            for page_id, language_id, currently_in_translation in translations.order_by(
+                "page_id", "language_id", "-version"
+            )
+            .distinct("page_id", "language_id")
+            .values_list("page_id", "language_id", "currently_in_translation")
+        }
+        # The last update of the latest major public revision of each page in each language
+        major_public_revisions = {
+            (page_id, language_id): last_updated
+            for page_id, language_id, last_updated in translations.filter(
+                status=status.PUBLIC, minor_edit=False
+            )
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .values_list("page_id", "language_id", "last_updated")
+        }
+        # Calculate the states in the order of the language tree, so source translations are always processed first
+        positions = {
+            language_id: position
+            for position, language_id in enumerate(source_languages)
+        }
+        outdated_states = {}
+        for page_id, language_id in sorted(
+            in_translation, key=lambda key: positions.get(key[1], -1)
+        ):
+            source_key = (page_id, source_languages.get(language_id))
+            if source_key not in in_translation:
+                # If the translation has no source translation, it can never be outdated
+                outdated = False
+            elif not in_translation[source_key] and outdated_states[source_key]:
+                # If the source translation is outdated, this translation can not be up to date
+                outdated = True
+            else:
+                last_updated = major_public_revisions.get((page_id, language_id))
+                source_last_updated = major_public_revisions.get(source_key)
+                # If one of the translations has no major public revision, it cannot be outdated
+                outdated = bool(
+                    last_updated
+                    and source_last_updated
+                    and last_updated < source_last_updated
+                )
+            outdated_states[page_id, language_id] = outdated
+        return outdated_states
+
+    @classmethod
+    def update_outdated_states(cls, region, pages=None, languages=None):
+        """
+        This function updates the materialized outdated states of all revisions of the given pages in the given
+        languages with a constant number of queries for calculating the states (see :meth:`calculate_outdated_states`)
+        and one update query for each language and state which changed.
+
+        :param region: The region whose translations should be updated
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param pages: If given, only the translations of these pages are updated
+        :type pages: list [ ~integreat_cms.cms.models.pages.page.Page ]
+
+        :param languages: If given, only the translations in the languages with these ids are updated
+        :type languages: list [ int ]
+
+        :return: The number of updated translations
+        :rtype: int
+        """
+        outdated_states = cls.calculate_outdated_states(region, pages)
+        translations = cls.objects.filter(page__region=region)
+        if pages is not None:
+            translations = translations.filter(page__in=pages)
+        if languages is not None:
+            translations = translations.filter(language__in=languages)
+        # The currently stored states of all revisions
+        stored_states = {}
+        for page_id, language_id, outdated in (
+            translations.order_by()
+            .values_list("page_id", "language_id", "materialized_outdated")
+            .distinct()
+        ):
+            stored_states.setdefault((page_id, language_id), set()).add(outdated)
+        # Group the changed translations by language and state
+        changed_pages = {}
+        for (page_id, language_id), states in stored_states.items():
+            outdated = outdated_states[page_id, language_id]
+            if states != {outdated}:
+                changed_pages.setdefault((language_id, outdated), []).append(page_id)
+        updated = 0
+        for (language_id, outdated), page_ids in changed_pages.items():
+            updated += cls.objects.filter(
+                page__in=page_ids, language_id=language_id
+            ).update(materialized_outdated=outdated)
+        logger.debug(
+            "Updated the outdated states of %r translations of %r", updated, region
+        )
+        return updated
+
     @classmethod
     def get_translations(cls, region, language):
         """
@@ -275,13 +737,9 @@ class PageTranslation(AbstractBasePageTranslation):
         :return: All up to date translations of a region in a specific language
         :rtype: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
         """
-        return [
-            t
-            for t in cls.objects.filter(
-                page__region=region, language=language
-            ).distinct("page")
-            if t.is_up_to_date
-        ]
+        return cls.filter_outdated_translations(
+            cls.get_translations(region, language), False
+        )
 
     @classmethod
     def get_current_translations(cls, region, language):
@@ -321,12 +779,34 @@ class PageTranslation(AbstractBasePageTranslation):
         :return: All outdated translations of a region in a specific language
         :rtype: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
         """
-        return [
-            t
-            for t in cls.objects.filter(
-                page__region=region, language=language
-            ).distinct("page")
-            if t.is_outdated
+        return cls.filter_outdated_translations(
+            cls.get_translations(region, language), True
+        )
+
+    @classmethod
+    def filter_outdated_translations(cls, translations, outdated):
+        """
+        This function filters the given translations which are not currently in translation by their outdated state.
+        The materialized states (see :meth:`update_outdated_states`) are filtered in the database, only the states which
+        are not materialized yet are calculated dynamically.
+
+        :param translations: The translations which should be filtered
+        :type translations: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+
+        :param outdated: Whether the outdated or the up to date translations should be returned
+        :type outdated: bool
+
+        :return: All translations with the requested state
+        :rtype: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+        """
+        # Filter the translations in a separate query because the queryset might use distinct fields
+        translations = cls.objects.filter(
+            id__in=translations.values("id"), currently_in_translation=False
+        )
+        return list(translations.filter(materialized_outdated=outdated)) + [
+            translation
+            for translation in translations.filter(materialized_outdated__isnull=True)
+            if translation.is_outdated == outdated
         ]
 
     @classmethod
@@ -387,3 +867,5 @@ class PageTranslation(AbstractBasePageTranslation):
         ordering = ["page__pk", "-version"]
         #: The default permissions for this model
         default_permissions = ()
+        #: The partial indexes of the latest revisions (see :mod:`~integreat_cms.cms.utils.latest_revisions`)
+        indexes = get_latest_revision_indexes("page", "page_transl")
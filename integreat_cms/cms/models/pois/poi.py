@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import get_language, ugettext_lazy as _
 
 from ...constants import status
+from ...utils.latest_revisions import LATEST, LATEST_PUBLIC, latest_revision_filter
 from ..media.media_file import MediaFile
 from ..regions.region import Region, Language
 
@@ -72,7 +73,9 @@ class POI(models.Model):
                  if no translation exists
         :rtype: ~integreat_cms.cms.models.pois.poi_translation.POITranslation
         """
-        return self.translations.filter(language__slug=language_slug).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=language_slug
+        ).first()
 
     def get_public_translation(self, language_slug):
         """
@@ -85,6 +88,7 @@ class POI(models.Model):
         :rtype: ~integreat_cms.cms.models.pois.poi_translation.POITranslation
         """
         return self.translations.filter(
+            latest_revision_filter(LATEST_PUBLIC),
             language__slug=language_slug,
             status=status.PUBLIC,
         ).first()
@@ -97,7 +101,9 @@ class POI(models.Model):
         :return: The backend translation of a POI
         :rtype: ~integreat_cms.cms.models.pois.poi_translation.POITranslation
         """
-        return self.translations.filter(language__slug=get_language()).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language__slug=get_language()
+        ).first()
 
     @property
     def default_translation(self):
@@ -109,7 +115,9 @@ class POI(models.Model):
         :return: The default translation of a POI
         :rtype: ~integreat_cms.cms.models.pois.poi_translation.POITranslation
         """
-        return self.translations.filter(language=self.region.default_language).first()
+        return self.translations.filter(
+            latest_revision_filter(LATEST), language=self.region.default_language
+        ).first()
 
     @property
     def best_translation(self):
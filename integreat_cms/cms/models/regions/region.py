@@ -344,33 +344,59 @@ class Region(models.Model):
             return None
         return get_object_or_404(cls, slug=region_slug)
 
+    @cached_property
+    def archived_page_ranges(self):
+        """
+        This property returns the ``(tree_id, lft, rght)`` intervals of all archived subtrees of this region.
+        The intervals are merged in one pass over the explicitly archived pages: pages which are contained in the
+        interval of an archived ancestor are skipped, so the resulting intervals are disjoint.
+
+        :return: The disjoint intervals of the archived subtrees, ordered by tree id and left value
+        :rtype: list [ tuple ]
+        """
+        archived_page_ranges = []
+        for tree_id, lft, rght in (
+            self.pages.filter(explicitly_archived=True)
+            .order_by("tree_id", "lft")
+            .values_list("tree_id", "lft", "rght")
+        ):
+            # Skip archived pages which are contained in an archived subtree anyway
+            if (
+                not archived_page_ranges
+                or tree_id != archived_page_ranges[-1][0]
+                or lft > archived_page_ranges[-1][2]
+            ):
+                archived_page_ranges.append((tree_id, lft, rght))
+        return archived_page_ranges
+
+    @property
+    def archived_pages_filter(self):
+        """
+        This property returns a filter expression which matches all archived pages of this region, i.e. all pages
+        within the intervals of :attr:`~integreat_cms.cms.models.regions.region.Region.archived_page_ranges`.
+
+        :return: The filter expression for archived pages
+        :rtype: ~django.db.models.Q
+        """
+        # The empty filter does not match any page if no page is archived
+        archived_pages_filter = models.Q(pk__in=[])
+        for tree_id, lft, rght in self.archived_page_ranges:
+            archived_pages_filter |= models.Q(
+                tree_id=tree_id, lft__gte=lft, rght__lte=rght
+            )
+        return archived_pages_filter
+
     @cached_property
     def archived_pages(self):
         """
         This property returns a QuerySet of all archived pages and their descendants of this region.
 
-        Per default, the returned queryset has some limitations because of the usage of
-        :meth:`~django.db.models.query.QuerySet.union`. To perform the extra effort of returning an unrestricted
-        queryset, use :meth:`~integreat_cms.cms.models.regions.region.Region.get_pages` with the parameters ``archived`` and
-        ``return_unrestricted_queryset`` set to ``True``.
-
         :return: A QuerySet of all archived pages of this region
         :rtype: ~mptt.querysets.TreeQuerySet [ ~integreat_cms.cms.models.pages.page.Page ]
         """
-        # Queryset of explicitly archived pages
-        explicitly_archived_pages = self.pages.filter(explicitly_archived=True)
-        # Multiple order_by clauses are not allowed in sql queries, so to make combined queries with union() work,
-        # we have to remove ordering from the input querysets and apply the default ordering to the resulting queryset.
-        explicitly_archived_pages = explicitly_archived_pages.order_by()
-        # List of QuerySets of descendants of archived pages
-        implicitly_archived_pages = [
-            page.get_descendants().order_by() for page in explicitly_archived_pages
-        ]
-        # Merge explicitly and implicitly archived pages
-        archived_pages = explicitly_archived_pages.union(*implicitly_archived_pages)
         # Order the resulting :class:`~mptt.querysets.TreeQuerySet` to restore the tree-structure which is required for
         # the custom template tag "recursetree" of django-mptt (see :doc:`django-mptt:templates`)
-        return archived_pages.order_by("tree_id", "lft")
+        return self.pages.filter(self.archived_pages_filter).order_by("tree_id", "lft")
 
     @cached_property
     def non_archived_pages(self):
@@ -379,54 +405,51 @@ class Region(models.Model):
         A page is considered as "non-archived" if its ``explicitly_archived`` property is ``False`` and all of the
         page's ancestors are not archived as well.
 
-        Per default, the returned queryset has some limitations because of the usage of
-        :meth:`~django.db.models.query.QuerySet.difference` (see :meth:`~django.db.models.query.QuerySet.union` for some
-        restrictions). To perform the extra effort of returning an unrestricted queryset, use
-        :meth:`~integreat_cms.cms.models.regions.region.Region.get_pages` with the parameter ``return_unrestricted_queryset`` set to
-        ``True``.
-
         :return: A QuerySet of all non-archived pages of this region
         :rtype: ~mptt.querysets.TreeQuerySet [ ~integreat_cms.cms.models.pages.page.Page ]
         """
-        # Multiple order_by clauses are not allowed in sql queries, so to make combined queries with difference() work,
-        # we have to remove ordering from the input querysets and apply the default ordering to the resulting queryset.
-        archived_pages = self.archived_pages.order_by()
-        # Exclude archived pages from all pages
-        non_archived_pages = self.pages.difference(archived_pages)
         # Order the resulting TreeQuerySet to restore the tree-structure which is required for  the custom template tag
         # "recursetree" of django-mptt (see :doc:`django-mptt:templates`)
-        return non_archived_pages.order_by("tree_id", "lft")
+        return self.pages.exclude(self.archived_pages_filter).order_by("tree_id", "lft")
 
-    def get_pages(self, archived=False, return_unrestricted_queryset=False):
+    def get_pages(self, archived=False):
         """
         This method returns either all archived or all non-archived pages of this region.
         To retrieve all pages independently from their archived-state, use the reverse foreign key
         :attr:`~integreat_cms.cms.models.regions.region.Region.pages`.
 
-        Per default, the returned queryset has some limitations because of the usage of
-        :meth:`~django.db.models.query.QuerySet.difference` and :meth:`~django.db.models.query.QuerySet.union`.
-        To perform the extra effort of returning an unrestricted queryset, set the parameter
-        ``return_unrestricted_queryset`` to ``True``.
-
         :param archived: Whether or not only archived pages should be returned (default: ``False``)
         :type archived: bool
 
-        :param return_unrestricted_queryset: Whether or not the result should be returned as unrestricted queryset.
-                                             (default: ``False``)
-        :type return_unrestricted_queryset: bool
-
         :return: Either the archived or the non-archived pages of this region
         :rtype: ~mptt.querysets.TreeQuerySet [ ~integreat_cms.cms.models.pages.page.Page ]
         """
         if archived:
-            pages = self.archived_pages
-        else:
-            pages = self.non_archived_pages
-        if return_unrestricted_queryset:
-            # Generate a new unrestricted queryset containing the same pages
-            page_ids = [page.id for page in pages]
-            pages = self.pages.filter(id__in=page_ids)
-        return pages
+            return self.archived_pages
+        return self.non_archived_pages
+
+    def get_non_archived_descendant_counts(self, pages):
+        """
+        This method counts the non-archived descendants of the given non-archived pages of this region.
+        Instead of resolving the descendants of each page, the sizes of the archived subtrees (see
+        :attr:`~integreat_cms.cms.models.regions.region.Region.archived_page_ranges`) which are contained in the range
+        of a page are subtracted from the number of its descendants.
+
+        :param pages: The non-archived pages of this region
+        :type pages: list [ ~integreat_cms.cms.models.pages.page.Page ]
+
+        :return: The number of non-archived descendants indexed by the page id
+        :rtype: dict
+        """
+        return {
+            page.id: page.get_descendant_count()
+            - sum(
+                (rght - lft + 1) // 2
+                for tree_id, lft, rght in self.archived_page_ranges
+                if tree_id == page.tree_id and page.lft < lft and rght < page.rght
+            )
+            for page in pages
+        }
 
     @classmethod
     def search(cls, query):
@@ -0,0 +1,3 @@
+"""
+This package contains the log of content which is no longer delivered by the API
+"""
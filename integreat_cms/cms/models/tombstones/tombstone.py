@@ -0,0 +1,91 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from ..languages.language import Language
+from ..regions.region import Region
+from ...constants import tombstone_reasons
+
+
+class Tombstone(models.Model):
+    """
+    Data model representing a translation of a page, event or location which was removed from the API because its
+    content object was archived or deleted, or which is no longer delivered under its old path because the page was
+    moved or one of its ancestors was renamed.
+    Tombstones are used by the changes API endpoint (see :mod:`~integreat_cms.api.v3.changes`) to notify the apps
+    about content which they should remove from their local copy.
+    """
+
+    region = models.ForeignKey(
+        Region,
+        on_delete=models.CASCADE,
+        related_name="tombstones",
+        verbose_name=_("region"),
+    )
+    language = models.ForeignKey(
+        Language,
+        on_delete=models.CASCADE,
+        related_name="tombstones",
+        verbose_name=_("language"),
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        verbose_name=_("content type"),
+    )
+    object_id = models.PositiveIntegerField(verbose_name=_("object id"))
+    #: The page, event or location which was removed
+    content_object = GenericForeignKey("content_type", "object_id")
+    path = models.TextField(
+        verbose_name=_("path"),
+        help_text=_("The path under which the content was available in the API"),
+    )
+    #: Manage choices in :mod:`~integreat_cms.cms.constants.tombstone_reasons`
+    reason = models.CharField(
+        max_length=8,
+        choices=tombstone_reasons.CHOICES,
+        verbose_name=_("reason"),
+    )
+    created_date = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("creation date"),
+    )
+    restored_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("restoration date"),
+        help_text=_("The date when the archived content was restored"),
+    )
+
+    def __str__(self):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.__str__` method which would return ``Tombstone object (id)``.
+        It is used in the Django admin backend and as label for ModelChoiceFields.
+
+        :return: A readable string representation of the tombstone
+        :rtype: str
+        """
+        return f"{self.path} ({self.get_reason_display()})"
+
+    def __repr__(self):
+        """
+        This overwrites the default Django ``__repr__()`` method which would return ``<Tombstone: Tombstone object (id)>``.
+        It is used for logging.
+
+        :return: The canonical string representation of the tombstone
+        :rtype: str
+        """
+        return f"<Tombstone (id: {self.id}, content_type: {self.content_type_id}, object_id: {self.object_id}, path: {self.path}, reason: {self.reason})>"
+
+    class Meta:
+        #: The verbose name of the model
+        verbose_name = _("tombstone")
+        #: The plural verbose name of the model
+        verbose_name_plural = _("tombstones")
+        #: The fields which are used to sort the returned objects of a QuerySet
+        ordering = ["created_date"]
+        #: The default permissions for this model
+        default_permissions = ()
+        #: The indexes of this model
+        indexes = [models.Index(fields=["region", "created_date"])]
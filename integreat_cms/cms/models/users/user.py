@@ -67,6 +67,40 @@ class User(AbstractUser):
             return groups[0].role
         return None
 
+    @cached_property
+    def region_ids(self):
+        """
+        The ids of the regions to which the user has access.
+        Since the user object is loaded once per request, this is evaluated at most once per request and makes the
+        region checks of the page permission predicates (see :mod:`~integreat_cms.cms.rules`) in-memory lookups.
+
+        :return: The ids of the regions of this user
+        :rtype: frozenset [ int ]
+        """
+        return frozenset(self.regions.values_list("id", flat=True))
+
+    @cached_property
+    def editable_page_ids(self):
+        """
+        The ids of the pages for which the user is explicitly registered as editor (see
+        :func:`~integreat_cms.cms.rules.is_page_editor`). This is evaluated at most once per request.
+
+        :return: The ids of the editable pages of this user
+        :rtype: frozenset [ int ]
+        """
+        return frozenset(self.editable_pages.values_list("id", flat=True))
+
+    @cached_property
+    def publishable_page_ids(self):
+        """
+        The ids of the pages for which the user is explicitly registered as publisher (see
+        :func:`~integreat_cms.cms.rules.is_page_publisher`). This is evaluated at most once per request.
+
+        :return: The ids of the publishable pages of this user
+        :rtype: frozenset [ int ]
+        """
+        return frozenset(self.publishable_pages.values_list("id", flat=True))
+
     @property
     def full_user_name(self):
         """
@@ -15,6 +15,13 @@ For a given user and page, the following permissions are added:
     * :func:`~integreat_cms.cms.rules.can_publish_all_pages`
     * :func:`~integreat_cms.cms.rules.is_page_publisher`
 
+The predicates only read the ids of the user's regions and explicitly assigned pages, which are cached on the user object
+(see :attr:`~integreat_cms.cms.models.users.user.User.region_ids`,
+:attr:`~integreat_cms.cms.models.users.user.User.editable_page_ids` and
+:attr:`~integreat_cms.cms.models.users.user.User.publishable_page_ids`).
+Since the user is loaded once per request, checking the permissions for all pages of the page tree does not require
+additional queries per page.
+
 See the project's `README <https://github.com/dfunckt/django-rules/blob/master/README.rst>`_ to learn more.
 """
 from rules import add_perm, predicate
@@ -39,7 +46,7 @@ def is_page_editor(user, page):
     """
     if not page:
         return False
-    return user in page.editors.all()
+    return page.id in user.editable_page_ids
 
 
 @predicate
@@ -58,7 +65,7 @@ def is_page_publisher(user, page):
     """
     if not page:
         return False
-    return user in page.publishers.all()
+    return page.id in user.publishable_page_ids
 
 
 @predicate
@@ -76,7 +83,7 @@ def can_edit_all_pages(user, page):
     :rtype: bool
     """
     if not (user.is_superuser or user.is_staff):
-        if page and page.region not in user.regions.all():
+        if page and page.region_id not in user.region_ids:
             return False
     return user.has_perm("cms.change_page")
 
@@ -96,7 +103,7 @@ def can_publish_all_pages(user, page):
     :rtype: bool
     """
     if not (user.is_superuser or user.is_staff):
-        if page and page.region not in user.regions.all():
+        if page and page.region_id not in user.region_ids:
             return False
     return user.has_perm("cms.publish_page")
 
@@ -115,9 +122,9 @@ def is_in_responsible_organization(user, page):
     :return: Whether or not ``user`` is a member of ``page.organization``
     :rtype: bool
     """
-    if not page or not page.organization:
+    if not page or not page.organization_id:
         return False
-    return user in page.organization.members.all()
+    return page.organization_id == user.organization_id
 
 
 @predicate
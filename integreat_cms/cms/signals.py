@@ -0,0 +1,148 @@
+"""
+This module contains signal handlers which invalidate the cached translation coverage of a region whenever its pages or
+its language tree change (see :mod:`~integreat_cms.cms.utils.translation_coverage`) and which keep the flags of the
+latest revisions up to date when revisions are deleted (see :mod:`~integreat_cms.cms.utils.latest_revisions`).
+Additionally, the PDF documents which contain a page are pre-warmed after the page was published (see
+:mod:`~integreat_cms.cms.utils.pdf_prewarm`).
+"""
+import logging
+
+from functools import partial
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .constants import status
+from .models import (
+    EventTranslation,
+    ImprintPageTranslation,
+    LanguageTreeNode,
+    Page,
+    PageTranslation,
+    POITranslation,
+)
+from .utils.latest_revisions import (
+    LATEST,
+    LATEST_MAJOR_PUBLIC,
+    LATEST_PUBLIC,
+    update_latest_revision_flags,
+)
+from .utils.pdf_prewarm import schedule_prewarm
+from .utils.revision_retention import REVISION_MODELS
+from .utils.translation_coverage import invalidate_translation_coverage
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=PageTranslation)
+@receiver(post_delete, sender=PageTranslation)
+def page_translation_changed(sender, instance, **kwargs):
+    """
+    Invalidate the translation coverage of the translation's region
+
+    :param sender: The class of the page translation
+    :type sender: type
+
+    :param instance: The page translation which was saved or deleted
+    :type instance: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    try:
+        invalidate_translation_coverage(instance.page.region)
+    except ObjectDoesNotExist:
+        # When the page is deleted, the cache is invalidated by the page's signal handler
+        logger.debug("Could not determine region of deleted translation %r", sender)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=PageTranslation)
+def page_translation_published(sender, instance, raw, **kwargs):
+    """
+    Schedule the pre-warming of the PDF documents which contain the page of a published translation
+
+    :param sender: The class of the page translation
+    :type sender: type
+
+    :param instance: The page translation which was saved
+    :type instance: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+
+    :param raw: Whether the translation is saved exactly as presented (e.g. when loading fixtures)
+    :type raw: bool
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    if raw or not settings.PDF_PREWARM_CONCURRENCY:
+        return
+    if instance.status == status.PUBLIC:
+        # The documents can only be rendered after the translation is visible to other database connections
+        transaction.on_commit(
+            partial(schedule_prewarm, instance.page.region_id, instance.page_id)
+        )
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=Page)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=LanguageTreeNode)
+@receiver(post_delete, sender=LanguageTreeNode)
+def region_pages_changed(sender, instance, **kwargs):
+    """
+    Invalidate the translation coverage of the region of a page or language tree node
+
+    :param sender: The class of the changed object
+    :type sender: type
+
+    :param instance: The page or language tree node which was saved or deleted
+    :type instance: ~integreat_cms.cms.models.pages.page.Page or
+                    ~integreat_cms.cms.models.languages.language_tree_node.LanguageTreeNode
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    try:
+        invalidate_translation_coverage(instance.region)
+    except ObjectDoesNotExist:
+        # When the region is deleted, its cache expires automatically
+        logger.debug("Could not determine region of deleted object %r", sender)
+
+
+# pylint: disable=unused-argument
+@receiver(post_delete, sender=PageTranslation)
+@receiver(post_delete, sender=ImprintPageTranslation)
+@receiver(post_delete, sender=EventTranslation)
+@receiver(post_delete, sender=POITranslation)
+def flagged_revision_deleted(sender, instance, **kwargs):
+    """
+    Update the flags of the latest revisions of a translation when one of the flagged revisions is deleted
+
+    :param sender: The class of the translation
+    :type sender: type
+
+    :param instance: The revision which was deleted
+    :type instance: ~integreat_cms.cms.models.pages.page_translation.PageTranslation,
+                    ~integreat_cms.cms.models.pages.imprint_page_translation.ImprintPageTranslation,
+                    ~integreat_cms.cms.models.events.event_translation.EventTranslation or
+                    ~integreat_cms.cms.models.pois.poi_translation.POITranslation
+
+    :param kwargs: The supplied keyword arguments
+    :type kwargs: dict
+    """
+    if any(
+        getattr(instance, flag) for flag in [LATEST, LATEST_PUBLIC, LATEST_MAJOR_PUBLIC]
+    ):
+        foreign_key = dict(REVISION_MODELS)[sender]
+        update_latest_revision_flags(
+            sender.objects.filter(
+                **{
+                    f"{foreign_key}_id": getattr(instance, f"{foreign_key}_id"),
+                    "language_id": instance.language_id,
+                }
+            )
+        )
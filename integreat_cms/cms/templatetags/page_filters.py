@@ -56,3 +56,23 @@ def get_highest_anscentor_in(node, pageset):
     if node.parent in pageset:
         return get_highest_anscentor_in(node.parent, pageset)
     return node
+
+
+@register.simple_tag
+def get_translation_status(translation_status_matrix, page, language):
+    """
+    This tag returns the translation status of a page in a language.
+
+    :param translation_status_matrix: The translation states of all pages of the current region
+    :type translation_status_matrix: ~integreat_cms.cms.utils.translation_status_matrix.TranslationStatusMatrix
+
+    :param page: The requested page
+    :type page: ~integreat_cms.cms.models.pages.page.Page
+
+    :param language: The requested language
+    :type language: ~integreat_cms.cms.models.languages.language.Language
+
+    :return: The translation status of the page (choices: :mod:`~integreat_cms.cms.constants.translation_status`)
+    :rtype: str
+    """
+    return translation_status_matrix.get_status(page, language)
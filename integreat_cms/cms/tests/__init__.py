@@ -3,7 +3,9 @@ We use unit tests to validate that the functionality of the cms works as expecte
 
 For more information, see :doc:`topics/testing/index` and :doc:`topics/testing/overview`.
 """
+from .events import *
 from .pages import *
+from .regions import *
 from .views.admin_view_test import AdminViewTest
 from .views.api_view_test import APIViewTest
 from .views.region_view_test import RegionViewTest
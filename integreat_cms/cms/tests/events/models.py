@@ -0,0 +1,115 @@
+"""
+This is a collection of unit tests for the event models.
+"""
+from datetime import date, timedelta
+from itertools import product
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import frequency, status
+from ...models import Event, EventOccurrence, RecurrenceRule
+
+
+class RecurrenceRuleTest(SimpleTestCase):
+    """
+    Unit test for the recurrence rule model
+    """
+
+    def test_iter_between_matches_iter_after(self):
+        """
+        The jump-ahead of iter_between returns the same recurrences as iterating all recurrences with iter_after
+        """
+        for start_date, rule_frequency, interval, window_start in product(
+            [date(2000, 2, 29), date(2011, 1, 31), date(2019, 12, 30)],
+            [frequency.DAILY, frequency.WEEKLY, frequency.MONTHLY, frequency.YEARLY],
+            [1, 2, 3],
+            [date(1999, 6, 1), date(2021, 3, 1), date(2046, 2, 27)],
+        ):
+            recurrence_rule = RecurrenceRule(
+                frequency=rule_frequency,
+                interval=interval,
+                weekdays_for_weekly=[4, 0, 2],
+                weekday_for_monthly=3,
+                week_for_monthly=4,
+            )
+            Event(
+                start_date=start_date,
+                end_date=start_date,
+                recurrence_rule=recurrence_rule,
+            )
+            window_end = window_start + timedelta(days=3000)
+            expected = []
+            for recurrence_date in recurrence_rule.iter_after(start_date):
+                if recurrence_date > window_end:
+                    break
+                if recurrence_date >= window_start:
+                    expected.append(recurrence_date)
+            self.assertEqual(
+                list(recurrence_rule.iter_between(window_start, window_end)),
+                expected,
+            )
+
+
+class EventOccurrenceTest(TestCase):
+    """
+    Unit test for the precomputed occurrences of recurring events
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Precompute the occurrences of the recurring test event
+        """
+        self.event = Event.objects.filter(recurrence_rule__isnull=False).first()
+        EventOccurrence.update_occurrences([self.event])
+
+    def test_occurrences_match_recurrence_rule(self):
+        """
+        The occurrences of each public translation are the recurrences of the rule without the original start date
+        """
+        translation = self.event.get_public_translation("de")
+        occurrences = self.event.occurrences.filter(language=translation.language)
+        self.assertEqual(
+            [occurrence.start_date for occurrence in occurrences],
+            list(EventOccurrence.calculate_dates(self.event, timezone.now().date())),
+        )
+        for occurrence in occurrences:
+            self.assertEqual(
+                occurrence.slug, f"{translation.slug}-{occurrence.start_date}"
+            )
+
+    def test_update_on_save(self):
+        """
+        Saving the recurrence rule or a translation updates the occurrences
+        """
+        translation = self.event.get_public_translation("de")
+        translation.pk = None
+        translation.version += 1
+        translation.slug = "new-slug"
+        translation.status = status.PUBLIC
+        with disable_listeners():
+            translation.save()
+        self.assertTrue(
+            all(
+                occurrence.slug.startswith("new-slug-")
+                for occurrence in self.event.occurrences.filter(
+                    language=translation.language
+                )
+            )
+        )
+        recurrence_rule = self.event.recurrence_rule
+        recurrence_rule.recurrence_end_date = self.event.start_date
+        recurrence_rule.save()
+        self.assertFalse(self.event.occurrences.exists())
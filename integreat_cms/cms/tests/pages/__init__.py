@@ -2,3 +2,8 @@
 This package contains all unit tests for pages.
 """
 from .models import *
+from .translation_status_matrix import *
+from .translation_coverage import *
+from .revision_retention import *
+from .page_permissions import *
+from .pdf_export_queue import *
@@ -1,9 +1,18 @@
 """
 This is a collection of unit tests for the page and page translation model.
 """
+from io import StringIO
 
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import status
 from ...models import Page, PageTranslation, Region
+from ...models.pages.abstract_base_page_translation import (
+    AbstractBasePageTranslation,
+)
 
 
 class PageTest(TestCase):
@@ -32,6 +41,33 @@ class PageTest(TestCase):
         """
         self.assertTrue(self.page3.depth == 2)
 
+    def test_archived_pages(self):
+        """
+        Descendants of archived pages are archived as well, even if they are archived explicitly themselves.
+        """
+        page4 = Page.objects.create(region=self.region)
+        Page.objects.filter(id__in=[self.page2.id, self.page3.id]).update(
+            explicitly_archived=True
+        )
+        # The archived intervals are only queried once for both querysets
+        with self.assertNumQueries(3):
+            archived_pages = list(self.region.get_pages(archived=True))
+            non_archived_pages = list(self.region.get_pages())
+        self.assertEqual(archived_pages, [self.page2, self.page3])
+        self.assertEqual(non_archived_pages, [self.page1, page4])
+
+    def test_non_archived_descendant_counts(self):
+        """
+        Archived subtrees are not included in the descendant counts.
+        """
+        page4 = Page.objects.create(parent=self.page1, region=self.region)
+        Page.objects.create(parent=page4, region=self.region, explicitly_archived=True)
+        pages = list(self.region.pages.filter(explicitly_archived=False))
+        counts = self.region.get_non_archived_descendant_counts(pages)
+        self.assertEqual(
+            counts, {self.page1.id: 3, self.page2.id: 1, self.page3.id: 0, page4.id: 0}
+        )
+
 
 class PageTranslationTest(TestCase):
     """
@@ -46,3 +82,239 @@ class PageTranslationTest(TestCase):
             aliases=[], push_notification_channels=[], slug="testregion"
         )
         self.pageTranslation = PageTranslation.objects.create()
+
+
+class PageTranslationAncestorPathTest(TestCase):
+    """
+    Unit test for the materialized ancestor paths of page translations
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Materialize the ancestor paths of all translations of the test region
+        """
+        self.region = Region.objects.get(slug="augsburg")
+        for root_page in self.region.pages.filter(parent=None):
+            PageTranslation.update_ancestor_paths(root_page)
+        self.child = self.region.pages.filter(level=1).first()
+
+    def assertPathsMaterialized(self):
+        """
+        Check whether the materialized paths of the region match the dynamically calculated paths
+        """
+        for translation in PageTranslation.objects.filter(page__region=self.region):
+            self.assertEqual(
+                translation.materialized_ancestor_path,
+                translation.calculate_ancestor_path(),
+            )
+
+    def test_slug_change(self):
+        """
+        Changing the slug of a page updates the paths of its descendants
+        """
+        translation = self.child.parent.get_translation("de")
+        translation.pk = None
+        translation.version += 1
+        translation.slug = "new-slug"
+        with disable_listeners():
+            translation.save()
+        self.assertTrue(
+            self.child.get_translation("de").ancestor_path.endswith("new-slug")
+        )
+        self.assertPathsMaterialized()
+
+    def test_move_page(self):
+        """
+        Moving a page updates the paths of its subtree
+        """
+        self.child.move_to(self.region.pages.filter(parent=None).last(), "left")
+        self.assertEqual(self.child.get_translation("de").ancestor_path, "")
+        self.assertPathsMaterialized()
+
+
+class PageTranslationOutdatedStateTest(TestCase):
+    """
+    Unit test for the materialized outdated states of page translations
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Materialize the outdated states of all translations of the test region
+        """
+        self.region = Region.objects.get(slug="augsburg")
+        PageTranslation.update_outdated_states(self.region)
+
+    def assertStatesMaterialized(self):
+        """
+        Check whether the materialized states of the region match the dynamically calculated states
+        """
+        for translation in PageTranslation.objects.filter(page__region=self.region):
+            self.assertEqual(
+                translation.materialized_outdated,
+                AbstractBasePageTranslation.is_outdated_helper.fget(translation),
+            )
+
+    def test_major_public_revision(self):
+        """
+        Saving a major public revision in the source language updates the states of the derived translations
+        """
+        page = self.region.pages.first()
+        translation = page.get_translation(self.region.default_language.slug)
+        translation.pk = None
+        translation.version += 1
+        with disable_listeners():
+            translation.save()
+        self.assertTrue(
+            PageTranslation.get_outdated_translations(
+                self.region,
+                self.region.language_tree_nodes.filter(level=1).first().language,
+            )
+        )
+        self.assertStatesMaterialized()
+
+    def test_language_tree_change(self):
+        """
+        Changing the language tree updates the states of the region
+        """
+        node = self.region.language_tree_nodes.filter(level=2).first()
+        node.move_to(self.region.language_tree_nodes.get(level=0), "last-child")
+        self.assertStatesMaterialized()
+
+
+class PageTranslationRevisionCompressionTest(TestCase):
+    """
+    Unit test for the delta compression of page revisions
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    @override_settings(PAGE_REVISION_COMPRESSION=True)
+    def test_compressed_revisions(self):
+        """
+        Old revisions only store deltas, but their texts can be rebuilt
+        """
+        page = Region.objects.get(slug="augsburg").pages.first()
+        translation = page.get_translation("de")
+        texts = {translation.version: translation.text}
+        for paragraph in range(3):
+            translation.pk = None
+            translation.version += 1
+            translation.status = status.DRAFT
+            translation.text += f"<p>Paragraph {paragraph}</p>"
+            texts[translation.version] = translation.text
+            with disable_listeners():
+                translation.save()
+        revisions = page.translations.filter(language__slug="de")
+        # Only the latest revision and the latest public revision keep their full text
+        self.assertEqual(
+            list(
+                revisions.filter(text_delta__isnull=True).values_list(
+                    "version", flat=True
+                )
+            ),
+            [translation.version, translation.version - 3],
+        )
+        self.assertEqual(
+            {
+                revision.version: revision.text
+                for revision in PageTranslation.decompress_revisions(revisions)
+                if revision.version in texts
+            },
+            texts,
+        )
+
+
+class PageTranslationLatestRevisionTest(TestCase):
+    """
+    Unit test for the flags of the latest revisions of page translations
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Materialize the flags and create a minor public revision and a draft revision of a page
+        """
+        call_command("update_latest_revisions", stdout=StringIO())
+        self.page = Region.objects.get(slug="augsburg").pages.first()
+        self.major_public_revision = self.page.get_public_translation("de")
+        translation = self.page.get_translation("de")
+        for revision_status, minor_edit in [
+            (status.PUBLIC, True),
+            (status.DRAFT, False),
+        ]:
+            translation.pk = None
+            translation.version += 1
+            translation.status = revision_status
+            translation.minor_edit = minor_edit
+            with disable_listeners():
+                translation.save()
+
+    def assertLatestRevisions(self):
+        """
+        Check whether the lookups return the correct revisions
+        """
+        translation = self.page.get_translation("de")
+        public_translation = self.page.get_public_translation("de")
+        self.assertEqual(translation.status, status.DRAFT)
+        self.assertEqual(public_translation.version, translation.version - 1)
+        self.assertEqual(translation.latest_public_revision, public_translation)
+        self.assertEqual(
+            translation.latest_major_public_revision, self.major_public_revision
+        )
+
+    def test_flags(self):
+        """
+        Saving a revision updates the flags of all revisions in the same language
+        """
+        revisions = self.page.translations.filter(language__slug="de")
+        self.assertEqual(revisions.filter(is_latest_revision=True).count(), 1)
+        self.assertEqual(revisions.filter(is_latest_revision__isnull=True).count(), 0)
+        self.assertLatestRevisions()
+
+    def test_unmaterialized_flags(self):
+        """
+        Revisions whose flags are not materialized yet are looked up by their version
+        """
+        PageTranslation.objects.update(
+            is_latest_revision=None,
+            is_latest_public_revision=None,
+            is_latest_major_public_revision=None,
+        )
+        self.assertLatestRevisions()
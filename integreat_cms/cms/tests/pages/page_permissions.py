@@ -0,0 +1,64 @@
+"""
+This is a collection of unit tests for the page-based permissions (see :mod:`~integreat_cms.cms.rules`).
+"""
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ...models import Organization, Page, Region
+
+
+class PagePermissionTest(TestCase):
+    """
+    Unit test for the page permission predicates
+    """
+
+    def setUp(self):
+        """
+        Setup run to create a user who is an editor, a publisher and a member of the responsible organization of
+        different pages
+        """
+        self.region = Region.objects.create(aliases=[], slug="testregion")
+        organization = Organization.objects.create(
+            name="Organization", slug="organization"
+        )
+        self.editable_page = Page.objects.create(region=self.region)
+        self.publishable_page = Page.objects.create(region=self.region)
+        self.organization_page = Page.objects.create(
+            region=self.region, organization=organization
+        )
+        self.other_pages = [Page.objects.create(region=self.region) for _ in range(5)]
+        user = get_user_model().objects.create(
+            username="editor", organization=organization
+        )
+        user.regions.add(self.region)
+        self.editable_page.editors.add(user)
+        self.publishable_page.publishers.add(user)
+        # Load the user like the authentication middleware to start with empty caches
+        self.user = get_user_model().objects.get(id=user.id)
+
+    def test_page_permissions(self):
+        """
+        The explicit page permissions and the organization membership are respected
+        """
+        self.assertTrue(
+            self.user.has_perm("cms.change_page_object", self.editable_page)
+        )
+        self.assertFalse(
+            self.user.has_perm("cms.publish_page_object", self.editable_page)
+        )
+        for page in [self.publishable_page, self.organization_page]:
+            self.assertTrue(self.user.has_perm("cms.change_page_object", page))
+            self.assertTrue(self.user.has_perm("cms.publish_page_object", page))
+        for page in self.other_pages:
+            self.assertFalse(self.user.has_perm("cms.change_page_object", page))
+
+    def test_page_permissions_queries(self):
+        """
+        The permissions of the user are only loaded once and not per page
+        """
+        self.user.has_perm("cms.change_page_object", self.other_pages[0])
+        self.user.has_perm("cms.publish_page_object", self.other_pages[0])
+        with self.assertNumQueries(0):
+            for page in self.other_pages:
+                self.user.has_perm("cms.change_page_object", page)
+                self.user.has_perm("cms.publish_page_object", page)
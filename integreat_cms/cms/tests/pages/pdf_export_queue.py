@@ -0,0 +1,259 @@
+"""
+This is a collection of unit tests for the PDF export and its queue.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from unittest.mock import patch
+
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import pdf_export_status
+from ...models import Page, PageTranslation, Region
+from ...utils.pdf_export_queue import (
+    finish_pdf_job,
+    get_executor,
+    get_pdf_job_response,
+    get_pdf_job_status,
+    get_status_key,
+    submit_pdf_job,
+)
+from ...utils.pdf_prewarm import (
+    get_prewarm_executor,
+    get_prewarm_page_sets,
+    schedule_prewarm,
+)
+from ...utils.pdf_store import (
+    EVICTIONS,
+    HITS,
+    MISSES,
+    get_document_path,
+    get_pdf_response,
+    get_statistics,
+    store_pdf,
+)
+from ...utils.pdf_utils import (
+    get_fragment_key,
+    get_pdf_hash,
+    get_public_translations,
+    render_pdf_html,
+)
+
+
+@override_settings(PDF_EXPORT_WORKERS=1)
+class PdfExportQueueTest(TestCase):
+    """
+    Unit test for :mod:`~integreat_cms.cms.utils.pdf_export_queue`, :mod:`~integreat_cms.cms.utils.pdf_store` and
+    :mod:`~integreat_cms.cms.utils.pdf_prewarm`
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        get_executor().shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        """
+        Use empty caches and an empty PDF store and get a page of the test region
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_settings = override_settings(
+            PDF_STORE_ROOT=os.path.join(cache_dir, "documents"),
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                },
+                "pdf": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir,
+                },
+            },
+        )
+        cache_settings.enable()
+        self.addCleanup(cache_settings.disable)
+        # The local memory cache is shared between all tests
+        cache.clear()
+        self.region = Region.objects.get(slug="augsburg")
+        self.pages = self.region.pages.filter(
+            id=self.region.get_pages()
+            .filter(translations__language__slug="de")
+            .first()
+            .id
+        )
+
+    def test_identical_jobs_are_coalesced(self):
+        """
+        Identical requests are rendered once in a worker process and the document can be downloaded afterwards
+        """
+        with patch(
+            "integreat_cms.cms.utils.pdf_export_queue.render_pdf_html",
+            wraps=render_pdf_html,
+        ) as mocked_render_pdf_html:
+            job_id = submit_pdf_job(self.region, "de", self.pages)
+            self.assertEqual(submit_pdf_job(self.region, "de", self.pages), job_id)
+        self.assertEqual(mocked_render_pdf_html.call_count, 1)
+        deadline = time.monotonic() + 60
+        while (
+            get_pdf_job_status(job_id) == pdf_export_status.PENDING
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.1)
+        self.assertEqual(get_pdf_job_status(job_id), pdf_export_status.FINISHED)
+        response = get_pdf_job_response(job_id)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertTrue(b"".join(response.streaming_content).startswith(b"%PDF"))
+        response.file_to_stream.close()
+        self.assertEqual(get_statistics()[HITS], 0)
+        self.assertEqual(get_statistics()[MISSES], 1)
+        # Only requests for documents which are already stored are counted as hit
+        self.assertEqual(submit_pdf_job(self.region, "de", self.pages), job_id)
+        self.assertEqual(get_statistics()[HITS], 1)
+        self.assertEqual(get_statistics()[MISSES], 1)
+
+    def test_unknown_job(self):
+        """
+        Jobs which were never submitted do not have a status
+        """
+        self.assertIsNone(get_pdf_job_status("0" * 64))
+        self.assertIsNone(get_pdf_job_response("0" * 64))
+
+    def test_pdf_hash(self):
+        """
+        The hash of a document is computed with a single query and only contains pages with a public translation
+        """
+        untranslated_page = Page.objects.create(region=self.region)
+        pages = self.region.pages.all()
+        with self.assertNumQueries(1):
+            pdf_hash, renderable_pages = get_pdf_hash(self.region, "de", pages)
+        self.assertEqual(len(pdf_hash), 64)
+        self.assertIn(self.pages[0], renderable_pages)
+        self.assertNotIn(untranslated_page, renderable_pages)
+        pdf_hash, renderable_pages = get_pdf_hash(
+            self.region, "de", pages.filter(id=untranslated_page.id)
+        )
+        self.assertIsNone(pdf_hash)
+        self.assertFalse(renderable_pages)
+
+    def test_pdf_fragments(self):
+        """
+        The document is assembled from the cached fragments and only changed pages are rendered again
+        """
+        _, pages = get_pdf_hash(self.region, "de", self.region.get_pages())
+        render_pdf_html(self.region, "de", pages)
+        unchanged, changed = get_public_translations(pages, "de").select_related(
+            "page"
+        )[:2]
+        caches["pdf"].set(
+            get_fragment_key(
+                unchanged.id, unchanged.last_updated, unchanged.page.level
+            ),
+            "<p>cached fragment</p>",
+        )
+        PageTranslation.objects.filter(id=changed.id).update(
+            text="<p>changed text</p>", last_updated=timezone.now()
+        )
+        _, html = render_pdf_html(self.region, "de", pages)
+        self.assertIn("<p>cached fragment</p>", html)
+        self.assertIn("<p>changed text</p>", html)
+
+    @override_settings(PDF_STORE_MAX_SIZE=20)
+    def test_pdf_store_eviction(self):
+        """
+        The least recently used documents are evicted when the size limit is exceeded
+        """
+        for index, pdf_hash in enumerate(["a", "b"]):
+            store_pdf(pdf_hash, f"{pdf_hash}.pdf", b"%PDF-1.4\n")
+            os.utime(get_document_path(pdf_hash), (index, index))
+        get_pdf_response("a").file_to_stream.close()
+        store_pdf("c", "c.pdf", b"%PDF-1.4\n")
+        self.assertIsNotNone(get_document_path("a"))
+        self.assertIsNone(get_document_path("b"))
+        self.assertIsNotNone(get_document_path("c"))
+        statistics = get_statistics()
+        self.assertEqual(statistics[EVICTIONS], 1)
+        self.assertEqual(statistics["bytes"], 18)
+        self.assertEqual(statistics["documents"], 2)
+
+    def test_claimed_job(self):
+        """
+        Jobs which were claimed by another process are not rendered again
+        """
+        job_id, _ = get_pdf_hash(self.region, "de", self.pages)
+        cache.add(get_status_key(job_id), pdf_export_status.PENDING)
+        with patch(
+            "integreat_cms.cms.utils.pdf_export_queue.get_executor"
+        ) as mocked_get_executor:
+            self.assertEqual(submit_pdf_job(self.region, "de", self.pages), job_id)
+        mocked_get_executor.assert_not_called()
+        self.assertEqual(get_pdf_job_status(job_id), pdf_export_status.PENDING)
+
+    def test_pdf_store_long_filename(self):
+        """
+        Documents with filenames which exceed the length limit of the file system are stored and served under their
+        filename
+        """
+        filename = "Integreat - Deutsch - " + "ä" * 300 + ".pdf"
+        store_pdf("a", filename, b"%PDF-1.4\n")
+        response = get_pdf_response("a", as_attachment=True)
+        response.file_to_stream.close()
+        self.assertIn("filename*=utf-8''", response["Content-Disposition"])
+        self.assertIn("%C3%A4" * 300, response["Content-Disposition"])
+
+    def test_failed_pdf_store(self):
+        """
+        Jobs whose document cannot be stored are marked as failed
+        """
+        with patch(
+            "integreat_cms.cms.utils.pdf_export_queue.store_pdf",
+            side_effect=OSError,
+        ):
+            finish_pdf_job("a", "a.pdf", b"%PDF-1.4\n")
+        self.assertEqual(get_pdf_job_status("a"), pdf_export_status.FAILED)
+
+    def test_prewarm_page_sets(self):
+        """
+        The document of all pages and the documents of the subtrees which contain a published page are pre-warmed
+        """
+        page = self.region.get_pages().filter(level=1).first()
+        page_sets = get_prewarm_page_sets(self.region, {page.id})
+        self.assertQuerysetEqual(
+            page_sets[0], self.region.get_pages(), transform=lambda x: x
+        )
+        self.assertEqual(
+            [list(pages) for pages in page_sets[1:]],
+            [
+                list(ancestor.get_descendants(include_self=True))
+                for ancestor in page.get_ancestors(include_self=True)
+            ],
+        )
+
+    @override_settings(PDF_PREWARM_DELAY=0.1)
+    def test_prewarm_is_debounced(self):
+        """
+        Pages which are published in quick succession are pre-warmed in a single run
+        """
+        with patch(
+            "integreat_cms.cms.utils.pdf_prewarm.prewarm_region"
+        ) as mocked_prewarm_region:
+            schedule_prewarm(self.region.id, 1)
+            schedule_prewarm(self.region.id, 2)
+            time.sleep(0.5)
+            get_prewarm_executor().submit(time.sleep, 0).result()
+        mocked_prewarm_region.assert_called_once_with(self.region.id, {1, 2})
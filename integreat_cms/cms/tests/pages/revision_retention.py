@@ -0,0 +1,100 @@
+"""
+This is a collection of unit tests for the retention policy of page revisions.
+"""
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import status
+from ...models import PageTranslation, Region
+from ...utils.revision_retention import prune_revisions
+
+
+class RevisionRetentionTest(TestCase):
+    """
+    Unit test for :mod:`~integreat_cms.cms.utils.revision_retention`
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Create two minor draft revisions in each of the four weeks before the current week and a recent minor draft
+        revision
+        """
+        self.page = Region.objects.get(slug="augsburg").pages.first()
+        translation = self.page.get_translation("de")
+        self.public_version = translation.version
+        now = timezone.now()
+        monday = now - timedelta(days=now.weekday())
+        self.dates = [
+            monday - timedelta(weeks=weeks) + timedelta(days=days)
+            for weeks in [4, 3, 2, 1]
+            for days in [0, 1]
+        ] + [now]
+        self.texts = {}
+        for date in self.dates:
+            translation.pk = None
+            translation.version += 1
+            translation.status = status.DRAFT
+            translation.minor_edit = True
+            translation.text += f"<p>{date}</p>"
+            with disable_listeners():
+                translation.save()
+            PageTranslation.objects.filter(id=translation.id).update(last_updated=date)
+            self.texts[date] = translation.text
+
+    def assertRevisionsPruned(self):
+        """
+        Check that only the public revision, the latest revision of each old week and the recent revision are kept
+        """
+        revisions = PageTranslation.decompress_revisions(
+            self.page.translations.filter(language__slug="de")
+        )
+        self.assertEqual(
+            [revision.version for revision in revisions],
+            list(range(revisions[0].version, 0, -1)),
+        )
+        self.assertEqual(revisions[-self.public_version].status, status.PUBLIC)
+        self.assertEqual(
+            [revision.text for revision in revisions[: -self.public_version]],
+            [self.texts[date] for date in self.dates[-1:] + self.dates[-2::-2]],
+        )
+
+    @override_settings(REVISION_RETENTION_DAYS=5)
+    def test_prune_revisions(self):
+        """
+        Old minor draft revisions are thinned out to one revision per week and renumbered
+        """
+        self.assertEqual(prune_revisions(PageTranslation, "page")[0], 4)
+        self.assertRevisionsPruned()
+
+    @override_settings(REVISION_RETENTION_DAYS=5, PAGE_REVISION_COMPRESSION=True)
+    def test_prune_compressed_revisions(self):
+        """
+        The deltas of compressed revisions are updated when their newer revision is pruned
+        """
+        PageTranslation.compress_revisions(
+            self.page.id, self.page.get_translation("de").language_id
+        )
+        prune_revisions(PageTranslation, "page")
+        self.assertRevisionsPruned()
+
+    @override_settings(REVISION_RETENTION_DAYS=5)
+    def test_keep_major_revisions(self):
+        """
+        Old draft revisions which are not marked as minor edit are never pruned
+        """
+        self.page.translations.filter(language__slug="de").update(minor_edit=False)
+        self.assertEqual(prune_revisions(PageTranslation, "page")[0], 0)
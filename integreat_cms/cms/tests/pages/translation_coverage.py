@@ -0,0 +1,82 @@
+"""
+This is a collection of unit tests for the translation coverage of regions.
+"""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import translation_status
+from ...models import Region
+from ...utils.translation_coverage import OUTDATED_WORDS, get_translation_coverage
+from ...utils.translation_status_matrix import TranslationStatusMatrix
+
+
+class TranslationCoverageTest(TestCase):
+    """
+    Unit test for :mod:`~integreat_cms.cms.utils.translation_coverage`
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Clear the cache and get the test region
+        """
+        cache.clear()
+        self.region = Region.objects.get(slug="augsburg")
+
+    def assertCoverageMatchesMatrix(self):
+        """
+        Check whether the translation coverage matches the states of the translation status matrix
+        """
+        coverage = get_translation_coverage(self.region)
+        matrix = TranslationStatusMatrix(self.region)
+        for language in self.region.languages:
+            expected = {status: 0 for status, _ in translation_status.CHOICES}
+            expected[OUTDATED_WORDS] = 0
+            for page in self.region.pages.all():
+                status = matrix.get_status(page, language)
+                expected[status] += 1
+                if status == translation_status.OUTDATED:
+                    expected[OUTDATED_WORDS] += len(
+                        page.get_translation(language.slug).text.split()
+                    )
+            self.assertEqual(coverage[language.id], expected)
+
+    def test_coverage(self):
+        """
+        The translation coverage is calculated correctly and cached
+        """
+        self.assertCoverageMatchesMatrix()
+        with self.assertNumQueries(0):
+            get_translation_coverage(self.region)
+
+    def test_invalidation(self):
+        """
+        Saving a new major revision in the source language invalidates the cached coverage
+        """
+        get_translation_coverage(self.region)
+        translation = self.region.pages.first().get_translation(
+            self.region.default_language.slug
+        )
+        translation.pk = None
+        translation.version += 1
+        with disable_listeners():
+            translation.save()
+        self.assertCoverageMatchesMatrix()
+        self.assertTrue(
+            any(
+                language_coverage[translation_status.OUTDATED]
+                for language_coverage in get_translation_coverage(self.region).values()
+            )
+        )
@@ -0,0 +1,100 @@
+"""
+This is a collection of unit tests for the translation status matrix of the page tree.
+"""
+
+from django.test import TestCase
+
+from linkcheck.listeners import disable_listeners
+
+from ...constants import translation_status
+from ...models import PageTranslation, Region
+from ...utils.translation_status_matrix import TranslationStatusMatrix
+
+
+class TranslationStatusMatrixTest(TestCase):
+    """
+    Unit test for the :class:`~integreat_cms.cms.utils.translation_status_matrix.TranslationStatusMatrix`
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Create outdated translations and translations which are currently being translated
+        """
+        self.region = Region.objects.get(slug="augsburg")
+        pages = list(self.region.pages.all())
+        with disable_listeners():
+            # Update the source translation of the first pages to make their translations outdated
+            for page in pages[:3]:
+                translation = page.get_translation(self.region.default_language.slug)
+                translation.pk = None
+                translation.version += 1
+                translation.save()
+            # Mark some translations as currently being translated
+            for page in pages[1:5]:
+                translation = page.translations.exclude(
+                    language=self.region.default_language
+                ).first()
+                if translation:
+                    translation.currently_in_translation = True
+                    translation.save()
+
+    def get_expected_status(self, page, language):
+        """
+        Calculate the translation status with the properties of the page translation model
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language: The requested language
+        :type language: ~integreat_cms.cms.models.languages.language.Language
+
+        :return: The translation status of the page
+        :rtype: str
+        """
+        translation = page.get_translation(language.slug)
+        if not translation:
+            return translation_status.MISSING
+        if translation.currently_in_translation:
+            return translation_status.IN_TRANSLATION
+        if translation.is_outdated:
+            return translation_status.OUTDATED
+        return translation_status.UP_TO_DATE
+
+    def test_matrix_matches_translations(self):
+        """
+        The status of each cell matches the status calculated by the page translation model
+        """
+        matrix = TranslationStatusMatrix(self.region)
+        statuses = set()
+        for page in self.region.pages.all():
+            for language in self.region.languages:
+                status = matrix.get_status(page, language)
+                self.assertEqual(status, self.get_expected_status(page, language))
+                statuses.add(status)
+        self.assertEqual(statuses, {key for key, _ in translation_status.CHOICES})
+
+    def test_constant_queries(self):
+        """
+        The matrix is loaded with one query if the outdated states are materialized
+        """
+        PageTranslation.update_outdated_states(self.region)
+        with self.assertNumQueries(1):
+            matrix = TranslationStatusMatrix(self.region)
+        expected_statuses = {
+            (page, language): self.get_expected_status(page, language)
+            for page in self.region.pages.all()
+            for language in self.region.languages
+        }
+        with self.assertNumQueries(0):
+            for (page, language), expected_status in expected_statuses.items():
+                self.assertEqual(matrix.get_status(page, language), expected_status)
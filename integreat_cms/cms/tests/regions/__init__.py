@@ -0,0 +1,4 @@
+"""
+This package contains all unit tests for regions.
+"""
+from .region_duplication import *
@@ -0,0 +1,100 @@
+"""
+This is a collection of unit tests for the duplication of regions.
+"""
+
+from django.test import TestCase
+
+from linkcheck.listeners import disable_listeners
+
+from ...models import PageTranslation, Region
+from ...utils.region_duplication import duplicate_region
+
+
+class RegionDuplicationTest(TestCase):
+    """
+    Unit test for :mod:`~integreat_cms.cms.utils.region_duplication`
+    """
+
+    fixtures = [
+        "integreat_cms/cms/fixtures/roles.json",
+        "integreat_cms/cms/fixtures/test_data.json",
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        with disable_listeners():
+            super().setUpClass()
+
+    def setUp(self):
+        """
+        Get the source region and create an empty target region
+        """
+        self.source_region = Region.objects.get(slug="augsburg")
+        self.target_region = Region.objects.create(slug="duplicate")
+
+    def assertTreesEqual(self, source_nodes, target_nodes):
+        """
+        Check whether the duplicated nodes have the same structure as the source nodes
+
+        :param source_nodes: The nodes of the source region
+        :type source_nodes: ~mptt.querysets.TreeQuerySet
+
+        :param target_nodes: The nodes of the target region
+        :type target_nodes: ~mptt.querysets.TreeQuerySet
+        """
+        source_nodes = list(source_nodes.order_by("tree_id", "lft"))
+        target_nodes = list(target_nodes.order_by("tree_id", "lft"))
+        self.assertEqual(len(source_nodes), len(target_nodes))
+        node_ids = {None: None}
+        for source_node, target_node in zip(source_nodes, target_nodes):
+            node_ids[source_node.id] = target_node.id
+            self.assertEqual(
+                (source_node.lft, source_node.rght, source_node.level),
+                (target_node.lft, target_node.rght, target_node.level),
+            )
+            self.assertEqual(node_ids[source_node.parent_id], target_node.parent_id)
+            # The tree ids of the duplicates must not be shared with the source region
+            self.assertNotEqual(source_node.tree_id, target_node.tree_id)
+
+    def test_duplicate_region(self):
+        """
+        All language tree nodes, pages and page translations are duplicated
+        """
+        duplicate_region(self.source_region, self.target_region)
+        self.assertTreesEqual(
+            self.source_region.language_tree_nodes.all(),
+            self.target_region.language_tree_nodes.all(),
+        )
+        self.assertTreesEqual(
+            self.source_region.pages.all(), self.target_region.pages.all()
+        )
+        self.assertEqual(
+            PageTranslation.objects.filter(page__region=self.source_region).count(),
+            PageTranslation.objects.filter(page__region=self.target_region).count(),
+        )
+        for page in self.target_region.pages.all():
+            self.assertEqual(page.get_descendant_count(), len(page.get_descendants()))
+
+    def test_duplicate_only_latest_revisions(self):
+        """
+        Only the latest revision of each page translation is duplicated
+        """
+        duplicate_region(
+            self.source_region, self.target_region, only_latest_revisions=True
+        )
+        latest_translations = (
+            PageTranslation.objects.filter(page__region=self.source_region)
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+        )
+        target_translations = PageTranslation.objects.filter(
+            page__region=self.target_region
+        )
+        self.assertEqual(latest_translations.count(), target_translations.count())
+        self.assertEqual(
+            sorted(translation.slug for translation in latest_translations),
+            sorted(translation.slug for translation in target_translations),
+        )
+        self.assertFalse(
+            target_translations.filter(materialized_outdated=None).exists()
+        )
@@ -1,3 +1,5 @@
+from django.test import override_settings
+
 from linkcheck.listeners import disable_listeners
 
 from .view_test import ViewTest
@@ -21,6 +23,8 @@ region_language_views = [
 ]
 
 
+# Render PDF documents synchronously, so the PDF export returns the document instead of the status of the export job
+@override_settings(PDF_EXPORT_WORKERS=0)
 class APIViewTest(ViewTest):
     """
     This test checks whether all api views return status code 200.
@@ -477,6 +477,11 @@ urlpatterns = [
                     pages.get_page_order_table_ajax,
                     name="get_page_order_table_ajax",
                 ),
+                url(
+                    r"^(?P<region_slug>[-\w]+)/(?P<language_slug>[-\w]+)/(?P<page_id>[0-9]+)/subpages$",
+                    pages.get_page_tree_subpages_ajax,
+                    name="get_page_tree_subpages_ajax",
+                ),
                 url(
                     r"^(?P<region_slug>[-\w]+)/search_poi$",
                     events.search_poi_ajax,
@@ -596,6 +601,16 @@ urlpatterns = [
                                             pages.export_pdf,
                                             name="export_pdf",
                                         ),
+                                        url(
+                                            r"^export/(?P<job_id>[0-9a-f]{64})$",
+                                            pages.export_pdf_status,
+                                            name="export_pdf_status",
+                                        ),
+                                        url(
+                                            r"^export/(?P<job_id>[0-9a-f]{64})/download$",
+                                            pages.download_pdf,
+                                            name="download_pdf",
+                                        ),
                                         url(
                                             r"^(?P<page_id>[0-9]+)/",
                                             include(
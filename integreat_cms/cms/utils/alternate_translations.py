@@ -0,0 +1,82 @@
+"""
+This module contains a batch resolver for the alternative languages of translations, which are e.g. used for the
+``available_languages`` of the API endpoints and the alternates of the sitemap.
+"""
+import logging
+
+from ..constants import status
+
+logger = logging.getLogger(__name__)
+
+
+def get_foreign_field(translation_model):
+    """
+    Get the foreign key of a translation model which points to its content object (e.g. ``page``, ``event`` or ``poi``)
+
+    :param translation_model: The model of the translations
+    :type translation_model: type
+
+    :return: The foreign key field of the content object
+    :rtype: ~django.db.models.ForeignKey
+    """
+    return next(
+        field
+        for field in translation_model._meta.fields
+        if field.is_relation and field.remote_field.related_name == "translations"
+    )
+
+
+def prefetch_alternate_translations(translations):
+    """
+    Resolve the latest public translations in all other languages for each of the given translations with one single
+    query, grouped by the content object and the language.
+    The result is stored in the ``_alternate_translations`` attribute of each translation, where it is used by
+    e.g. :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.alternate_translations`.
+
+    All translations have to be instances of the same model.
+
+    :param translations: The translations whose alternatives should be resolved
+    :type translations: list [ ~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation ] or
+                        list [ ~integreat_cms.cms.models.events.event_translation.EventTranslation ] or
+                        list [ ~integreat_cms.cms.models.pois.poi_translation.POITranslation ]
+    """
+    translations = list(translations)
+    if not translations:
+        return
+    translation_model = type(translations[0])
+    foreign_field = get_foreign_field(translation_model)
+    public_translations = {}
+    for public_translation in (
+        translation_model.objects.filter(
+            **{
+                f"{foreign_field.name}__in": {
+                    getattr(translation, foreign_field.attname)
+                    for translation in translations
+                }
+            },
+            status=status.PUBLIC,
+        )
+        .select_related("language", f"{foreign_field.name}__region")
+        .order_by(foreign_field.attname, "language_id", "-version")
+        .distinct(foreign_field.attname, "language_id")
+    ):
+        public_translations.setdefault(
+            getattr(public_translation, foreign_field.attname), []
+        ).append(public_translation)
+    # Sort the alternatives like the default ordering of the language model
+    for alternatives in public_translations.values():
+        alternatives.sort(key=lambda translation: translation.language.bcp47_tag)
+    for translation in translations:
+        # pylint: disable=protected-access
+        translation._alternate_translations = [
+            alternative
+            for alternative in public_translations.get(
+                getattr(translation, foreign_field.attname), []
+            )
+            if alternative.language_id != translation.language_id
+        ]
+    logger.debug(
+        "Resolved the alternate translations of %r %s objects",
+        len(translations),
+        translation_model.__name__,
+    )
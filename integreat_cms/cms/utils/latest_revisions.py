@@ -0,0 +1,113 @@
+"""
+This module contains helpers for the denormalized flags which mark the latest revision, the latest public revision and
+the latest major public revision of each page, imprint, event and location in each language.
+With these flags, the lookups of the current revisions (e.g.
+:meth:`~integreat_cms.cms.models.pages.abstract_base_page.AbstractBasePage.get_translation`) only have to read one row
+of a partial index instead of sorting all revisions of the translation.
+
+The flags are updated in the same transaction whenever a revision is saved (see :func:`update_latest_revision_flags`).
+Revisions whose flags are not materialized yet (e.g. because they were created before the flags existed) have the
+value :obj:`None`. The lookups include these revisions, so they fall back to the newest matching revision until the
+``update_latest_revisions`` management command was run.
+"""
+from django.db import models
+from django.db.models import Case, Q, Value, When
+
+from ..constants import status
+
+#: The flag of the latest revision
+LATEST = "is_latest_revision"
+#: The flag of the latest public revision
+LATEST_PUBLIC = "is_latest_public_revision"
+#: The flag of the latest major public revision
+LATEST_MAJOR_PUBLIC = "is_latest_major_public_revision"
+
+
+def latest_revision_filter(flag):
+    """
+    Get the filter for the flagged revision and all revisions whose flags are not materialized yet
+
+    :param flag: The name of the flag (choices: :attr:`LATEST`, :attr:`LATEST_PUBLIC`, :attr:`LATEST_MAJOR_PUBLIC`)
+    :type flag: str
+
+    :return: The filter of the revisions which can be the requested revision
+    :rtype: ~django.db.models.Q
+    """
+    return Q(**{flag: True}) | Q(**{f"{flag}__isnull": True})
+
+
+def get_latest_revision_indexes(foreign_key, prefix):
+    """
+    Get the partial indexes of the flagged revisions of a translation model
+
+    :param foreign_key: The name of the foreign key to the content object
+    :type foreign_key: str
+
+    :param prefix: The prefix of the index names
+    :type prefix: str
+
+    :return: The indexes
+    :rtype: list [ ~django.db.models.Index ]
+    """
+    return [
+        models.Index(
+            fields=[foreign_key, "language"],
+            condition=latest_revision_filter(flag),
+            name=f"{prefix}_{suffix}",
+        )
+        for flag, suffix in [
+            (LATEST, "latest"),
+            (LATEST_PUBLIC, "latest_public"),
+            (LATEST_MAJOR_PUBLIC, "latest_major"),
+        ]
+    ]
+
+
+def get_latest_revision_ids(revisions):
+    """
+    Determine the ids of the latest revision, the latest public revision and the latest major public revision
+
+    :param revisions: All revisions of a content object in one language
+    :type revisions: ~django.db.models.query.QuerySet
+
+    :return: The ids of the flagged revisions indexed by the name of their flag
+    :rtype: dict
+    """
+    revision_ids = dict.fromkeys([LATEST, LATEST_PUBLIC, LATEST_MAJOR_PUBLIC])
+    for revision_id, revision_status, minor_edit in revisions.order_by(
+        "-version"
+    ).values_list("id", "status", "minor_edit"):
+        revision_ids[LATEST] = revision_ids[LATEST] or revision_id
+        if revision_status == status.PUBLIC:
+            revision_ids[LATEST_PUBLIC] = revision_ids[LATEST_PUBLIC] or revision_id
+            if not minor_edit:
+                revision_ids[LATEST_MAJOR_PUBLIC] = (
+                    revision_ids[LATEST_MAJOR_PUBLIC] or revision_id
+                )
+    return revision_ids
+
+
+def update_latest_revision_flags(revisions):
+    """
+    Update the flags of all revisions of a content object in one language with one query for reading the revisions and
+    one update query, which only touches the revisions whose flags changed
+
+    :param revisions: All revisions of a content object in one language
+    :type revisions: ~django.db.models.query.QuerySet
+
+    :return: The ids of the flagged revisions indexed by the name of their flag
+    :rtype: dict
+    """
+    revision_ids = get_latest_revision_ids(revisions)
+    changed = Q(pk__in=[])
+    for flag, revision_id in revision_ids.items():
+        changed |= (Q(id=revision_id) & ~Q(**{flag: True})) | (
+            ~Q(id=revision_id) & ~Q(**{flag: False})
+        )
+    revisions.filter(changed).update(
+        **{
+            flag: Case(When(id=revision_id, then=Value(True)), default=Value(False))
+            for flag, revision_id in revision_ids.items()
+        }
+    )
+    return revision_ids
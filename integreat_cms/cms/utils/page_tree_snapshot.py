@@ -0,0 +1,386 @@
+"""
+This module contains a snapshot of the page tree of a region which is loaded with a constant number of queries.
+It is used by the pages API (see :mod:`~integreat_cms.api.v3.pages`) to avoid issuing several database queries for
+each page, its ancestors and its translations.
+"""
+import logging
+
+from django.conf import settings
+
+from ..constants import status
+from ..models import Page, PageTranslation
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=too-many-instance-attributes
+class PageTreeSnapshot:
+    """
+    In-memory representation of all pages of a region together with their translations.
+
+    On initialization, the snapshot loads:
+
+    * all pages of the region (including their icons)
+    * the slug of the latest revision of each page in each language (required for the ancestor paths of permalinks)
+    * the latest public revision of each page in each language (without the content)
+    * the latest public revisions of all pages in the requested language (including the content)
+    * the latest public revisions of all mirrored pages in the requested language
+
+    Afterwards, all information required to serialize the pages is computed from memory, so the number of queries does
+    not depend on the number of pages or languages of the region.
+    """
+
+    def __init__(self, region, language_slug):
+        """
+        Load the page tree of the given region.
+
+        :param region: The region whose pages should be loaded
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param language_slug: The slug of the requested language
+        :type language_slug: str
+        """
+        self.region = region
+        self.language_slug = language_slug
+        #: All pages of the region in tree order
+        self.pages = list(
+            Page.objects.filter(region=region)
+            .select_related("icon")
+            .order_by("tree_id", "lft")
+        )
+        #: All pages of the region indexed by their id
+        self.pages_by_id = {page.id: page for page in self.pages}
+        # Pages are sorted in tree order, so the parent of each page is always processed before the page itself
+        self._archived_ids = set()
+        for page in self.pages:
+            if page.explicitly_archived or page.parent_id in self._archived_ids:
+                self._archived_ids.add(page.id)
+        # The slugs of the latest revisions of each page in each language
+        self._slugs = {
+            (translation["page_id"], translation["language__slug"]): translation["slug"]
+            for translation in PageTranslation.objects.filter(page__region=region)
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .values("page_id", "language__slug", "slug")
+        }
+        # The id, slug and language tag of the latest public revisions of each page in each language
+        self._public_revisions = {}
+        for translation in (
+            PageTranslation.objects.filter(page__region=region, status=status.PUBLIC)
+            .order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .values("id", "page_id", "language__slug", "language__bcp47_tag", "slug")
+        ):
+            self._public_revisions.setdefault(translation["page_id"], []).append(
+                translation
+            )
+        # Sort the available languages like the default ordering of the language model
+        for revisions in self._public_revisions.values():
+            revisions.sort(key=lambda translation: translation["language__bcp47_tag"])
+        # The full public translations in the requested language
+        self._public_translations = {}
+        for translation in (
+            PageTranslation.objects.filter(
+                page__region=region,
+                language__slug=language_slug,
+                status=status.PUBLIC,
+            )
+            .select_related("language")
+            .order_by("page_id", "-version")
+            .distinct("page_id")
+        ):
+            translation.page = self.pages_by_id[translation.page_id]
+            self._public_translations[translation.page_id] = translation
+        # The public translations of mirrored pages (which might belong to other regions)
+        mirrored_page_ids = {
+            page.mirrored_page_id for page in self.pages if page.mirrored_page_id
+        }
+        self._mirrored_translations = {}
+        if mirrored_page_ids:
+            self._mirrored_translations = {
+                translation.page_id: translation
+                for translation in PageTranslation.objects.filter(
+                    page__in=list(mirrored_page_ids),
+                    language__slug=language_slug,
+                    status=status.PUBLIC,
+                )
+                .order_by("page_id", "-version")
+                .distinct("page_id")
+            }
+        self._ancestor_paths = {}
+
+    @property
+    def non_archived_pages(self):
+        """
+        All pages which are neither explicitly nor implicitly archived in tree order
+
+        :return: The non-archived pages of the region
+        :rtype: list [ ~integreat_cms.cms.models.pages.page.Page ]
+        """
+        return [page for page in self.pages if page.id not in self._archived_ids]
+
+    @property
+    def root_pages(self):
+        """
+        All pages without parents in tree order
+
+        :return: The root pages of the region
+        :rtype: list [ ~integreat_cms.cms.models.pages.page.Page ]
+        """
+        return [page for page in self.pages if not page.parent_id]
+
+    def get_page(self, page_id):
+        """
+        Get a page of the snapshot by its id
+
+        :param page_id: The id of the requested page
+        :type page_id: int
+
+        :return: The page or :obj:`None` if the page is not part of this snapshot
+        :rtype: ~integreat_cms.cms.models.pages.page.Page
+        """
+        return self.pages_by_id.get(page_id)
+
+    def get_descendants_max_depth(self, page, include_self, max_depth):
+        """
+        Return all descendants with depth less or equal to max depth relative to the given page's depth.
+        This is the in-memory equivalent of :meth:`~integreat_cms.cms.models.pages.page.Page.get_descendants_max_depth`.
+
+        :param page: The root of the requested subtree
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param include_self: Whether to include the given page in the result
+        :type include_self: bool
+
+        :param max_depth: The nodes maximum depth in the tree
+        :type max_depth: int
+
+        :return: All descendants of the given page with relative max depth
+        :rtype: list [ ~integreat_cms.cms.models.pages.page.Page ]
+        """
+        return [
+            descendant
+            for descendant in self.pages
+            if descendant.tree_id == page.tree_id
+            and page.lft <= descendant.lft <= page.rght
+            and (include_self or descendant.id != page.id)
+            and descendant.level <= page.level + max_depth
+        ]
+
+    def get_public_translation(self, page):
+        """
+        Get the latest public translation of the given page in the requested language
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :return: The public translation or :obj:`None` if the page has no public translation in the requested language
+        :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+        """
+        return self._public_translations.get(page.id)
+
+    def get_slug(self, page, language_slug):
+        """
+        Get the slug of the latest revision of the given page in the given language.
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language_slug: The slug of the requested language
+        :type language_slug: str
+
+        :return: The slug or :obj:`None` if the page has no translation in the given language
+        :rtype: str
+        """
+        return self._slugs.get((page.id, language_slug))
+
+    def get_ancestor_path(self, page, language_slug):
+        """
+        Get the path of all ancestors of the given page in the given language.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.ancestor_path`.
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language_slug: The slug of the requested language
+        :type language_slug: str
+
+        :return: The relative path to the page
+        :rtype: str
+        """
+        key = (page.id, language_slug)
+        if key not in self._ancestor_paths:
+            parent = self.pages_by_id.get(page.parent_id)
+            if parent:
+                parent_slug = self.get_slug(parent, language_slug) or self.get_slug(
+                    parent, self.region.default_language.slug
+                )
+                self._ancestor_paths[key] = "/".join(
+                    filter(
+                        None,
+                        [self.get_ancestor_path(parent, language_slug), parent_slug],
+                    )
+                )
+            else:
+                self._ancestor_paths[key] = ""
+        return self._ancestor_paths[key]
+
+    def get_permalink(self, page, language_slug, slug):
+        """
+        Get the permalink of a translation of the given page.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.permalink`.
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language_slug: The slug of the translation's language
+        :type language_slug: str
+
+        :param slug: The slug of the translation
+        :type slug: str
+
+        :return: The permalink of the page
+        :rtype: str
+        """
+        return "/".join(
+            filter(
+                None,
+                [
+                    self.region.slug,
+                    language_slug,
+                    self.get_ancestor_path(page, language_slug),
+                    slug,
+                ],
+            )
+        )
+
+    def get_backend_base_link(self, page, language_slug, slug):
+        """
+        Get the absolute link to a translation of the given page on the CMS domain.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.backend_base_link`.
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language_slug: The slug of the translation's language
+        :type language_slug: str
+
+        :param slug: The slug of the translation
+        :type slug: str
+
+        :return: The base link of the page
+        :rtype: str
+        """
+        return (
+            "/".join(
+                filter(
+                    None,
+                    [
+                        settings.BASE_URL,
+                        self.region.slug,
+                        language_slug,
+                        self.get_ancestor_path(page, language_slug),
+                        slug,
+                    ],
+                )
+            )
+            + "/"
+        )
+
+    def get_available_languages(self, page_translation):
+        """
+        Get the other languages in which the page of the given translation has a public translation.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.available_languages`.
+
+        :param page_translation: The requested page translation
+        :type page_translation: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+
+        :return: A dictionary containing the available languages of a page translation
+        :rtype: dict
+        """
+        page = page_translation.page
+        return {
+            other_translation["language__slug"]: {
+                "id": other_translation["id"],
+                "url": self.get_backend_base_link(
+                    page, other_translation["language__slug"], other_translation["slug"]
+                ),
+                "path": "/"
+                + self.get_permalink(
+                    page, other_translation["language__slug"], other_translation["slug"]
+                )
+                + "/",
+            }
+            for other_translation in self._public_revisions.get(page.id, [])
+            if other_translation["language__slug"] != page_translation.language.slug
+        }
+
+    def get_mirrored_page_translation(self, page):
+        """
+        Get the public translation of the page which is mirrored by the given page.
+        This is the in-memory equivalent of
+        :meth:`~integreat_cms.cms.models.pages.page.Page.get_mirrored_page_translation`.
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :return: The translation of the mirrored page or :obj:`None`
+        :rtype: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+        """
+        return self._mirrored_translations.get(page.mirrored_page_id)
+
+    def get_combined_text(self, page_translation):
+        """
+        Combine the text of the given translation with the text of the mirrored page.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.combined_text`.
+
+        :param page_translation: The requested page translation
+        :type page_translation: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+
+        :return: The combined content of this page and the mirrored page
+        :rtype: str
+        """
+        page = page_translation.page
+        mirrored_page_translation = self.get_mirrored_page_translation(page)
+        if not mirrored_page_translation or not mirrored_page_translation.text:
+            return page_translation.text
+        if page.mirrored_page_first:
+            return mirrored_page_translation.text + page_translation.text
+        return page_translation.text + mirrored_page_translation.text
+
+    def get_combined_last_updated(self, page_translation):
+        """
+        Combine the last_updated date of the given translation and of the mirrored page.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.combined_last_updated`.
+
+        :param page_translation: The requested page translation
+        :type page_translation: ~integreat_cms.cms.models.pages.page_translation.PageTranslation
+
+        :return: The last_updated date of this or the mirrored page translation
+        :rtype: ~datetime.datetime
+        """
+        mirrored_page_translation = self.get_mirrored_page_translation(
+            page_translation.page
+        )
+        if (
+            not page_translation.text
+            and mirrored_page_translation
+            and mirrored_page_translation.text
+        ):
+            return mirrored_page_translation.last_updated
+        return page_translation.last_updated
+
+    def __repr__(self):
+        """
+        The canonical string representation of the snapshot
+
+        :return: The canonical string representation of the snapshot
+        :rtype: str
+        """
+        return f"<PageTreeSnapshot (region: {self.region.slug}, language: {self.language_slug}, pages: {len(self.pages)})>"
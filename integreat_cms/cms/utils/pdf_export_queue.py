@@ -0,0 +1,212 @@
+"""
+This module contains the queue of PDF export jobs.
+Rendering a PDF document of a whole region takes a lot of time, so the documents are converted from HTML to PDF in a
+pool of worker processes (see :attr:`~integreat_cms.core.settings.PDF_EXPORT_WORKERS`) instead of the request thread.
+The HTML source is still rendered in the calling thread, because it requires database access, which is not available
+in the worker processes.
+
+The jobs are identified by the hash of their content (see :func:`~integreat_cms.cms.utils.pdf_utils.get_pdf_hash`),
+so identical requests which arrive while a document is being rendered are coalesced into one job.
+The status of the jobs is stored in the default cache and the finished documents are stored in the PDF store (see
+:mod:`~integreat_cms.cms.utils.pdf_store`), so they are shared between all processes of the web server: Callers submit
+a job (see :func:`submit_pdf_job`), poll its status (see :func:`get_pdf_job_status`) and download the finished document
+(see :func:`get_pdf_job_response`).
+A job is claimed by adding its status to the cache, which the Redis cache of production systems does atomically, so
+each document is only rendered by one process. With the local memory cache of development systems, the jobs are only
+coalesced within each process.
+"""
+import logging
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..constants import pdf_export_status
+from .pdf_store import (
+    HITS,
+    MISSES,
+    count_statistic,
+    get_pdf_response,
+    has_pdf,
+    store_pdf,
+)
+from .pdf_utils import get_pdf_hash, render_pdf_document, render_pdf_html
+
+logger = logging.getLogger(__name__)
+
+#: The number of seconds after which a failed job can be submitted again
+FAILED_JOB_TIMEOUT = 60
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor(reset=False):
+    """
+    Get the pool of worker processes of the current process and create it on first use
+
+    :param reset: Whether the current pool is broken and should be replaced
+    :type reset: bool
+
+    :return: The process pool
+    :rtype: ~concurrent.futures.ProcessPoolExecutor
+    """
+    # pylint: disable=global-statement
+    global _executor
+    with _executor_lock:
+        if _executor is None or reset:
+            _executor = ProcessPoolExecutor(max_workers=settings.PDF_EXPORT_WORKERS)
+        return _executor
+
+
+def get_status_key(job_id):
+    """
+    Get the cache key of the status of a job
+
+    :param job_id: The id of the job
+    :type job_id: str
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"pdf-job-{job_id}-status"
+
+
+def finish_pdf_job(job_id, filename, pdf):
+    """
+    Store the result of a job in the PDF store.
+    If the document could not be rendered or stored, the job is marked as failed.
+
+    :param job_id: The id of the job
+    :type job_id: str
+
+    :param filename: The filename of the document
+    :type filename: str
+
+    :param pdf: The rendered PDF document or :obj:`None` if the document could not be rendered
+    :type pdf: bytes
+    """
+    if pdf is None:
+        logger.error("The PDF document %r could not be rendered", filename)
+        cache.set(get_status_key(job_id), pdf_export_status.FAILED, FAILED_JOB_TIMEOUT)
+        return
+    try:
+        store_pdf(job_id, filename, pdf)
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception(e)
+        cache.set(get_status_key(job_id), pdf_export_status.FAILED, FAILED_JOB_TIMEOUT)
+        return
+    cache.delete(get_status_key(job_id))
+    logger.debug("The PDF document %r was rendered", filename)
+
+
+def pdf_job_done(job_id, filename, future):
+    """
+    Callback which is executed when a worker process finished a job
+
+    :param job_id: The id of the job
+    :type job_id: str
+
+    :param filename: The filename of the document
+    :type filename: str
+
+    :param future: The result of the worker process
+    :type future: ~concurrent.futures.Future
+    """
+    try:
+        pdf = future.result()
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception(e)
+        if isinstance(e, BrokenProcessPool):
+            get_executor(reset=True)
+        pdf = None
+    finish_pdf_job(job_id, filename, pdf)
+
+
+def submit_pdf_job(region, language_slug, pages, count=True):
+    """
+    Submit a job to render the PDF document of the given pages.
+    If the document is already rendered or currently being rendered, no new job is submitted.
+    Documents which are already stored are counted as hit of the PDF store, documents which have to be rendered as miss
+    (see :mod:`~integreat_cms.cms.utils.pdf_store`). Requests which join a pending job are not counted.
+
+    :param region: region which requested the pdf document
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :param pages: the pages which were requested
+    :type pages: ~mptt.querysets.TreeQuerySet
+
+    :param count: Whether the submission should be counted in the statistics of the PDF store
+    :type count: bool
+
+    :return: The id of the job or :obj:`None` if none of the pages has a public translation
+    :rtype: str
+    """
+    job_id, pages = get_pdf_hash(region, language_slug, pages)
+    if not job_id:
+        return None
+    # Only submit the job if it does not exist yet (failed jobs expire after FAILED_JOB_TIMEOUT)
+    job_status = get_pdf_job_status(job_id)
+    if job_status:
+        if count and job_status == pdf_export_status.FINISHED:
+            count_statistic(HITS)
+        return job_id
+    filename, html = render_pdf_html(region, language_slug, pages)
+    # Another request might have submitted the same job in the meantime
+    if not cache.add(
+        get_status_key(job_id), pdf_export_status.PENDING, settings.PDF_EXPORT_TIMEOUT
+    ):
+        return job_id
+    if count:
+        count_statistic(MISSES)
+    if not settings.PDF_EXPORT_WORKERS:
+        finish_pdf_job(job_id, filename, render_pdf_document(html))
+        return job_id
+    try:
+        future = get_executor().submit(render_pdf_document, html)
+    except BrokenProcessPool:
+        future = get_executor(reset=True).submit(render_pdf_document, html)
+    future.add_done_callback(partial(pdf_job_done, job_id, filename))
+    logger.debug("Submitted PDF export job %r for %r", job_id, region)
+    return job_id
+
+
+def get_pdf_job_status(job_id):
+    """
+    Get the status of a job
+
+    :param job_id: The id of the job
+    :type job_id: str
+
+    :return: The status of the job (choices: :mod:`~integreat_cms.cms.constants.pdf_export_status`) or :obj:`None` if
+             the job does not exist
+    :rtype: str
+    """
+    if has_pdf(job_id):
+        return pdf_export_status.FINISHED
+    return cache.get(get_status_key(job_id))
+
+
+def get_pdf_job_response(job_id, as_attachment=False):
+    """
+    Get the document of a finished job
+
+    :param job_id: The id of the job
+    :type job_id: str
+
+    :param as_attachment: Whether the document should be offered for download instead of being displayed inline
+    :type as_attachment: bool
+
+    :return: PDF document wrapped in a FileResponse or :obj:`None` if the job is not finished
+    :rtype: ~django.http.FileResponse
+    """
+    return get_pdf_response(job_id, as_attachment=as_attachment)
@@ -0,0 +1,202 @@
+"""
+This module contains the pre-warming of PDF exports.
+Without pre-warming, the first user who requests the PDF document of a region after a page was published has to wait
+until the document is rendered. Therefore, the PDF documents which contain a published page are submitted to the
+queue of PDF export jobs (see :mod:`~integreat_cms.cms.utils.pdf_export_queue`) in the background: The document of all
+pages of the region and the documents of the subtrees which contain the page (as requested by the ``url`` parameter of
+the API, see :func:`~integreat_cms.api.v3.pdf_export.pdf_export`), each in all active languages of the region.
+
+Publications are debounced by :attr:`~integreat_cms.core.settings.PDF_PREWARM_DELAY`, so a burst of edits in one
+region only triggers one pre-warming run (see :func:`schedule_prewarm`).
+The number of regions which are pre-warmed at the same time is limited by
+:attr:`~integreat_cms.core.settings.PDF_PREWARM_CONCURRENCY`, and each run waits for its documents to be finished
+before submitting the next one, so the worker processes remain available for the documents requested by users.
+The debouncing and the limit apply to each process of the web server separately, because the timers and the pool of
+pre-warming threads are kept in memory. If pages of the same region are published via different processes, each of
+them runs its own pre-warming, but every document is still rendered only once, because identical jobs are coalesced
+across processes when the Redis cache is enabled (see :mod:`~integreat_cms.cms.utils.pdf_export_queue`).
+All active regions can be pre-warmed at deploy time with the ``warm_pdf_exports`` management command.
+"""
+import logging
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.db import connection
+
+from ..constants import pdf_export_status
+from ..models import Region
+from .pdf_export_queue import get_pdf_job_status, submit_pdf_job
+
+logger = logging.getLogger(__name__)
+
+#: The number of seconds between two checks whether a pre-warmed document is finished
+PREWARM_POLL_INTERVAL = 1
+
+_executor = None
+_pending_page_ids = {}
+_timers = {}
+_lock = threading.Lock()
+
+
+def get_prewarm_executor():
+    """
+    Get the pool of threads of the current process which pre-warm the PDF documents of regions and create it on first
+    use
+
+    :return: The thread pool
+    :rtype: ~concurrent.futures.ThreadPoolExecutor
+    """
+    # pylint: disable=global-statement
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(settings.PDF_PREWARM_CONCURRENCY, 1),
+                thread_name_prefix="pdf-prewarm",
+            )
+        return _executor
+
+
+def get_prewarm_page_sets(region, page_ids=None):
+    """
+    Get the sets of pages whose PDF documents should be pre-warmed
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param page_ids: The ids of the published pages (if :obj:`None`, only the document of all pages is pre-warmed)
+    :type page_ids: set
+
+    :return: All pages of the region and the subtrees of the published pages and their ancestors
+    :rtype: list [ ~mptt.querysets.TreeQuerySet ]
+    """
+    pages = region.get_pages()
+    page_sets = [pages]
+    if page_ids:
+        # The ancestors of non-archived pages are not archived either
+        for page in pages.filter(id__in=page_ids).get_ancestors(include_self=True):
+            page_sets.append(page.get_descendants(include_self=True))
+    return page_sets
+
+
+def warm_pdf(region, language_slug, pages):
+    """
+    Submit a PDF export job and wait until it is no longer pending
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: The slug of the language
+    :type language_slug: str
+
+    :param pages: The pages of the document
+    :type pages: ~mptt.querysets.TreeQuerySet
+
+    :return: Whether the document is finished
+    :rtype: bool
+    """
+    # Pre-warming is not requested by users, so it is not counted in the statistics of the PDF store
+    job_id = submit_pdf_job(region, language_slug, pages, count=False)
+    if not job_id:
+        return False
+    deadline = time.monotonic() + settings.PDF_EXPORT_TIMEOUT
+    while (
+        get_pdf_job_status(job_id) == pdf_export_status.PENDING
+        and time.monotonic() < deadline
+    ):
+        time.sleep(PREWARM_POLL_INTERVAL)
+    return get_pdf_job_status(job_id) == pdf_export_status.FINISHED
+
+
+def warm_region(region, page_ids=None):
+    """
+    Pre-warm the PDF documents of a region in all its active languages
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param page_ids: The ids of the published pages (if :obj:`None`, only the document of all pages is pre-warmed)
+    :type page_ids: set
+
+    :return: The number of finished documents
+    :rtype: int
+    """
+    language_slugs = region.language_tree_nodes.filter(active=True).values_list(
+        "language__slug", flat=True
+    )
+    page_sets = get_prewarm_page_sets(region, page_ids)
+    return sum(
+        warm_pdf(region, language_slug, pages)
+        for language_slug in language_slugs
+        for pages in page_sets
+    )
+
+
+def prewarm_region(region_id, page_ids=None):
+    """
+    Pre-warm the PDF documents of a region in a thread of the pre-warming pool
+
+    :param region_id: The id of the region
+    :type region_id: int
+
+    :param page_ids: The ids of the published pages (if :obj:`None`, only the document of all pages is pre-warmed)
+    :type page_ids: set
+
+    :return: The number of finished documents
+    :rtype: int
+    """
+    try:
+        region = Region.objects.get(id=region_id)
+        count = warm_region(region, page_ids)
+        logger.debug("Pre-warmed %r PDF documents of %r", count, region)
+        return count
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception(e)
+        return 0
+    finally:
+        # Threads of the pool are not managed by Django, so their database connection has to be closed manually
+        connection.close()
+
+
+def run_prewarm(region_id):
+    """
+    Pre-warm the PDF documents of all pages of a region which were published since the last run
+
+    :param region_id: The id of the region
+    :type region_id: int
+    """
+    with _lock:
+        _timers.pop(region_id, None)
+        page_ids = _pending_page_ids.pop(region_id, None)
+    if page_ids:
+        get_prewarm_executor().submit(prewarm_region, region_id, page_ids)
+
+
+def schedule_prewarm(region_id, page_id):
+    """
+    Schedule the pre-warming of the PDF documents which contain a published page.
+    If another page of the region is published in the same process before
+    :attr:`~integreat_cms.core.settings.PDF_PREWARM_DELAY` passed, the pre-warming is postponed and both pages are
+    pre-warmed in the same run.
+
+    :param region_id: The id of the region
+    :type region_id: int
+
+    :param page_id: The id of the published page
+    :type page_id: int
+    """
+    with _lock:
+        _pending_page_ids.setdefault(region_id, set()).add(page_id)
+        if region_id in _timers:
+            _timers[region_id].cancel()
+        timer = threading.Timer(
+            settings.PDF_PREWARM_DELAY, partial(run_prewarm, region_id)
+        )
+        timer.daemon = True
+        _timers[region_id] = timer
+        timer.start()
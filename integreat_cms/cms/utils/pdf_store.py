@@ -0,0 +1,251 @@
+"""
+This module contains the store of rendered PDF documents.
+The documents are stored as raw files in :attr:`~integreat_cms.core.settings.PDF_STORE_ROOT`, in a directory which is
+named after the hash of their content (see :func:`~integreat_cms.cms.utils.pdf_utils.get_pdf_hash`).
+The document is stored under a fixed name, because its filename contains the title of the page and might exceed the
+length limit of the file system. The filename under which the document is served is stored in a separate file.
+They are served as :class:`~django.http.FileResponse`, so the web server can send them with ``sendfile()`` instead of
+copying them through Python (see ``wsgi.file_wrapper`` in :pep:`3333`).
+
+The total size of the documents is limited by :attr:`~integreat_cms.core.settings.PDF_STORE_MAX_SIZE`.
+The modification time of a document is updated whenever it is served, so the least recently used documents are evicted
+first when a new document would exceed the limit.
+The hits, misses and evictions are counted in the default cache (see the ``pdf_store_stats`` management command).
+With the Redis cache of production systems, the counters are incremented atomically and shared between all processes.
+With the local memory cache of development systems, each process counts separately.
+"""
+import logging
+import os
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import FileResponse
+
+logger = logging.getLogger(__name__)
+
+#: The number of submitted documents which were already stored
+HITS = "hits"
+#: The number of submitted documents which had to be rendered
+MISSES = "misses"
+#: The number of documents which were evicted to stay within the size limit
+EVICTIONS = "evictions"
+
+#: The counted statistics
+STATISTICS = [HITS, MISSES, EVICTIONS]
+
+#: The name of the stored document
+DOCUMENT_NAME = "document.pdf"
+#: The name of the file which contains the filename under which the document is served
+FILENAME_NAME = "filename.txt"
+
+
+def get_statistic_key(statistic):
+    """
+    Get the cache key of a statistic
+
+    :param statistic: The name of the statistic (choices: :attr:`STATISTICS`)
+    :type statistic: str
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"pdf-store-{statistic}"
+
+
+def count_statistic(statistic):
+    """
+    Increment a statistic of the store
+
+    :param statistic: The name of the statistic (choices: :attr:`STATISTICS`)
+    :type statistic: str
+    """
+    key = get_statistic_key(statistic)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The statistics were reset in the meantime
+        cache.set(key, 1, None)
+
+
+def get_document_path(pdf_hash):
+    """
+    Get the path of a stored document
+
+    :param pdf_hash: The hash of the document
+    :type pdf_hash: str
+
+    :return: The path of the document or :obj:`None` if the document is not stored
+    :rtype: str
+    """
+    path = os.path.join(settings.PDF_STORE_ROOT, pdf_hash, DOCUMENT_NAME)
+    if os.path.isfile(path):
+        return path
+    return None
+
+
+def get_document_filename(pdf_hash):
+    """
+    Get the filename under which a stored document is served
+
+    :param pdf_hash: The hash of the document
+    :type pdf_hash: str
+
+    :return: The filename of the document
+    :rtype: str
+    """
+    try:
+        with open(
+            os.path.join(settings.PDF_STORE_ROOT, pdf_hash, FILENAME_NAME),
+            encoding="utf-8",
+        ) as f:
+            return f.read()
+    except FileNotFoundError:
+        return DOCUMENT_NAME
+
+
+def get_documents():
+    """
+    Get all stored documents
+
+    :return: The directory, the size and the time of the last access of each document
+    :rtype: list [ tuple ]
+    """
+    documents = []
+    try:
+        with os.scandir(settings.PDF_STORE_ROOT) as directories:
+            for directory in directories:
+                # Skip temporary directories of documents which are being stored
+                if directory.name.startswith("."):
+                    continue
+                path = get_document_path(directory.name)
+                try:
+                    stat = os.stat(path)
+                except (FileNotFoundError, TypeError):
+                    continue
+                documents.append((directory.path, stat.st_size, stat.st_mtime))
+    except FileNotFoundError:
+        pass
+    return documents
+
+
+def evict_documents(required_size):
+    """
+    Evict the least recently used documents until the given number of bytes fits into the store
+
+    :param required_size: The number of bytes which should be stored
+    :type required_size: int
+    """
+    documents = sorted(get_documents(), key=lambda document: document[2])
+    total_size = sum(size for _, size, _ in documents)
+    for directory, size, _ in documents:
+        if total_size + required_size <= settings.PDF_STORE_MAX_SIZE:
+            break
+        shutil.rmtree(directory, ignore_errors=True)
+        total_size -= size
+        count_statistic(EVICTIONS)
+        logger.debug("Evicted PDF document %r (%r bytes)", directory, size)
+
+
+def store_pdf(pdf_hash, filename, pdf):
+    """
+    Store a rendered document
+
+    :param pdf_hash: The hash of the document
+    :type pdf_hash: str
+
+    :param filename: The filename under which the document is served
+    :type filename: str
+
+    :param pdf: The PDF document
+    :type pdf: bytes
+
+    :raises OSError: If the document could not be written
+    """
+    evict_documents(len(pdf))
+    os.makedirs(settings.PDF_STORE_ROOT, exist_ok=True)
+    # Write the document to a temporary directory first, so it is never served incompletely
+    temp_dir = tempfile.mkdtemp(prefix=".", dir=settings.PDF_STORE_ROOT)
+    try:
+        with open(os.path.join(temp_dir, DOCUMENT_NAME), "wb") as f:
+            f.write(pdf)
+        with open(os.path.join(temp_dir, FILENAME_NAME), "w", encoding="utf-8") as f:
+            f.write(filename)
+    except OSError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    try:
+        os.rename(temp_dir, os.path.join(settings.PDF_STORE_ROOT, pdf_hash))
+    except OSError:
+        # The same document was stored by another process in the meantime
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def has_pdf(pdf_hash):
+    """
+    Check whether a document is stored without counting the access
+
+    :param pdf_hash: The hash of the document
+    :type pdf_hash: str
+
+    :return: Whether the document is stored
+    :rtype: bool
+    """
+    return get_document_path(pdf_hash) is not None
+
+
+def get_pdf_response(pdf_hash, as_attachment=False):
+    """
+    Get a stored document and mark it as recently used.
+    The access is not counted as hit, because the document was already counted when its job was submitted (see
+    :func:`~integreat_cms.cms.utils.pdf_export_queue.submit_pdf_job`).
+
+    :param pdf_hash: The hash of the document
+    :type pdf_hash: str
+
+    :param as_attachment: Whether the document should be offered for download instead of being displayed inline
+    :type as_attachment: bool
+
+    :return: The PDF document wrapped in a FileResponse or :obj:`None` if the document is not stored
+    :rtype: ~django.http.FileResponse
+    """
+    path = get_document_path(pdf_hash)
+    try:
+        # pylint: disable=consider-using-with
+        document = open(path, "rb")
+        os.utime(path)
+    except (FileNotFoundError, TypeError):
+        # The document is not stored or was evicted in the meantime
+        return None
+    return FileResponse(
+        document,
+        as_attachment=as_attachment,
+        filename=get_document_filename(pdf_hash),
+        content_type="application/pdf",
+    )
+
+
+def get_statistics():
+    """
+    Get the statistics of the store
+
+    :return: The counted statistics, the number of stored documents and their total size in bytes
+    :rtype: dict
+    """
+    statistics = {
+        statistic: cache.get(get_statistic_key(statistic), 0)
+        for statistic in STATISTICS
+    }
+    documents = get_documents()
+    statistics["documents"] = len(documents)
+    statistics["bytes"] = sum(size for _, size, _ in documents)
+    return statistics
+
+
+def reset_statistics():
+    """
+    Reset the counted statistics of the store
+    """
+    cache.delete_many([get_statistic_key(statistic) for statistic in STATISTICS])
@@ -1,30 +1,57 @@
 import hashlib
 import logging
 
+from io import BytesIO
+
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.core.cache import caches
-from django.db.models import Min
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest
 from django.template.loader import get_template
-from django.utils.translation import ugettext as _
-from django.views.decorators.cache import never_cache
 
 from xhtml2pdf import pisa
 
-from ..constants import text_directions
-from ..models import Language
+from ..constants import status, text_directions
+from ..models import Language, PageTranslation
+from .latest_revisions import LATEST_PUBLIC, latest_revision_filter
 
 logger = logging.getLogger(__name__)
 
 
-@never_cache
-# pylint: disable=too-many-locals
-def generate_pdf(region, language_slug, pages):
+#: The number of seconds the rendered HTML fragments of the pages are kept in the cache
+PDF_FRAGMENT_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def get_public_translations(pages, language_slug):
+    """
+    Get the latest public translation of each of the given pages with a single query
+
+    :param pages: the requested pages
+    :type pages: ~mptt.querysets.TreeQuerySet
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :return: The public translations
+    :rtype: ~django.db.models.query.QuerySet [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+    """
+    return (
+        PageTranslation.objects.filter(
+            latest_revision_filter(LATEST_PUBLIC),
+            page__in=pages,
+            language__slug=language_slug,
+            status=status.PUBLIC,
+        )
+        .order_by("page_id", "-version")
+        .distinct("page_id")
+    )
+
+
+def get_pdf_hash(region, language_slug, pages):
     """
-    Function for handling a pdf export request for pages.
-    The pages were either selected by cms user or by API request (see :func:`~integreat_cms.api.v3.pdf_export`)
-    For more information on xhtml2pdf, see :doc:`xhtml2pdf:index`
+    Compute the hash which identifies the PDF document of the given pages and determine which of the pages have a public
+    translation in the given language.
+    The ids and last updates of the public translations are retrieved with a single query.
 
     :param region: region which requested the pdf document
     :type region: ~integreat_cms.cms.models.regions.region.Region
@@ -32,53 +59,143 @@ def generate_pdf(region, language_slug, pages):
     :param language_slug: bcp47 slug of the current language
     :type language_slug: str
 
-    :param pages: at least on page to render as PDF document
+    :param pages: the pages which were requested
     :type pages: ~mptt.querysets.TreeQuerySet
 
-    :return: PDF document wrapped in a HtmlResponse
-    :rtype: ~django.http.HttpResponse
+    :return: The hash of the document (or :obj:`None` if none of the pages has a public translation) and the pages which
+             can be rendered
+    :rtype: tuple
     """
+    # get the id and the last update of the latest public translation of each page
+    public_translations = get_public_translations(pages, language_slug).values_list(
+        "page_id", "id", "last_updated"
+    )
     # first all necessary data for hashing are collected, starting at region slug
     # region last_updated field taking into account, to keep track of maybe edited region icons
     pdf_key_list = [region.slug, region.last_updated]
-    for page in pages:
-        # add translation id and last_updated to hash key list if they exist
-        page_translation = page.get_public_translation(language_slug)
-        if page_translation:
-            # if translation for this language exists
-            pdf_key_list.append(page_translation.id)
-            pdf_key_list.append(page_translation.last_updated)
-        else:
-            # if the page has no translation for this language
-            pages = pages.exclude(id=page.id)
+    page_ids = []
+    for page_id, translation_id, last_updated in public_translations:
+        # add translation id and last_updated to hash key list
+        pdf_key_list.append(translation_id)
+        pdf_key_list.append(last_updated)
+        page_ids.append(page_id)
+    if not page_ids:
+        return None, pages.none()
     # finally combine all list entries to a single hash key
     pdf_key_string = "_".join(map(str, pdf_key_list))
     # compute the hash value based on the hash key
     pdf_hash = hashlib.sha256(bytes(pdf_key_string, "utf-8")).hexdigest()
+    return pdf_hash, pages.filter(id__in=page_ids)
+
+
+def get_fragment_key(translation_id, last_updated, level):
+    """
+    Get the cache key of the rendered HTML fragment of a page translation
+
+    :param translation_id: The id of the page translation
+    :type translation_id: int
+
+    :param last_updated: The last update of the page translation
+    :type last_updated: ~datetime.datetime
+
+    :param level: The level of the page, which determines the heading of the fragment
+    :type level: int
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"fragment-{translation_id}-{last_updated.timestamp()}-{level}"
+
+
+def get_pdf_fragments(pages, language_slug):
+    """
+    Get the rendered HTML fragments of the given pages.
+    The fragments are cached by the id and the last update of their page translations, so only the fragments of pages
+    which changed since the last export are rendered again.
+
+    :param pages: the pages with a public translation (see :func:`get_pdf_hash`)
+    :type pages: list [ ~integreat_cms.cms.models.pages.page.Page ]
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :return: The HTML fragments indexed by the page id
+    :rtype: dict
+    """
     cache = caches["pdf"]
-    cached_response = cache.get(pdf_hash, "has_expired")
-    if cached_response != "has_expired":
-        # if django cache already contains a response object
-        return cached_response
-    amount_pages = pages.count()
-    if amount_pages == 0:
-        return HttpResponse(
-            _("No valid pages selected for PDF generation."), status=400
-        )
+    levels = {page.id: page.level for page in pages}
+    fragment_keys = {
+        page_id: get_fragment_key(translation_id, last_updated, levels[page_id])
+        for page_id, translation_id, last_updated in get_public_translations(
+            pages, language_slug
+        ).values_list("page_id", "id", "last_updated")
+    }
+    fragments = cache.get_many(fragment_keys.values())
+    missing_page_ids = [
+        page_id for page_id, key in fragment_keys.items() if key not in fragments
+    ]
+    rendered_fragments = {}
+    if missing_page_ids:
+        template = get_template("pages/_page_pdf_fragment.html")
+        for page_translation in get_public_translations(
+            missing_page_ids, language_slug
+        ):
+            level = levels[page_translation.page_id]
+            key = get_fragment_key(
+                page_translation.id, page_translation.last_updated, level
+            )
+            fragment_keys[page_translation.page_id] = key
+            rendered_fragments[key] = template.render(
+                {"page_translation": page_translation, "level": level}
+            )
+        cache.set_many(rendered_fragments, PDF_FRAGMENT_CACHE_TIMEOUT)
+        fragments.update(rendered_fragments)
+    logger.debug(
+        "Rendered %r of %r PDF fragments", len(rendered_fragments), len(fragment_keys)
+    )
+    return {page_id: fragments.get(key, "") for page_id, key in fragment_keys.items()}
+
+
+def render_pdf_html(region, language_slug, pages):
+    """
+    Render the HTML source of the PDF document of the given pages.
+    The pages were either selected by cms user or by API request (see :func:`~integreat_cms.api.v3.pdf_export`).
+    The document is assembled from the cached fragments of the pages (see :func:`get_pdf_fragments`).
+    The table of contents and the page numbers are generated by xhtml2pdf when the whole document is converted to PDF,
+    so they are always correct.
+
+    :param region: region which requested the pdf document
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :param pages: the pages with a public translation (see :func:`get_pdf_hash`)
+    :type pages: ~mptt.querysets.TreeQuerySet
+
+    :return: The filename and the HTML source of the document
+    :rtype: tuple [ str ]
+    """
+    pages = list(pages)
+    amount_pages = len(pages)
     if amount_pages == 1:
         # If pdf contains only one page, take its title as filename
-        title = pages.first().get_public_translation(language_slug).title
+        title = pages[0].get_public_translation(language_slug).title
     else:
         # If pdf contains multiple pages, check the minimum level
-        min_level = pages.aggregate(Min("level")).get("level__min")
-        # Query all pages with this minimum level
-        min_level_pages = pages.filter(level=min_level)
-        if min_level_pages.count() == 1:
+        min_level = min(page.level for page in pages)
+        # Get all pages with this minimum level
+        min_level_pages = [page for page in pages if page.level == min_level]
+        if len(min_level_pages) == 1:
             # If there's exactly one page with the minimum level, take its title
-            title = min_level_pages.first().get_public_translation(language_slug).title
+            title = min_level_pages[0].get_public_translation(language_slug).title
         else:
             # In any other case, take the region name
             title = region.name
+    # Assemble the document from the rendered fragments of the pages
+    fragments = get_pdf_fragments(pages, language_slug)
+    for page in pages:
+        page.pdf_fragment = fragments.get(page.id, "")
     language = Language.objects.get(slug=language_slug)
     filename = f"Integreat - {language.translated_name} - {title}.pdf"
     context = {
@@ -90,25 +207,30 @@ def generate_pdf(region, language_slug, pages):
         "prevent_italics": ["ar", "fa"],
         "request": HttpRequest(),
     }
-    response = HttpResponse(content_type="application/pdf")
-    response["Content-Disposition"] = f'filename="{filename}"'
-    html = get_template("pages/page_pdf.html").render(context)
+    return filename, get_template("pages/page_pdf.html").render(context)
+
+
+def render_pdf_document(html):
+    """
+    Convert the HTML source of a document to PDF.
+    For more information on xhtml2pdf, see :doc:`xhtml2pdf:index`.
+    This function is executed in the worker processes of the PDF export queue (see
+    :mod:`~integreat_cms.cms.utils.pdf_export_queue`), so it must not access the database.
+
+    :param html: The HTML source of the document (see :func:`render_pdf_html`)
+    :type html: str
+
+    :return: The PDF document or :obj:`None` if the document could not be rendered
+    :rtype: bytes
+    """
+    pdf = BytesIO()
     pisa_status = pisa.CreatePDF(
-        html, dest=response, link_callback=link_callback, encoding="UTF-8"
+        html, dest=pdf, link_callback=link_callback, encoding="UTF-8"
     )
     # pylint: disable=no-member
     if pisa_status.err:
-        logger.error(
-            "The following PDF could not be rendered: %r, %r, %r",
-            region,
-            language,
-            pages,
-        )
-        return HttpResponse(
-            _("The PDF could not be successfully generated."), status=500
-        )
-    cache.set(pdf_hash, response, 60 * 60 * 24)
-    return response
+        return None
+    return pdf.getvalue()
 
 
 # pylint: disable=unused-argument
@@ -0,0 +1,271 @@
+"""
+This module contains helpers to duplicate the content of one region to another with a constant number of queries per
+batch instead of saving every language tree node, page, page translation and media file separately.
+
+The source trees are read once and their ``tree_id``, ``lft``, ``rght`` and ``level`` values are assigned in memory, so
+the objects can be written with :meth:`~django.db.models.query.QuerySet.bulk_create` without triggering the tree
+updates of django-mptt, the cache invalidation and the link check listeners for every single object.
+The links of the duplicated page translations are registered by the next run of the ``findlinks`` management command.
+"""
+import logging
+import os
+
+from django.db import transaction
+from django.db.models import Max
+
+from ..models import Directory, LanguageTreeNode, MediaFile, Page, PageTranslation
+from ..models.media.media_file import upload_path, upload_path_thumbnail
+
+logger = logging.getLogger(__name__)
+
+#: How many objects are written to the database in one query
+DUPLICATION_BATCH_SIZE = 1000
+
+
+def get_next_tree_ids(model, source_tree_ids):
+    """
+    Map the given tree ids of a source region to new tree ids which are not used yet
+
+    :param model: The MPTT model of the trees
+    :type model: type
+
+    :param source_tree_ids: The tree ids of the source region
+    :type source_tree_ids: set [ int ]
+
+    :return: A dict mapping the source tree ids to the new tree ids
+    :rtype: dict
+    """
+    next_tree_id = (model.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0) + 1
+    return {
+        source_tree_id: next_tree_id + index
+        for index, source_tree_id in enumerate(sorted(source_tree_ids))
+    }
+
+
+def bulk_create_by_level(model, objects, parent_ids):
+    """
+    Create the given objects level by level, so the parents exist before their children are inserted
+
+    :param model: The model of the objects
+    :type model: type
+
+    :param objects: Tuples of the level, the source id and the duplicate of each object, whose parent id still refers
+                    to the source objects
+    :type objects: list [ tuple ]
+
+    :param parent_ids: A dict mapping the ids of the source objects to the ids of their duplicates
+    :type parent_ids: dict
+    """
+    levels = {}
+    for level, source_id, duplicate in objects:
+        levels.setdefault(level, []).append((source_id, duplicate))
+    for level in sorted(levels):
+        for _, duplicate in levels[level]:
+            if duplicate.parent_id is not None:
+                duplicate.parent_id = parent_ids[duplicate.parent_id]
+        model.objects.bulk_create(
+            [duplicate for _, duplicate in levels[level]],
+            batch_size=DUPLICATION_BATCH_SIZE,
+        )
+        for source_id, duplicate in levels[level]:
+            parent_ids[source_id] = duplicate.id
+
+
+def reset_instance(instance):
+    """
+    Remove the primary key of the given instance to duplicate it instead of updating it
+
+    :param instance: The model instance
+    :type instance: ~django.db.models.Model
+
+    :return: The id of the source object
+    :rtype: int
+    """
+    source_id = instance.id
+    instance.pk = None
+    instance.id = None
+    # pylint: disable=protected-access
+    instance._state.adding = True
+    return source_id
+
+
+def duplicate_language_tree(source_region, target_region):
+    """
+    Duplicate the language tree of one region to another
+
+    :param source_region: The region from which the language tree should be duplicated
+    :type source_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param target_region: The region to which the language tree should be added
+    :type target_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: The number of duplicated language tree nodes
+    :rtype: int
+    """
+    nodes = list(
+        LanguageTreeNode.objects.filter(region=source_region).order_by("tree_id", "lft")
+    )
+    tree_ids = get_next_tree_ids(LanguageTreeNode, {node.tree_id for node in nodes})
+    objects = []
+    for node in nodes:
+        source_id = reset_instance(node)
+        node.region = target_region
+        node.tree_id = tree_ids[node.tree_id]
+        objects.append((node.level, source_id, node))
+    bulk_create_by_level(LanguageTreeNode, objects, {})
+    return len(nodes)
+
+
+def duplicate_media(source_region, target_region):
+    """
+    Duplicate all media directories and media files of one region to another.
+    The files are copied on the storage, because deleting a media file also deletes its file.
+
+    :param source_region: The region from which the media should be duplicated
+    :type source_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param target_region: The region to which the media should be added
+    :type target_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: A dict mapping the ids of the source media files to the ids of their duplicates
+    :rtype: dict
+    """
+    directories = {
+        directory.id: directory
+        for directory in Directory.objects.filter(region=source_region)
+    }
+    objects = []
+    for directory in directories.values():
+        # Directories are no MPTT models, so their levels are determined in memory
+        level = 0
+        parent_id = directory.parent_id
+        while parent_id in directories:
+            level += 1
+            parent_id = directories[parent_id].parent_id
+        source_id = reset_instance(directory)
+        directory.region = target_region
+        objects.append((level, source_id, directory))
+    directory_ids = {}
+    bulk_create_by_level(Directory, objects, directory_ids)
+
+    source_ids = []
+    media_files = []
+    for media_file in MediaFile.objects.filter(region=source_region):
+        source_file, source_thumbnail = media_file.file, media_file.thumbnail
+        source_id = reset_instance(media_file)
+        media_file.region = target_region
+        media_file.parent_directory_id = directory_ids.get(
+            media_file.parent_directory_id
+        )
+        try:
+            with source_file.open("rb"):
+                media_file.file = source_file.storage.save(
+                    upload_path(media_file, os.path.basename(source_file.name)),
+                    source_file,
+                )
+            if source_thumbnail:
+                with source_thumbnail.open("rb"):
+                    media_file.thumbnail = source_thumbnail.storage.save(
+                        upload_path_thumbnail(media_file, None), source_thumbnail
+                    )
+        except OSError as e:
+            logger.warning("Could not copy the file of %r: %s", source_id, e)
+            continue
+        source_ids.append(source_id)
+        media_files.append(media_file)
+    MediaFile.objects.bulk_create(media_files, batch_size=DUPLICATION_BATCH_SIZE)
+    return {
+        source_id: media_file.id
+        for source_id, media_file in zip(source_ids, media_files)
+    }
+
+
+def duplicate_pages(
+    source_region, target_region, media_file_ids=None, only_latest_revisions=False
+):
+    """
+    Duplicate all pages and page translations of one region to another
+
+    :param source_region: The region from which the pages should be duplicated
+    :type source_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param target_region: The region to which the pages should be added
+    :type target_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param media_file_ids: A dict mapping the ids of the source media files to the ids of their duplicates, which is
+                           used to replace the icons of the pages
+    :type media_file_ids: dict
+
+    :param only_latest_revisions: Whether only the latest revision of each page translation should be duplicated
+    :type only_latest_revisions: bool
+
+    :return: The number of duplicated pages and page translations
+    :rtype: tuple [ int ]
+    """
+    media_file_ids = media_file_ids or {}
+    pages = list(source_region.pages.order_by("tree_id", "lft"))
+    tree_ids = get_next_tree_ids(Page, {page.tree_id for page in pages})
+    objects = []
+    for page in pages:
+        source_id = reset_instance(page)
+        page.region = target_region
+        page.tree_id = tree_ids[page.tree_id]
+        page.icon_id = media_file_ids.get(page.icon_id, page.icon_id)
+        objects.append((page.level, source_id, page))
+    page_ids = {}
+    bulk_create_by_level(Page, objects, page_ids)
+
+    translations = PageTranslation.objects.filter(page__region=source_region)
+    if only_latest_revisions:
+        translations = translations.order_by(
+            "page_id", "language_id", "-version"
+        ).distinct("page_id", "language_id")
+    translation_count = 0
+    batch = []
+    for translation in translations.iterator(chunk_size=DUPLICATION_BATCH_SIZE):
+        reset_instance(translation)
+        translation.page_id = page_ids[translation.page_id]
+        if only_latest_revisions:
+            translation.version = 1
+            # The outdated state might depend on the skipped revisions
+            translation.materialized_outdated = None
+        batch.append(translation)
+        if len(batch) == DUPLICATION_BATCH_SIZE:
+            PageTranslation.objects.bulk_create(batch)
+            translation_count += len(batch)
+            batch = []
+    PageTranslation.objects.bulk_create(batch)
+    translation_count += len(batch)
+    PageTranslation.update_outdated_states(target_region)
+    return len(pages), translation_count
+
+
+def duplicate_region(source_region, target_region, only_latest_revisions=False):
+    """
+    Duplicate the language tree, the media and the pages of one region to another
+
+    :param source_region: The region from which the content should be duplicated
+    :type source_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param target_region: The region to which the content should be added
+    :type target_region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param only_latest_revisions: Whether only the latest revision of each page translation should be duplicated
+    :type only_latest_revisions: bool
+    """
+    logger.info("Duplicate content of %r to %r", source_region, target_region)
+    with transaction.atomic():
+        language_tree_node_count = duplicate_language_tree(source_region, target_region)
+        media_file_ids = duplicate_media(source_region, target_region)
+        page_count, translation_count = duplicate_pages(
+            source_region, target_region, media_file_ids, only_latest_revisions
+        )
+    logger.info(
+        "Duplicated %r language tree nodes, %r media files, %r pages and %r page translations of %r to %r",
+        language_tree_node_count,
+        len(media_file_ids),
+        page_count,
+        translation_count,
+        source_region,
+        target_region,
+    )
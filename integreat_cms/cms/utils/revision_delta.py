@@ -0,0 +1,78 @@
+"""
+This module contains helpers to store the text of old page revisions as compressed deltas (see
+:attr:`~integreat_cms.core.settings.PAGE_REVISION_COMPRESSION`).
+
+A delta describes how the text of a revision can be rebuilt from the text of the next newer revision. The texts are
+split into HTML tokens (everything up to and including the next ``>``), so the deltas of consecutive revisions, which
+usually only differ in a few paragraphs, are very small. Unchanged ranges are stored as ``[start, end]`` token indices
+of the newer text and changed ranges as strings. The resulting list is serialized as JSON and compressed with
+:mod:`zlib`.
+"""
+import difflib
+import json
+import re
+import zlib
+
+#: The pattern which is used to split a text into tokens
+TOKEN_PATTERN = re.compile(r"(?<=>)")
+
+
+def tokenize(text):
+    """
+    Split a text into tokens which end after a closing angle bracket
+
+    :param text: The text
+    :type text: str
+
+    :return: The tokens of the text
+    :rtype: list [ str ]
+    """
+    return TOKEN_PATTERN.split(text)
+
+
+def create_delta(newer_text, older_text):
+    """
+    Create a compressed delta which rebuilds the older text from the newer text
+
+    :param newer_text: The text of the newer revision
+    :type newer_text: str
+
+    :param older_text: The text of the older revision
+    :type older_text: str
+
+    :return: The compressed delta
+    :rtype: bytes
+    """
+    newer_tokens = tokenize(newer_text)
+    older_tokens = tokenize(older_text)
+    delta = []
+    for opcode, i1, i2, j1, j2 in difflib.SequenceMatcher(
+        None, newer_tokens, older_tokens, autojunk=False
+    ).get_opcodes():
+        if opcode == "equal":
+            delta.append([i1, i2])
+        elif j1 < j2:
+            delta.append("".join(older_tokens[j1:j2]))
+    return zlib.compress(json.dumps(delta, separators=(",", ":")).encode())
+
+
+def apply_delta(newer_text, delta):
+    """
+    Rebuild the older text from the newer text and the compressed delta (see :func:`create_delta`)
+
+    :param newer_text: The text of the newer revision
+    :type newer_text: str
+
+    :param delta: The compressed delta
+    :type delta: bytes
+
+    :return: The text of the older revision
+    :rtype: str
+    """
+    newer_tokens = tokenize(newer_text)
+    return "".join(
+        "".join(newer_tokens[operation[0] : operation[1]])
+        if isinstance(operation, list)
+        else operation
+        for operation in json.loads(zlib.decompress(bytes(delta)))
+    )
@@ -0,0 +1,259 @@
+"""
+This module contains helpers to prune old revisions of pages, imprints, events and locations according to the retention
+policy (see :attr:`~integreat_cms.core.settings.REVISION_RETENTION_DAYS`):
+
+* The latest revision, all public revisions and all major revisions (which are not marked as minor edit) are always kept
+* All revisions which were created within the retention period are kept
+* Of the older revisions, only the latest revision of each calendar week is kept
+
+The remaining revisions of each translation are renumbered afterwards, so their versions stay consecutive.
+The revisions are pruned in small transactions (see :attr:`PRUNING_BATCH_SIZE`), so the translation tables are never
+locked for a long time.
+"""
+import logging
+
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Min, Sum
+from django.db.models.functions import Coalesce, Length
+from django.utils import timezone
+
+from ..constants import status
+from ..models import (
+    EventTranslation,
+    ImprintPageTranslation,
+    PageTranslation,
+    POITranslation,
+)
+from .revision_delta import create_delta
+
+logger = logging.getLogger(__name__)
+
+#: After how many pruned revisions the current transaction is committed
+PRUNING_BATCH_SIZE = 500
+
+#: The translation models whose revisions are pruned together with the name of the foreign key to their content object
+REVISION_MODELS = [
+    (PageTranslation, "page"),
+    (ImprintPageTranslation, "page"),
+    (EventTranslation, "event"),
+    (POITranslation, "poi"),
+]
+
+
+def get_pruned_revisions(revisions, retention_date):
+    """
+    Determine which revisions of a translation are not covered by the retention policy
+
+    :param revisions: The status, minor edit flag and last update of all revisions of a translation, ordered from the
+                      newest to the oldest revision, indexed by the revision id
+    :type revisions: dict
+
+    :param retention_date: The date until which all revisions are kept
+    :type retention_date: ~datetime.datetime
+
+    :return: The ids of the revisions which can be deleted
+    :rtype: set [ int ]
+    """
+    pruned = set()
+    kept_weeks = set()
+    for index, (revision_id, (revision_status, minor_edit, last_updated)) in enumerate(
+        revisions.items()
+    ):
+        week = last_updated.isocalendar()[:2]
+        if (
+            index == 0
+            or revision_status == status.PUBLIC
+            or not minor_edit
+            or last_updated >= retention_date
+            or week not in kept_weeks
+        ):
+            kept_weeks.add(week)
+        else:
+            pruned.add(revision_id)
+    return pruned
+
+
+def get_content_size(queryset):
+    """
+    Calculate the approximate size of the text and binary content of the given objects
+
+    :param queryset: The objects
+    :type queryset: ~django.db.models.query.QuerySet
+
+    :return: The size of the content in bytes
+    :rtype: int
+    """
+    fields = [
+        field.attname
+        for field in queryset.model._meta.concrete_fields
+        if isinstance(field, (models.CharField, models.TextField, models.BinaryField))
+    ]
+    return sum(
+        queryset.aggregate(
+            **{field: Coalesce(Sum(Length(field)), 0) for field in fields}
+        ).values()
+    )
+
+
+def recompress_revisions(revisions, pruned):
+    """
+    Update the compressed deltas of page revisions whose next newer revision is pruned (see
+    :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.compress_revisions`)
+
+    :param revisions: All revisions of a page in one language, ordered from the newest to the oldest revision
+    :type revisions: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+
+    :param pruned: The ids of the revisions which are pruned
+    :type pruned: set [ int ]
+
+    :return: The remaining revisions
+    :rtype: list [ ~integreat_cms.cms.models.pages.page_translation.PageTranslation ]
+    """
+    compressed = {
+        revision.id for revision in revisions if revision.text_delta is not None
+    }
+    kept = [
+        revision
+        for revision in PageTranslation.decompress_revisions(revisions)
+        if revision.id not in pruned
+    ]
+    texts = [revision.text for revision in kept]
+    for newer_text, revision in zip(texts, kept[1:]):
+        if revision.id in compressed:
+            revision.text_delta = create_delta(newer_text, revision.text)
+            revision.text = ""
+    return kept
+
+
+def prune_translation_revisions(model, foreign_key, key, pruned):
+    """
+    Delete the pruned revisions of a translation and renumber the remaining revisions
+
+    :param model: The translation model
+    :type model: type
+
+    :param foreign_key: The name of the foreign key to the content object
+    :type foreign_key: str
+
+    :param key: The ids of the content object and the language
+    :type key: tuple
+
+    :param pruned: The ids of the revisions which should be deleted
+    :type pruned: set [ int ]
+    """
+    translations = model.objects.filter(
+        **{f"{foreign_key}_id": key[0], "language_id": key[1]}
+    )
+    first_version = translations.aggregate(Min("version"))["version__min"]
+    fields = ["version"]
+    if (
+        model is PageTranslation
+        and translations.filter(text_delta__isnull=False).exists()
+    ):
+        kept = recompress_revisions(list(translations), pruned)
+        fields += ["text", "text_delta"]
+    else:
+        kept = list(translations.exclude(id__in=pruned).only("id", "version"))
+    model.objects.filter(id__in=pruned).delete()
+    # Keep the versions consecutive, starting with the version of the oldest revision
+    for index, revision in enumerate(reversed(kept)):
+        revision.version = first_version + index
+    model.objects.bulk_update(kept, fields)
+
+
+def prune_batch(model, foreign_key, batch, dry_run):
+    """
+    Prune the revisions of a batch of translations in one transaction
+
+    :param model: The translation model
+    :type model: type
+
+    :param foreign_key: The name of the foreign key to the content object
+    :type foreign_key: str
+
+    :param batch: The key and the pruned revision ids of each translation
+    :type batch: list [ tuple ]
+
+    :param dry_run: Whether the revisions should only be counted instead of deleted
+    :type dry_run: bool
+
+    :return: The approximate size of the pruned content in bytes
+    :rtype: int
+    """
+    pruned_ids = [revision_id for _, pruned in batch for revision_id in pruned]
+    if not pruned_ids:
+        return 0
+    size = get_content_size(model.objects.filter(id__in=pruned_ids))
+    if not dry_run:
+        with transaction.atomic():
+            for key, pruned in batch:
+                prune_translation_revisions(model, foreign_key, key, pruned)
+    return size
+
+
+def prune_revisions(model, foreign_key, region=None, dry_run=False):
+    """
+    Prune the revisions of one translation model according to the retention policy
+
+    :param model: The translation model
+    :type model: type
+
+    :param foreign_key: The name of the foreign key to the content object
+    :type foreign_key: str
+
+    :param region: If given, only the revisions of this region are pruned
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :param dry_run: Whether the revisions should only be counted instead of deleted
+    :type dry_run: bool
+
+    :return: The number of pruned revisions and the approximate size of their content in bytes
+    :rtype: tuple [ int ]
+    """
+    retention_date = timezone.now() - timedelta(days=settings.REVISION_RETENTION_DAYS)
+    translations = model.objects.all()
+    if region:
+        translations = translations.filter(**{f"{foreign_key}__region": region})
+    # Load the metadata of all revisions at once and group them by their translation
+    grouped_revisions = groupby(
+        translations.order_by(
+            f"{foreign_key}_id", "language_id", "-version"
+        ).values_list(
+            f"{foreign_key}_id",
+            "language_id",
+            "id",
+            "status",
+            "minor_edit",
+            "last_updated",
+        ),
+        key=itemgetter(0, 1),
+    )
+    pruned_count = 0
+    reclaimed_size = 0
+    batch = []
+    for key, rows in grouped_revisions:
+        revisions = {
+            revision_id: (revision_status, minor_edit, last_updated)
+            for _, _, revision_id, revision_status, minor_edit, last_updated in rows
+        }
+        pruned = get_pruned_revisions(revisions, retention_date)
+        if not pruned:
+            continue
+        batch.append((key, pruned))
+        pruned_count += len(pruned)
+        if sum(len(pruned) for _, pruned in batch) >= PRUNING_BATCH_SIZE:
+            reclaimed_size += prune_batch(model, foreign_key, batch, dry_run)
+            batch = []
+    reclaimed_size += prune_batch(model, foreign_key, batch, dry_run)
+    logger.info(
+        "Pruned %r revisions of %r (%r bytes)",
+        pruned_count,
+        model.__name__,
+        reclaimed_size,
+    )
+    return pruned_count, reclaimed_size
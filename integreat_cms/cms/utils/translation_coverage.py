@@ -0,0 +1,167 @@
+"""
+This module contains helpers to calculate the translation coverage of a region with grouped aggregate queries.
+
+The results are cached per region (see :attr:`~integreat_cms.core.settings.TRANSLATION_COVERAGE_CACHE_TIMEOUT`) and
+invalidated whenever the pages, the page translations or the language tree of the region change (see
+:mod:`~integreat_cms.cms.signals`).
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from ..constants import translation_status
+from ..models import PageTranslation
+
+logger = logging.getLogger(__name__)
+
+#: The key of the number of words of all outdated translations in the coverage of a language
+OUTDATED_WORDS = "OUTDATED_WORDS"
+#: How many word counts are written to the database in one query
+WORD_COUNT_BATCH_SIZE = 1000
+
+
+def get_cache_key(region):
+    """
+    Get the cache key of the translation coverage of a region
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: The cache key
+    :rtype: str
+    """
+    return f"translation-coverage-{region.id}"
+
+
+def invalidate_translation_coverage(region):
+    """
+    Remove the cached translation coverage of a region
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+    """
+    cache.delete(get_cache_key(region))
+    logger.debug("Invalidated the translation coverage of %r", region)
+
+
+def materialize_translation_states(region):
+    """
+    Store the outdated states (see
+    :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.update_outdated_states`) and the word counts
+    of all page translations of a region which are not materialized yet (e.g. because they were created before these
+    fields existed).
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+    """
+    PageTranslation.update_outdated_states(region)
+    translations = list(
+        PageTranslation.objects.filter(
+            page__region=region, word_count__isnull=True
+        ).only("id", "text")
+    )
+    for translation in translations:
+        translation.word_count = len(translation.text.split())
+    PageTranslation.objects.bulk_update(
+        translations, ["word_count"], batch_size=WORD_COUNT_BATCH_SIZE
+    )
+
+
+def aggregate_translation_states(region):
+    """
+    Count the latest page translations of a region per language and state with one grouped query
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: The aggregated states indexed by the language id
+    :rtype: dict
+    """
+    latest_translations = (
+        PageTranslation.objects.filter(page__region=region)
+        .order_by("page_id", "language_id", "-version")
+        .distinct("page_id", "language_id")
+        .values("id")
+    )
+    outdated = Q(currently_in_translation=False, materialized_outdated=True)
+    return {
+        states["language_id"]: states
+        for states in PageTranslation.objects.filter(id__in=latest_translations)
+        .order_by()
+        .values("language_id")
+        .annotate(
+            total=Count("id"),
+            in_translation=Count("id", filter=Q(currently_in_translation=True)),
+            outdated=Count("id", filter=outdated),
+            outdated_words=Coalesce(Sum("word_count", filter=outdated), 0),
+            unmaterialized=Count(
+                "id",
+                filter=Q(materialized_outdated__isnull=True)
+                | Q(word_count__isnull=True),
+            ),
+        )
+    }
+
+
+def calculate_translation_coverage(region):
+    """
+    Calculate the translation coverage of a region with a constant number of queries
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: The number of translations in each state (choices: :mod:`~integreat_cms.cms.constants.translation_status`)
+             and the number of words of all outdated translations, indexed by the language id
+    :rtype: dict
+    """
+    states = aggregate_translation_states(region)
+    if any(language_states["unmaterialized"] for language_states in states.values()):
+        materialize_translation_states(region)
+        states = aggregate_translation_states(region)
+    total_number_pages = region.pages.count()
+    coverage = {}
+    for language_id in region.language_tree_nodes.values_list("language_id", flat=True):
+        language_states = states.get(
+            language_id,
+            {"total": 0, "in_translation": 0, "outdated": 0, "outdated_words": 0},
+        )
+        coverage[language_id] = {
+            # The number of pages which do not have a translation in this language
+            translation_status.MISSING: total_number_pages - language_states["total"],
+            # The number of translations which are outdated
+            translation_status.OUTDATED: language_states["outdated"],
+            # The number of translations which are currently being translated
+            translation_status.IN_TRANSLATION: language_states["in_translation"],
+            # The number of up-to-date translations (neither missing, nor currently in translation, nor outdated)
+            translation_status.UP_TO_DATE: (
+                language_states["total"]
+                - language_states["in_translation"]
+                - language_states["outdated"]
+            ),
+            # The number of words in the outdated translations
+            OUTDATED_WORDS: language_states["outdated_words"],
+        }
+    return coverage
+
+
+def get_translation_coverage(region):
+    """
+    Get the translation coverage of a region from the cache or calculate it if it is not cached
+    (see :func:`calculate_translation_coverage`)
+
+    :param region: The region
+    :type region: ~integreat_cms.cms.models.regions.region.Region
+
+    :return: The translation coverage indexed by the language id
+    :rtype: dict
+    """
+    cache_key = get_cache_key(region)
+    coverage = cache.get(cache_key)
+    if coverage is None:
+        coverage = calculate_translation_coverage(region)
+        cache.set(cache_key, coverage, settings.TRANSLATION_COVERAGE_CACHE_TIMEOUT)
+        logger.debug("Calculated the translation coverage of %r", region)
+    return coverage
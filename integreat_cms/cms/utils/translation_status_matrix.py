@@ -0,0 +1,115 @@
+"""
+This module contains a matrix of the translation states of all pages of a region in all its languages which is loaded
+with a constant number of queries.
+It is used by the page tree (see :class:`~integreat_cms.cms.views.pages.page_tree_view.PageTreeView`) to avoid
+querying the translation of each page in each language separately.
+"""
+import logging
+
+from ..constants import translation_status
+from ..models import PageTranslation
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationStatusMatrix:
+    """
+    In-memory representation of the translation status of all pages of a region in all languages.
+
+    On initialization, the matrix loads whether the latest revision of each page in each language is currently in
+    translation together with its materialized outdated state (see
+    :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.update_outdated_states`).
+    Only if some of the states are not materialized yet, all states of the region are calculated with
+    :meth:`~integreat_cms.cms.models.pages.page_translation.PageTranslation.calculate_outdated_states`.
+
+    Afterwards, the status of each cell is computed from memory with the same rules as
+    :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.is_outdated`.
+    """
+
+    def __init__(self, region, pages=None):
+        """
+        Load the translation states of the given region.
+
+        :param region: The region whose pages should be loaded
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param pages: If given, only the translation states of these pages are loaded
+        :type pages: list [ ~integreat_cms.cms.models.pages.page.Page ]
+        """
+        self.region = region
+        translations = PageTranslation.objects.filter(page__region=region)
+        if pages is not None:
+            translations = translations.filter(page__in=pages)
+        # Whether the latest revision of each page in each language is currently in translation
+        self._in_translation = {}
+        # The materialized outdated state of the latest revision of each page in each language
+        self._outdated = {}
+        for page_id, language_id, currently_in_translation, outdated in (
+            translations.order_by("page_id", "language_id", "-version")
+            .distinct("page_id", "language_id")
+            .values_list(
+                "page_id",
+                "language_id",
+                "currently_in_translation",
+                "materialized_outdated",
+            )
+        ):
+            self._in_translation[page_id, language_id] = currently_in_translation
+            self._outdated[page_id, language_id] = outdated
+        if None in self._outdated.values():
+            self._outdated = PageTranslation.calculate_outdated_states(region, pages)
+        logger.debug(
+            "Loaded %r translation states of %r", len(self._in_translation), region
+        )
+
+    def is_outdated(self, page_id, language_id):
+        """
+        Check whether the latest revision of the given page in the given language is outdated.
+        This is the in-memory equivalent of
+        :attr:`~integreat_cms.cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.is_outdated`.
+
+        :param page_id: The id of the requested page
+        :type page_id: int
+
+        :param language_id: The id of the requested language
+        :type language_id: int
+
+        :return: Flag to indicate whether the translation is outdated
+        :rtype: bool
+        """
+        key = (page_id, language_id)
+        # Missing translations and translations which are currently being translated are not outdated
+        if key not in self._in_translation or self._in_translation[key]:
+            return False
+        return self._outdated[key]
+
+    def get_status(self, page, language):
+        """
+        Get the translation status of the given page in the given language
+
+        :param page: The requested page
+        :type page: ~integreat_cms.cms.models.pages.page.Page
+
+        :param language: The requested language
+        :type language: ~integreat_cms.cms.models.languages.language.Language
+
+        :return: The translation status (choices: :mod:`~integreat_cms.cms.constants.translation_status`)
+        :rtype: str
+        """
+        key = (page.id, language.id)
+        if key not in self._in_translation:
+            return translation_status.MISSING
+        if self._in_translation[key]:
+            return translation_status.IN_TRANSLATION
+        if self.is_outdated(*key):
+            return translation_status.OUTDATED
+        return translation_status.UP_TO_DATE
+
+    def __repr__(self):
+        """
+        The canonical string representation of the matrix
+
+        :return: The canonical string representation of the matrix
+        :rtype: str
+        """
+        return f"<TranslationStatusMatrix (region: {self.region.slug}, translations: {len(self._in_translation)})>"
@@ -6,8 +6,9 @@ from django.views.generic import TemplateView
 from django.shortcuts import render
 
 from ...constants import translation_status
-from ...models import PageTranslation, Region
+from ...models import Region
 from ...decorators import region_permission_required
+from ...utils.translation_coverage import OUTDATED_WORDS, get_translation_coverage
 
 logger = logging.getLogger(__name__)
 
@@ -45,61 +46,23 @@ class TranslationCoverageView(TemplateView):
         """
 
         region = Region.get_current_region(request)
-
-        total_number_pages = region.pages.count()
-
-        translation_coverage_data = []
-        outdated_word_count = {}
-
-        for language in region.languages:
-            # Get all page translation of this region and language
-            page_translations = PageTranslation.get_translations(region, language)
-
-            # Get the QuerySet of translations which are currently not in translation (so either up-to-date or outdated)
-            currently_not_in_translation = page_translations.filter(
-                currently_in_translation=False
-            )
-            # Get a list of translations which are outdated
-            outdated_page_translations = [
-                translation
-                for translation in currently_not_in_translation
-                if translation.is_outdated
-            ]
-            # Count the words in the outdated translations
-            outdated_word_count[language] = sum(
-                len(translation.text.split())
-                for translation in outdated_page_translations
-            )
-            # Count the outdated translations
-            outdated_count = len(outdated_page_translations)
-            # Append the translation coverage data for this language
-            translation_coverage_data.append(
-                {
-                    # The number of pages which do not have a translation in this language
-                    translation_status.MISSING: (
-                        total_number_pages - page_translations.count()
-                    ),
-                    # The number of translations which are outdated
-                    translation_status.OUTDATED: outdated_count,
-                    # The number of translations which are currently being translated
-                    translation_status.IN_TRANSLATION: (
-                        page_translations.count() - currently_not_in_translation.count()
-                    ),
-                    # The number of up-to-date translations (neither missing, nor currently in translation, nor outdated)
-                    translation_status.UP_TO_DATE: (
-                        currently_not_in_translation.count() - outdated_count
-                    ),
-                }
-            )
-            logger.debug(
-                "Coverage data for %r: %r", language, translation_coverage_data[-1]
-            )
+        languages = list(region.languages)
+
+        # Get the number of page translations in each state and the number of outdated words for each language
+        translation_coverage = get_translation_coverage(region)
+        translation_coverage_data = [
+            translation_coverage[language.id] for language in languages
+        ]
+        outdated_word_count = {
+            language: translation_coverage[language.id][OUTDATED_WORDS]
+            for language in languages
+        }
 
         logger.debug("Outdated word count: %r", outdated_word_count)
 
         # Assemble the ChartData in the format expected by ChartJS (one dataset for each translation status)
         chart_data = {
-            "labels": [language.translated_name for language in region.languages],
+            "labels": [language.translated_name for language in languages],
             "datasets": [
                 {
                     "label": label,
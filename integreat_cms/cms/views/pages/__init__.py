@@ -10,6 +10,8 @@ from .page_actions import (
     delete_page,
     expand_page_translation_id,
     export_pdf,
+    export_pdf_status,
+    download_pdf,
     download_xliff,
     upload_xliff,
     move_page,
@@ -17,6 +19,7 @@ from .page_actions import (
     revoke_page_permission_ajax,
     get_page_order_table_ajax,
     get_new_page_order_table_ajax,
+    get_page_tree_subpages_ajax,
     render_mirrored_page_field,
     post_translation_state_ajax,
 )
@@ -13,19 +13,30 @@ from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.http import HttpResponseNotFound, JsonResponse
+from django.http import (
+    Http404,
+    HttpResponseBadRequest,
+    HttpResponseNotFound,
+    JsonResponse,
+)
 from django.shortcuts import render, redirect, get_object_or_404, get_list_or_404
 from django.utils.translation import ugettext as _
 from django.views.decorators.http import require_POST
 
 from ....xliff.utils import pages_to_xliff_file
-from ...constants import text_directions
+from ...constants import pdf_export_status, text_directions
 from ...decorators import region_permission_required, permission_required
 from ...forms import PageForm
-from ...models import Page, Region, PageTranslation
+from ...models import Language, Page, Region, PageTranslation
 from ...utils.file_utils import extract_zip_archive
-from ...utils.pdf_utils import generate_pdf
+from ...utils.pdf_export_queue import (
+    get_pdf_job_response,
+    get_pdf_job_status,
+    submit_pdf_job,
+)
 from ...utils.translation_utils import ugettext_many_lazy as __
+from .page_context_mixin import PageContextMixin
+from .page_tree_view import PageTreeView
 
 logger = logging.getLogger(__name__)
 
@@ -238,11 +249,13 @@ def delete_page(request, page_id, region_slug, language_slug):
 @login_required
 @region_permission_required
 @permission_required("cms.view_page")
-# pylint: disable=unused-argument
 def export_pdf(request, region_slug, language_slug):
     """
     Function for handling a pdf export request for pages.
-    The pages get extracted from request.GET attribute and the request is forwarded to :func:`~integreat_cms.cms.utils.pdf_utils.generate_pdf`
+    The pages get extracted from request.GET attribute and the request is forwarded to
+    :func:`~integreat_cms.cms.utils.pdf_export_queue.submit_pdf_job`.
+    If the document is not rendered yet, the user is redirected to the status of the export job (see
+    :func:`export_pdf_status`).
 
     :param request: Request submitted for rendering pdf document
     :type request: ~django.http.HttpRequest
@@ -253,7 +266,7 @@ def export_pdf(request, region_slug, language_slug):
     :param language_slug: bcp47 slug of the current language
     :type language_slug: str
 
-    :return: PDF document offered for download
+    :return: PDF document offered for download or a redirect to the status of the export job
     :rtype: ~django.http.HttpResponse
     """
     region = Region.get_current_region(request)
@@ -261,13 +274,92 @@ def export_pdf(request, region_slug, language_slug):
     page_ids = request.POST.getlist("selected_ids[]")
     # collect the corresponding page objects
     pages = region.pages.filter(explicitly_archived=False, id__in=page_ids)
-    # generate PDF document wrapped in a HtmlResponse object
-    response = generate_pdf(region, language_slug, pages)
-    if response.status_code == 200:
-        # offer PDF document for download
-        response["Content-Disposition"] = (
-            response["Content-Disposition"] + "; attachment"
-        )
+    # submit the job to render the PDF document
+    job_id = submit_pdf_job(region, language_slug, pages)
+    if not job_id:
+        return HttpResponseBadRequest(_("No valid pages selected for PDF generation."))
+    if get_pdf_job_status(job_id) == pdf_export_status.FINISHED:
+        return download_pdf(request, region_slug, language_slug, job_id)
+    return redirect(
+        "export_pdf_status",
+        region_slug=region_slug,
+        language_slug=language_slug,
+        job_id=job_id,
+    )
+
+
+@login_required
+@region_permission_required
+@permission_required("cms.view_page")
+# pylint: disable=unused-argument
+def export_pdf_status(request, region_slug, language_slug, job_id):
+    """
+    Show the status of a pdf export job.
+    The status page reloads itself until the job is finished and then starts the download of the document.
+
+    :param request: The current request
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: unique region slug
+    :type region_slug: str
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :param job_id: The id of the pdf export job
+    :type job_id: str
+
+    :raises ~django.http.Http404: If the job does not exist
+
+    :return: The rendered status page
+    :rtype: ~django.template.response.TemplateResponse
+    """
+    job_status = get_pdf_job_status(job_id)
+    if not job_status:
+        raise Http404("No PDF export job matches the given query.")
+    return render(
+        request,
+        "pages/page_pdf_export_status.html",
+        {
+            "current_menu_item": "pages",
+            "region": Region.get_current_region(request),
+            "language": get_object_or_404(Language, slug=language_slug),
+            "job_id": job_id,
+            "job_status": job_status,
+            "PDF_EXPORT_STATUS": pdf_export_status,
+        },
+    )
+
+
+@login_required
+@region_permission_required
+@permission_required("cms.view_page")
+# pylint: disable=unused-argument
+def download_pdf(request, region_slug, language_slug, job_id):
+    """
+    Download the document of a finished pdf export job
+
+    :param request: The current request
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: unique region slug
+    :type region_slug: str
+
+    :param language_slug: bcp47 slug of the current language
+    :type language_slug: str
+
+    :param job_id: The id of the pdf export job
+    :type job_id: str
+
+    :raises ~django.http.Http404: If the job does not exist or is not finished
+
+    :return: PDF document offered for download
+    :rtype: ~django.http.FileResponse
+    """
+    # offer PDF document for download
+    response = get_pdf_job_response(job_id, as_attachment=True)
+    if not response:
+        raise Http404("No finished PDF export job matches the given query.")
     return response
 
 
@@ -285,9 +377,10 @@ def expand_page_translation_id(request, short_url_id):
     :rtype: ~django.http.HttpResponseRedirect
     """
 
-    page_translation = PageTranslation.objects.get(
-        id=short_url_id
-    ).latest_public_revision
+    # Revisions which were deleted by the retention policy cannot be resolved anymore
+    page_translation = PageTranslation.objects.filter(id=short_url_id).first()
+    if page_translation:
+        page_translation = page_translation.latest_public_revision
 
     if page_translation and not page_translation.page.archived:
         return redirect(settings.WEBAPP_URL + page_translation.get_absolute_url())
@@ -885,6 +978,50 @@ def get_new_page_order_table_ajax(request, region_slug, parent_id):
     )
 
 
+@login_required
+@region_permission_required
+@permission_required("cms.view_page")
+# pylint: disable=unused-argument
+def get_page_tree_subpages_ajax(request, region_slug, language_slug, page_id):
+    """
+    Retrieve the rows of the non-archived children of a page in the page tree.
+    This is used in the page tree to load the subpages of a page when it is expanded for the first time.
+
+    :param request: The current request
+    :type request: ~django.http.HttpResponse
+
+    :param region_slug: The slug of the current region
+    :type region_slug: str
+
+    :param language_slug: The slug of the current language
+    :type language_slug: str
+
+    :param page_id: The id of the page whose subpages should be returned
+    :type page_id: int
+
+    :return: The rendered rows of the subpages
+    :rtype: ~django.template.response.TemplateResponse
+    """
+
+    region = Region.get_current_region(request)
+    language = get_object_or_404(Language, slug=language_slug)
+    page = get_object_or_404(region.pages, id=page_id, explicitly_archived=False)
+    subpages = page.get_children().filter(explicitly_archived=False)
+
+    logger.debug("Subpages of %r in the page tree: %r", page, subpages)
+
+    return render(
+        request,
+        "pages/_page_tree_subpages.html",
+        {
+            **PageContextMixin.extra_context,
+            **PageTreeView.get_page_tree_context(region, language, subpages),
+            "enable_drag_and_drop": True,
+            "load_subpages": True,
+        },
+    )
+
+
 @login_required
 @region_permission_required
 @permission_required("cms.view_page")
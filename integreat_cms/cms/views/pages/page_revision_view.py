@@ -10,7 +10,7 @@ from django.views.generic import TemplateView
 
 from ...constants import status
 from ...decorators import region_permission_required, permission_required
-from ...models import Region, Language
+from ...models import Region, Language, PageTranslation
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +99,10 @@ class PageRevisionView(TemplateView):
             {
                 **self.base_context,
                 "page": page,
-                "page_translations": page_translations,
+                # Rebuild the texts of compressed revisions (see PageTranslation.compress_revisions)
+                "page_translations": PageTranslation.decompress_revisions(
+                    page_translations
+                ),
                 "api_revision": page_translations.filter(status=status.PUBLIC).first(),
                 "selected_revision": selected_revision.first(),
                 "language": language,
@@ -151,6 +154,14 @@ class PageRevisionView(TemplateView):
                 f"{request.user!r} does not have the permission to restore {revision!r} of {page!r}"
             )
 
+        if revision.text_delta is not None:
+            # Rebuild the text of the compressed revision from the newer revisions
+            revision = PageTranslation.decompress_revisions(
+                page.translations.filter(
+                    language=language, version__gte=revision.version
+                )
+            )[-1]
+
         current_revision = page.get_translation(language.slug)
 
         if (
@@ -199,7 +210,9 @@ class PageRevisionView(TemplateView):
             {
                 **self.base_context,
                 "page": page,
-                "page_translations": page_translations,
+                "page_translations": PageTranslation.decompress_revisions(
+                    page_translations
+                ),
                 "api_revision": page_translations.filter(status=status.PUBLIC).first(),
                 "selected_revision": revision,
                 "language": language,
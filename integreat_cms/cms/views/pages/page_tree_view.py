@@ -12,6 +12,7 @@ from ...constants import translation_status, status
 from ...decorators import region_permission_required, permission_required
 from ...forms import PageFilterForm
 from ...models import Region, Language, Page, PageTranslation
+from ...utils.translation_status_matrix import TranslationStatusMatrix
 from .page_context_mixin import PageContextMixin
 
 logger = logging.getLogger(__name__)
@@ -99,6 +100,8 @@ class PageTreeView(TemplateView, PageContextMixin):
         pages = region.get_pages(archived=self.archived)
         enable_drag_and_drop = True
         query = None
+        # Whether only the root pages are rendered and their subpages are loaded on demand
+        load_subpages = not self.archived
         # Filter pages according to given filters, if any
         filter_data = kwargs.get("filter_data")
         if filter_data:
@@ -107,6 +110,7 @@ class PageTreeView(TemplateView, PageContextMixin):
             if filter_form.is_valid():
                 query = filter_form.cleaned_data["query"]
                 if query:
+                    load_subpages = False
                     page_translation_ids = set(
                         page_translation.page.pk
                         for page_translation in PageTranslation.search(
@@ -119,6 +123,9 @@ class PageTreeView(TemplateView, PageContextMixin):
                 # only filter if at least one checkbox but not all are checked
                 if 0 < len(selected_status) < len(translation_status.CHOICES):
                     enable_drag_and_drop = False
+                    load_subpages = False
+                    # Resolve the translation states of all pages in all languages at once
+                    translation_status_matrix = TranslationStatusMatrix(region)
 
                     def page_filter(page):
                         """
@@ -130,14 +137,10 @@ class PageTreeView(TemplateView, PageContextMixin):
                         :return: Whether or not the page should be filtered based on its translation status
                         :rtype: bool
                         """
-                        translation = page.get_translation(language_slug)
-                        if not translation:
-                            return translation_status.MISSING in selected_status
-                        if translation.currently_in_translation:
-                            return translation_status.IN_TRANSLATION in selected_status
-                        if translation.is_outdated:
-                            return translation_status.OUTDATED in selected_status
-                        return translation_status.UP_TO_DATE in selected_status
+                        return (
+                            translation_status_matrix.get_status(page, language)
+                            in selected_status
+                        )
 
                     pages = map(lambda p: p.id, list(filter(page_filter, pages)))
                     pages = Page.objects.filter(id__in=pages).order_by()
@@ -145,24 +148,60 @@ class PageTreeView(TemplateView, PageContextMixin):
             filter_form = PageFilterForm()
             filter_form.changed_data.clear()
 
+        if load_subpages:
+            # Only render the root pages, their subpages are fetched when they are expanded
+            pages = region.pages.filter(level=0, explicitly_archived=False)
+
         return render(
             request,
             self.template_name,
             {
                 **context,
+                **self.get_page_tree_context(region, language, pages),
                 "current_menu_item": "pages",
-                "pages": pages,
                 "archived_count": region.get_pages(archived=True).count(),
-                "language": language,
-                "languages": region.languages,
                 "filter_form": filter_form,
                 "enable_drag_and_drop": enable_drag_and_drop,
+                "load_subpages": load_subpages,
                 "search_query": query,
-                "PUBLIC": status.PUBLIC,
-                "WEBAPP_URL": settings.WEBAPP_URL,
             },
         )
 
+    @staticmethod
+    def get_page_tree_context(region, language, pages):
+        """
+        Get the context which is required to render the rows of the given pages in the page tree
+
+        :param region: The current region
+        :type region: ~integreat_cms.cms.models.regions.region.Region
+
+        :param language: The current language
+        :type language: ~integreat_cms.cms.models.languages.language.Language
+
+        :param pages: The pages which are rendered
+        :type pages: ~mptt.querysets.TreeQuerySet [ ~integreat_cms.cms.models.pages.page.Page ]
+
+        :return: The context of the page tree rows
+        :rtype: dict
+        """
+        pages = list(pages)
+        # Only resolve the translation states and the descendant counts of the rendered pages
+        translation_status_matrix = TranslationStatusMatrix(region, pages)
+        descendant_counts = region.get_non_archived_descendant_counts(pages)
+        for page in pages:
+            page.descendant_count = descendant_counts[page.id]
+        return {
+            "pages": pages,
+            "language": language,
+            "languages": region.languages,
+            "translation_status_matrix": translation_status_matrix,
+            "PUBLIC": status.PUBLIC,
+            "MISSING": translation_status.MISSING,
+            "IN_TRANSLATION": translation_status.IN_TRANSLATION,
+            "OUTDATED": translation_status.OUTDATED,
+            "WEBAPP_URL": settings.WEBAPP_URL,
+        }
+
     def post(self, request, *args, **kwargs):
         """
         Apply page filters and render page tree
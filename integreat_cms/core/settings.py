@@ -15,6 +15,7 @@ For production use, the following settings can be set with environment variables
     * ``DJANGO_STATIC_ROOT``: :attr:`~integreat_cms.core.settings.STATIC_ROOT`
     * ``DJANGO_MEDIA_ROOT``: :attr:`~integreat_cms.core.settings.MEDIA_ROOT`
     * ``DJANGO_XLIFF_ROOT``: :attr:`~integreat_cms.core.settings.XLIFF_ROOT`
+    * ``DJANGO_PDF_STORE_ROOT``: :attr:`~integreat_cms.core.settings.PDF_STORE_ROOT`
 
 Database settings: :attr:`~integreat_cms.core.settings.DATABASES`
 
@@ -96,9 +97,74 @@ RSS_FEED_URLS = {
 #: How many days of chat history should be shown
 AUTHOR_CHAT_HISTORY_DAYS = 30
 
+#: How long the cached translation coverage of a region is valid (in seconds).
+#: The cache is invalidated automatically when the pages of a region change
+#: (see :mod:`~integreat_cms.cms.utils.translation_coverage`).
+TRANSLATION_COVERAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
 #: The time span up to which recurrent events should be returned by the api
 API_EVENTS_MAX_TIME_SPAN_DAYS = 31
 
+#: How many days beyond :attr:`~integreat_cms.core.settings.API_EVENTS_MAX_TIME_SPAN_DAYS` the occurrences of recurring
+#: events are precomputed, so the api stays complete if the daily update of the occurrences is delayed
+#: (see :class:`~integreat_cms.cms.models.events.event_occurrence.EventOccurrence`)
+EVENT_OCCURRENCES_BUFFER_DAYS = 7
+
+#: How long cached responses of the content api endpoints are valid (in seconds).
+#: Cached responses are invalidated automatically when the content of a region changes
+#: (see :mod:`~integreat_cms.api.cache`).
+API_CACHE_TIMEOUT = 60 * 60 * 24
+
+if "DJANGO_API_STREAMING_RESPONSES" in os.environ:
+    API_STREAMING_RESPONSES = bool(os.environ["DJANGO_API_STREAMING_RESPONSES"])
+else:
+    #: Whether the list endpoints of the content api should serialize their results lazily into a streaming response.
+    #: This bounds the memory usage for large regions, but disables the api response cache for these endpoints.
+    API_STREAMING_RESPONSES = False
+
+#: How many objects are fetched from the database at once when iterating the content of a region in the api
+API_STREAMING_CHUNK_SIZE = 100
+
+if "DJANGO_PAGE_REVISION_COMPRESSION" in os.environ:
+    PAGE_REVISION_COMPRESSION = bool(os.environ["DJANGO_PAGE_REVISION_COMPRESSION"])
+else:
+    #: Whether old page revisions should only store a compressed delta to the next newer revision instead of their
+    #: full text (see :mod:`~integreat_cms.cms.utils.revision_delta`). The latest revision and the latest public
+    #: revision of each page translation always keep their full text.
+    PAGE_REVISION_COMPRESSION = False
+
+if "DJANGO_REVISION_RETENTION_DAYS" in os.environ:
+    REVISION_RETENTION_DAYS = int(os.environ["DJANGO_REVISION_RETENTION_DAYS"])
+else:
+    #: The number of days in which all revisions of pages, events and locations are kept by the ``prune_revisions``
+    #: management command. Older revisions are thinned out to one revision per week, the latest revision and all public
+    #: and major revisions are always kept (see :mod:`~integreat_cms.cms.utils.revision_retention`).
+    REVISION_RETENTION_DAYS = 90
+
+if "DJANGO_PDF_EXPORT_WORKERS" in os.environ:
+    PDF_EXPORT_WORKERS = int(os.environ["DJANGO_PDF_EXPORT_WORKERS"])
+else:
+    #: The number of worker processes which render PDF documents in the background (see
+    #: :mod:`~integreat_cms.cms.utils.pdf_export_queue`). If set to ``0``, the documents are rendered synchronously in
+    #: the request thread.
+    PDF_EXPORT_WORKERS = 2
+
+#: The number of seconds after which a pending PDF export job is considered lost (e.g. because the process was
+#: restarted) and can be submitted again
+PDF_EXPORT_TIMEOUT = 600
+
+if "DJANGO_PDF_PREWARM_CONCURRENCY" in os.environ:
+    PDF_PREWARM_CONCURRENCY = int(os.environ["DJANGO_PDF_PREWARM_CONCURRENCY"])
+else:
+    #: The number of regions whose PDF documents are pre-warmed at the same time by each process after pages were
+    #: published (see :mod:`~integreat_cms.cms.utils.pdf_prewarm`). If set to ``0``, the documents are not pre-warmed
+    #: after publication, but only by the ``warm_pdf_exports`` management command.
+    PDF_PREWARM_CONCURRENCY = 1
+
+#: The number of seconds to wait after the last publication in a region before its PDF documents are pre-warmed (the
+#: publications are debounced in each process separately)
+PDF_PREWARM_DELAY = 30
+
 ###############################
 # Firebase Push Notifications #
 ###############################
@@ -162,6 +228,7 @@ else:
 INSTALLED_APPS = [
     # Installed custom apps
     "integreat_cms.cms",
+    "integreat_cms.api",
     "integreat_cms.gvz_api",
     # Installed Django apps
     "django.contrib.auth",
@@ -691,7 +758,8 @@ LEGACY_FILE_UPLOAD = False
 
 #: Configuration for caches (see :setting:`django:CACHES` and :doc:`django:topics/cache`).
 #: Use a ``LocMemCache`` for development and a ``RedisCache`` whenever available.
-#: Additionally, a ``FileBasedCache`` is used for PDF caching.
+#: Additionally, a ``FileBasedCache`` is used for the rendered fragments of PDF documents. The status of PDF export jobs
+#: is kept in the default cache and the finished PDF documents are stored separately (see :attr:`PDF_STORE_ROOT`).
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -734,6 +802,19 @@ CACHEOPS = {
 #: Degrade gracefully on redis fail
 CACHEOPS_DEGRADE_ON_FAILURE = True
 
+if "DJANGO_PDF_STORE_ROOT" in os.environ:
+    PDF_STORE_ROOT = os.environ["DJANGO_PDF_STORE_ROOT"]
+else:
+    #: The directory where the rendered PDF documents are stored (see :mod:`~integreat_cms.cms.utils.pdf_store`)
+    PDF_STORE_ROOT = os.path.join(BASE_DIR, "cache/pdf-documents")
+
+if "DJANGO_PDF_STORE_MAX_SIZE" in os.environ:
+    PDF_STORE_MAX_SIZE = int(os.environ["DJANGO_PDF_STORE_MAX_SIZE"])
+else:
+    #: The maximum total size of the stored PDF documents in bytes. When a new document would exceed this limit, the
+    #: least recently used documents are evicted.
+    PDF_STORE_MAX_SIZE = 1024 ** 3
+
 
 ##############
 # PAGINATION #
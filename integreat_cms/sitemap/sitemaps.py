@@ -16,6 +16,7 @@ from ..cms.models import (
     OfferTemplate,
 )
 from ..cms.constants import status
+from ..cms.utils.alternate_translations import prefetch_alternate_translations
 
 logger = logging.getLogger(__name__)
 
@@ -100,11 +101,23 @@ class WebappSitemap(ABC, Sitemap):
         splitted_url = urlsplit(settings.WEBAPP_URL)
         # Generate list of urls without alternative languages
         urls = super()._urls(page, splitted_url.scheme, splitted_url.hostname)
+        self.prefetch_alternates([url["item"] for url in urls])
         for url in urls:
             # Add information about alternative languages
             url["alternates"] = self.sitemap_alternates(url["item"])
         return urls
 
+    # pylint: disable=no-self-use
+    def prefetch_alternates(self, items):
+        """
+        This function resolves the alternative languages of all items of this sitemap at once (see
+        :func:`~integreat_cms.cms.utils.alternate_translations.prefetch_alternate_translations`).
+
+        :param items: The translations contained in this sitemap
+        :type items: list
+        """
+        prefetch_alternate_translations(items)
+
     # pylint: disable=no-self-use
     def sitemap_alternates(self, obj):
         """
@@ -147,7 +160,7 @@ class PageSitemap(WebappSitemap):
         super().__init__(region, language)
         # Filter queryset based on region and language
         self.queryset = self.queryset.filter(
-            page__in=self.region.get_pages(return_unrestricted_queryset=True),
+            page__in=self.region.get_pages(),
             language=self.language,
         )
 
@@ -261,6 +274,14 @@ class OfferSitemap(WebappSitemap):
             [self.region.slug, self.language.slug, "offers", item.slug]
         )
 
+    def prefetch_alternates(self, items):
+        """
+        The alternatives of offers do not depend on translations, so there is nothing to prefetch.
+
+        :param items: Objects passed from items() method
+        :type items: list [ ~integreat_cms.cms.models.offers.offer_template.OfferTemplate ]
+        """
+
     def sitemap_alternates(self, obj):
         """
         This sitemap_alternates function returns the language alternatives of offers for the use in sitemaps.
@@ -36,7 +36,8 @@ window.addEventListener("load", () => {
   const selectAllCheckbox = document.getElementById("bulk-select-all");
   const bulkAction = document.getElementById("bulk-action") as HTMLSelectElement;
   const bulkActionForm = document.getElementById("bulk-action-form");
-  const selectItems = Array.from(document.getElementsByClassName("bulk-select-item"));
+  // Query the items on demand, because rows might be added after the page is loaded (e.g. in the page tree)
+  const getSelectItems = () => Array.from(document.getElementsByClassName("bulk-select-item"));
   const bulkActionButton = document.getElementById(
     "bulk-action-execute"
   ) as HTMLButtonElement;
@@ -44,7 +45,7 @@ window.addEventListener("load", () => {
   if (selectAllCheckbox && isInputElement(selectAllCheckbox)) {
     selectAllCheckbox.addEventListener("click", () => {
       const value = selectAllCheckbox.checked;
-      selectItems
+      getSelectItems()
         .filter(isInputElement)
         .forEach((checkbox) => (checkbox.checked = value));
       toggleBulkActionButton();
@@ -59,8 +60,10 @@ window.addEventListener("load", () => {
     bulkActionForm.addEventListener("submit", bulkActionExecute);
   }
 
-  selectItems.forEach((el) => {
-    el.addEventListener("change", toggleBulkActionButton);
+  document.addEventListener("change", (event: Event) => {
+    if ((event.target as HTMLElement).classList.contains("bulk-select-item")) {
+      toggleBulkActionButton();
+    }
   });
 
   function toggleBulkActionButton() {
@@ -68,7 +71,7 @@ window.addEventListener("load", () => {
     // also check if at least one page translation exists for PDF export before activation
     let selectedAction = bulkAction.options[bulkAction.selectedIndex];
     if (
-      !selectItems
+      !getSelectItems()
         .filter(isInputElement)
         .some((el) => el.checked) ||
       bulkAction.selectedIndex === 0 ||
@@ -98,7 +101,7 @@ window.addEventListener("load", () => {
   function hasTranslation(): boolean {
     // checks if at least one of the selected pages has a translation for the current language
     let languageSlug = document.getElementById("pdf-export-option").dataset.languageSlug;
-    return selectItems
+    return getSelectItems()
       .filter(isInputElement)
       .filter(inputElement => inputElement.checked)
       .some(inputElement => {
@@ -1,5 +1,7 @@
-window.addEventListener("load", () => {
-  document.querySelectorAll("[data-copy-to-clipboard]").forEach((node) => {
+window.addEventListener("load", () => addCopyToClipboardListeners(document));
+
+export function addCopyToClipboardListeners(root: ParentNode) {
+  root.querySelectorAll("[data-copy-to-clipboard]").forEach((node) => {
     node.addEventListener("click", ({ currentTarget }) => {
       const value = (currentTarget as HTMLElement).getAttribute(
         "data-copy-to-clipboard"
@@ -7,7 +9,7 @@ window.addEventListener("load", () => {
       copyToClipboard(value);
     });
   });
-});
+}
 
 
 export function copyToClipboard(value: string){
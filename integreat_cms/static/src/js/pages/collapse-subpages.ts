@@ -1,25 +1,42 @@
 import feather from "feather-icons";
+import { refreshAjaxConfirmationHandlers } from "../confirmation-popups";
+import { addCopyToClipboardListeners } from "../copy-clipboard";
+import { addDragAndDropListeners } from "../tree-drag-and-drop";
 
 /*
  * The functionality to toggle subpages
  */
 
-window.addEventListener("load", () => {
-  // event handler to hide and show subpages
-  document
+window.addEventListener("load", () => addCollapseListeners(document));
+
+/*
+ * This function adds the event handler to hide and show subpages to all pages within the given root element
+ */
+function addCollapseListeners(root: ParentNode) {
+  root
     .querySelectorAll(".collapse-subpages")
     .forEach((el) => el.addEventListener("click", toggleSubpages));
-});
+}
 
 /*
  * This function toggles all subpages of the clicked page and changes the icon
  */
-function toggleSubpages(event: Event) {
+async function toggleSubpages(event: Event) {
   event.preventDefault();
   // Get span with all data options
   const collapseSpan = (event.target as HTMLElement).closest("span");
-  // Toggle subpages
-  toggleSubpagesRecursive(collapseSpan);
+  const subpagesUrl = collapseSpan.getAttribute("data-subpages-url");
+  if (subpagesUrl) {
+    // Load the subpages when the page is expanded for the first time
+    collapseSpan.removeAttribute("data-subpages-url");
+    if (!(await loadSubpages(collapseSpan, subpagesUrl))) {
+      collapseSpan.setAttribute("data-subpages-url", subpagesUrl);
+      return;
+    }
+  } else {
+    // Toggle subpages
+    toggleSubpagesRecursive(collapseSpan);
+  }
   // Change icon
   let icon = collapseSpan.querySelector("svg");
   if (icon.classList.contains("feather-chevron-down")) {
@@ -31,6 +48,33 @@ function toggleSubpages(event: Event) {
   feather.replace({ class: 'inline-block' });
 }
 
+/*
+ * This function fetches the rows of the direct children of a page and inserts them below the page's row.
+ * It returns whether the subpages were loaded successfully.
+ */
+async function loadSubpages(collapseSpan: HTMLElement, subpagesUrl: string): Promise<boolean> {
+  const response = await fetch(subpagesUrl);
+  if (!response.ok) {
+    console.error("Subpages could not be loaded:", response.statusText);
+    return false;
+  }
+  // Parse the rows within a table to make sure they are not discarded by the parser
+  const tbody = new DOMParser()
+    .parseFromString(`<table><tbody>${await response.text()}</tbody></table>`, "text/html")
+    .querySelector("tbody");
+  // Add the event listeners which are usually added when the page is loaded
+  addCollapseListeners(tbody);
+  addDragAndDropListeners(tbody);
+  addCopyToClipboardListeners(tbody);
+  // Insert the rows below the row of the page
+  const row = document.getElementById("page-" + collapseSpan.getAttribute("data-page-id"));
+  Array.from(tbody.children).reverse().forEach((child) => {
+    row.parentNode.insertBefore(child, row.nextSibling);
+  });
+  refreshAjaxConfirmationHandlers();
+  return true;
+}
+
 /*
  * This function iterates over all direct children of a page and
  * toggles their "hidden" class if they are not yet collapsed.
@@ -38,14 +82,13 @@ function toggleSubpages(event: Event) {
  * all previously collapsed subpages will remain collapsed.
  */
 function toggleSubpagesRecursive(collapseSpan: HTMLElement) {
-  // Get children of page
-  const children: number[] = JSON.parse(
-    collapseSpan.getAttribute("data-page-children")
+  // Get the table rows of the children of the page
+  const children = document.querySelectorAll(
+    `tr[data-parent-id="${collapseSpan.getAttribute("data-page-id")}"]`
   );
   // Foreach child: toggle class "hidden" and proceed for all children which are not explicitly hidden themselves
-  children.forEach((childId) => {
-    // Get child table row
-    const child = document.getElementById("page-" + childId);
+  children.forEach((child) => {
+    const childId = child.id.replace("page-", "");
     // Hide/show table row
     child.classList.toggle("hidden");
     // Remove the left sibling from possible drop targets while it is collapsed
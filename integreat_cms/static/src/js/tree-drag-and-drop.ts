@@ -5,34 +5,40 @@
 
 import { off, on } from "./utils/wrapped-events";
 
-window.addEventListener("load", () => {
+window.addEventListener("load", () => addDragAndDropListeners(document));
+
+/*
+ * This function adds the drag & drop event listeners to all nodes within the given root element.
+ * It is also used for the rows of subpages which are loaded on demand (see pages/collapse-subpages.ts).
+ */
+export function addDragAndDropListeners(root: ParentNode) {
 
   // Only activate event listeners if explicitly enabled
   if (!document.querySelector("[data-activate-tree-drag-drop]")) return;
 
   // event handler for starting drag events
-  document.querySelectorAll(".drag").forEach((node) => {
+  root.querySelectorAll(".drag").forEach((node) => {
     (node as HTMLElement).addEventListener("dragstart", dragstart);
   });
 
   // event handler for stopping drag events
-  document.querySelectorAll(".drag").forEach(function (node) {
+  root.querySelectorAll(".drag").forEach(function (node) {
     on(node, "dragend", dragend);
   });
 
   // event handler for dragleave events
-  document.querySelectorAll(".drop").forEach((node) => {
+  root.querySelectorAll(".drop").forEach((node) => {
     node.addEventListener("dragleave", dragleave);
   });
 
   // event handler for drop events
-  document.querySelectorAll(".drop").forEach((node) => {
+  root.querySelectorAll(".drop").forEach((node) => {
     node.addEventListener("drop", (e: Event) => {
       e.preventDefault();
       drop(e as DragEvent);
     });
   });
-});
+}
 
 /*
  * This function handles the start of a dragging event
@@ -45,15 +51,16 @@ function dragstart(event: DragEvent) {
   // prepare the dragged node id for data transfer
   event.dataTransfer.setData("text", target.getAttribute("data-drag-id"));
   window.setTimeout(() => changeDom(target));
-  // get descendants of dragged node
-  const descendants = JSON.parse(
-      target.getAttribute("data-node-descendants")
-  ) as number[];
+  // get the range of the dragged node's subtree
+  const tree_id = target.getAttribute("data-tree-id");
+  const lft = parseInt(target.getAttribute("data-lft"));
+  const rght = parseInt(target.getAttribute("data-rght"));
   // add event listeners for hovering over drop regions
   document.querySelectorAll(".drop").forEach((node) => {
-    // get target node id of the hovered drop region
-    const drop_id = parseInt(node.getAttribute("data-drop-id"));
-    if (descendants.includes(drop_id)) {
+    // get the position of the target node of the hovered drop region
+    const drop_tree_id = node.getAttribute("data-drop-tree-id");
+    const drop_lft = parseInt(node.getAttribute("data-drop-lft"));
+    if (drop_tree_id === tree_id && lft <= drop_lft && drop_lft <= rght) {
       // if the target node is a descendant of the dragged node, disallow dropping it
       on(node, "dragover", dropDisallow);
     } else {